@@ -64,8 +64,35 @@
 # (2021-10-27) Vers. 1.13
 #  Support for FPPx32 FPGA Configuration Files 
 #
+# (2026-10-18) Vers. 1.14
+#  * Content-addressed build cache for the bootloader executables 
+#  * Incremental u-boot build mode without "make distclean"
+#  * Adaptive u-boot build parallelism, build report and command line options
+#  * The EDS tools are started directly with a cached environment of the EDS shell
+#  * Commands are executed with argument lists, exit codes and timeouts instead of fixed delays
+#  * Stage scheduler to run independent generation steps in parallel ("--batch" mode)
+#  * Streaming, resumable and verified download and extraction of the linaro toolchain 
+#  * The linaro toolchain is installed once per user and linked by all Quartus projects 
+#  * "u-boot-socfpga" is cloned from a shared bare mirror into every Quartus project 
+#  * "u-boot-socfpga" can be pinned to a commit; a failed pull does not stop the script
+#  * "LinuxBootImageFileGenerator" is only updated by its update policy or the command "update"
+#  * Import without side effects; GitPython and "LinuxBootImageFileGenerator" are loaded when required
+#  * The Quartus project files are found with a single scan and a cached project index 
+#  * The "hps.xml" file is read incrementally and its device descriptor is cached 
+#  * The BSP generation and the qts-filter only run if their inputs were changed
+#  * Compiler cache (ccache) for the u-boot build
+#  * u-boot is built inside an own output folder for every device and configuration
+#  * Only the u-boot make targets used by the generator are built (progress and time per target)
+#  * An installed ARM cross compiler (e.g. distro package or Yocto SDK) is used instead of the linaro download 
+#  * The BootROM image of the Arria 10 is generated without "mkpimage" of the EDS shell; command "check-sfp"
+#  * Build cache for the FPGA configuration files ("quartus_cpf" only runs for a new ".sof"-file or new options)
+#  * All FPGA configuration variants of a ".sof"-file can be generated in parallel (GenerateFPGAconfVariants)
+#  * The FIT image of the Arria 10 FPGA configuration is written without "mkimage" of u-boot
+#  * The u-boot script is compiled without "mkimage" and only if it was changed
+#  * Build cache for the compiled Linux devicetrees (".dtb") with hit rate report
+#
 
-version = "1.13"
+version = "1.14"
 
 #
 #
@@ -75,11 +102,15 @@ version = "1.13"
 #
 #
 
-DELAY_MS = 1 # Delay after critical tasks in milliseconds 
+CMD_TIMEOUT_S             = 10*60  # Default timeout of external commands in seconds
+UBOOT_BUILD_TIMEOUT_S     = 60*60  # Timeout of a single make call of the u-boot build in seconds
+DOWNLOAD_TIMEOUT_S        = 60     # Timeout of a stalled download in seconds
+IMPORT_TIME_BUDGET_MS     = 100    # Maximum time to import this module with a new interpreter (command "import-time")
 
 QURTUS_DEF_FOLDER         = "intelFPGA"
 QURTUS_DEF_FOLDER_LITE    = "intelFPGA_lite"
 EDS_EMBSHELL_DIR          = "/embedded/embedded_command_shell.sh"
+EDS_CACHE_FILE_NAME       = 'eds_installation.json' # Cached EDS installation folder and environment
 BOOTLOADER_FILE_NAME      = 'u-boot-with-spl.sfp'
 
 # Arria 10 only
@@ -88,6 +119,35 @@ SFP_OUTPUT_FILE_NAME    ='spl_w_dtb-mkpimage.bin'
 SFP_INPUT_FILE_NAME     ='u-boot-spl-dtb.bin'
 FIT_FPGA_FILE_NAME      ='fit_spl_fpga.itb'
 
+# Flattened devicetree (FDT) blob of FIT images 
+FDT_MAGIC                 = 0xD00DFEED
+FDT_BEGIN_NODE            = 0x1
+FDT_END_NODE              = 0x2
+FDT_PROP                  = 0x3
+FDT_END                   = 0x9
+FIT_DATA_ALIGN            = 4 # Alignment of the data outside of the FIT structure ("mkimage -E")
+
+# u-boot script and its compiled legacy u-boot image (format of "mkimage -T script")
+UBOOT_SCRIPT_FILE_NAME    = 'boot.script'
+UBOOT_SCRIPT_OUTPUT_NAME  = 'boot.scr'
+UBOOT_SCRIPT_IMAGE_NAME   = 'u-boot'    # Image name ("mkimage -n" of LinuxBootImageFileGenerator)
+UIMAGE_MAGIC              = 0x27051956
+UIMAGE_HEADER_SIZE        = 64
+UIMAGE_OS_LINUX           = 5
+UIMAGE_TYPE_SCRIPT        = 6
+UIMAGE_COMP_NONE          = 0
+# Architecture IDs of the legacy u-boot image ("ubootscript" value of the partition -> ID)
+uimage_arch_dict = {'arm': 2, 'arm64': 22}
+
+# BootROM image of the SPL (format of "mkpimage"): 4 copies of the SPL with a header and a CRC
+BOOTROM_VALIDATION_WORD   = 0x31305341 # "AS01"
+BOOTROM_HEADER_OFFSET     = 0x40       # Position of the header inside the SPL
+BOOTROM_V1_ENTRY_OFFSET   = 0x14       # Entry point of the SPL relative to the header (only header v1)
+BOOTROM_IMAGE_COPIES      = 4
+#                          Header v0   | Header v1
+bootrom_image_size_list = [0x10000,     0x40000]   # Size of one copy 
+bootrom_header_size_list = [12,         20]
+
 YOCTO_BASE_FOLDER         = 'poky'
 
 IMAGE_FOLDER_NAME         = 'Image_partitions'
@@ -96,8 +156,45 @@ GITNAME                   = "socfpgaplatformgenerator"
 GIT_SCRIPT_URL            = "https://github.com/robseb/socfpgaPlatformGenerator.git"
 GIT_U_BOOT_SOCFPGA_URL    = "https://github.com/altera-opensource/u-boot-socfpga"
 GIT_U_BOOT_SOCFPGA_BRANCH = "rel_socfpga_v2020.10_21.06.02_pr" # "socfpga_v2021.04" # default: master --> Arria 10 SX and Cyclone working: "socfpga_v2020.04"
+# Exact commit of "u-boot-socfpga" to use ('': latest commit of the branch; pulled with every build)
+#  If the commit is checked out git is not started and no network connection is required  
+GIT_U_BOOT_SOCFPGA_COMMIT = ""
 
 GIT_LINUXBOOTIMAGEGEN_URL = "https://github.com/robseb/LinuxBootImageFileGenerator.git"
+# Update policy of "LinuxBootImageFileGenerator" 
+#  Pinned commit ('': no pinned commit) 
+GIT_LINUXBOOTIMAGEGEN_COMMIT = ""
+#  Pull it if the last update is older than the time in seconds (0: only with the command "update")
+LINUXBOOTIMAGEGEN_UPDATE_TTL_S = 0
+
+# Build cache shared by all Quartus projects of the user (default: "~/.cache/socfpgaplatformgenerator")
+# The location can be changed with the environment variable "SOCFPGA_CACHE_DIR"
+CACHE_DIR_ENV_NAME        = 'SOCFPGA_CACHE_DIR'
+BOOTLOADER_CACHE_FOLDER   = 'bootloader'
+FPGA_CONF_CACHE_FOLDER    = 'fpga_conf' # FPGA configuration files (keyed by the ".sof"-file and the options)
+DTB_CACHE_FOLDER          = 'dtb'       # Compiled devicetrees (keyed by the ".dts"-file, its includes and dtc)
+TOOLCHAIN_CACHE_FOLDER    = 'toolchain' # Toolchain store; the "toolchain" folder of a project links to it
+TOOLCHAIN_HOST_FILE_PREFIX = 'host_'    # Installed cross compiler of a host ("host_<host name>.json")
+GIT_MIRROR_CACHE_FOLDER   = 'git'       # Bare mirrors of git repositories used by all projects
+UBOOT_MIRROR_NAME         = 'u-boot-socfpga.git'
+PROJECT_INDEX_CACHE_FOLDER = 'projects' # Index of the artifacts of every Quartus project
+CCACHE_CACHE_FOLDER       = 'ccache'    # Default compiler cache of the u-boot builds of all projects
+
+# Settings of the "hps.xml" handoff file used by the generator (device descriptor)
+HPS_XML_CONFIG_KEYS       = ['DEVICE_FAMILY', 'chosen.early-release-fpga-config']
+# Device descriptor inside the folder of the project index: "device_<hash of the hps.xml directory>.json"
+#  (keyed by the SHA-256 of the "hps.xml"-file)
+HPS_DEVICE_FILE_PREFIX    = 'device_'
+
+# Output folders of the u-boot builds ("software/bootloader/build/<device>_<defconfig>_<config hash>")
+UBOOT_BUILD_FOLDER        = 'build'
+UBOOT_CURRENT_BUILD_NAME  = 'current' # Link to the output folder of the last build
+
+# Record of the defconfig used for the ".config" file (incremental u-boot builds)
+UBOOT_CONFIG_STAMP_FILE_NAME = '.socfpga_defconfig.json'
+# Record of the inputs of the last BSP generation ("software/bootloader") and qts-filter run ("u-boot-socfpga")
+BSP_STAMP_FILE_NAME        = '.socfpga_bsp.json'
+QTS_FILTER_STAMP_FILE_NAME = '.socfpga_qts_filter.json'
 
 # The Linux devicetree names required for bootloader generation
 DEVICETREE_OUTPUT_NAME = ['socfpga_cyclone5_socdk.dts','', \
@@ -155,6 +252,20 @@ preloader_deviceTree_name = ['','','socfpga_arria10_socdk_sdmmc.dtb']
 #        Cyclone V    |  Arria V     | Arria 10 
 generate_sfp_image_file = [True,True,False]
 
+#
+# Header version of the BootROM image (Cyclone V and Arria V: 0, Arria 10: 1)
+#                                Cyclone V    |  Arria V     | Arria 10 
+bootrom_header_version_list = [0, 0, 1]
+
+#
+# u-boot make targets used by the generator: [make target, output file (inside the output folder)] 
+# (The SPL make target builds all SPL outputs)
+#                                Cyclone V    |  Arria V     | Arria 10 
+u_boot_make_target_list = [[[BOOTLOADER_FILE_NAME, BOOTLOADER_FILE_NAME]], \
+                    [[BOOTLOADER_FILE_NAME, BOOTLOADER_FILE_NAME]], \
+                    [[U_BOOT_IMAGE_FILE_NAME, U_BOOT_IMAGE_FILE_NAME], \
+                        ['spl/u-boot-spl.bin', 'spl/'+SFP_INPUT_FILE_NAME]]]
+
 #
 # "u-boot-socfpga deconfig" file name for make (u-boot-socfpga/configs/)
 #                                Cyclone V    |  Arria V     | Arria 10 
@@ -171,10 +282,24 @@ linaro_url_list = ['https://releases.linaro.org/components/toolchain/binaries/7.
         'https://releases.linaro.org/components/toolchain/binaries/7.5-2019.12/arm-linux-gnueabihf/'\
     'gcc-linaro-7.5.0-2019.12-x86_64_arm-linux-gnueabihf.tar.xz']
 
+# SHA-256 checksum of the linaro archive files (required: an archive without a checksum is not installed)
+#  Set the checksum published for the archive of "linaro_url_list" 
 #                                Cyclone V    |  Arria V     | Arria 10 
-gcc_toolchain_path_list= ['gcc-linaro-7.5.0-2019.12-x86_64_arm-linux-gnueabihf/bin/:$PATH', \
-                'gcc-linaro-7.5.0-2019.12-x86_64_arm-linux-gnueabihf/bin/:$PATH', \
-                    'gcc-linaro-7.5.0-2019.12-x86_64_arm-linux-gnueabihf/bin/:$PATH']
+linaro_sha256_list = ['', '', '']
+
+#                                Cyclone V    |  Arria V     | Arria 10 
+gcc_toolchain_path_list= ['gcc-linaro-7.5.0-2019.12-x86_64_arm-linux-gnueabihf/bin', \
+                'gcc-linaro-7.5.0-2019.12-x86_64_arm-linux-gnueabihf/bin', \
+                    'gcc-linaro-7.5.0-2019.12-x86_64_arm-linux-gnueabihf/bin']
+
+#
+# Installed ARM cross compilers that are used instead of the linaro toolchain
+#  Prefixes (CROSS_COMPILE) of the compilers searched inside PATH and the folders (glob) of Yocto SDKs
+host_toolchain_prefix_list = ['arm-linux-gnueabihf-', 'arm-none-linux-gnueabihf-', 'arm-linux-gnueabi-', \
+                    'arm-poky-linux-gnueabi-']
+host_toolchain_glob_list = ['/opt/poky/*/sysroots/*/usr/bin/arm-*linux-gnueabi*', \
+                    '/opt/*/sysroots/*/usr/bin/arm-*linux-gnueabi*']
+HOST_TOOLCHAIN_MIN_GCC_VERSION = 6 # Oldest GCC major version that can build "u-boot-socfpga"
 #
 # 
 #
@@ -187,64 +312,99 @@ gcc_toolchain_path_list= ['gcc-linaro-7.5.0-2019.12-x86_64_arm-linux-gnueabihf/b
 #
 #
 import sys
-
-if sys.platform =='linux':
-    try:
-        import git
-        from git import RemoteProgress
-        import wget
-
-    except ImportError as ex:
-        print('Msg: '+str(ex))
-        print('This Python Application requirers "git"')
-        print('Use following pip command to install it:')
-        print('$ pip3 install GitPython wget')
-        sys.exit()
-    
-
-if sys.platform =='linux':
-    # @brief to show process bar during github clone
-    #
-    #
-    class CloneProgress(RemoteProgress):
-        def update(self, op_code, cur_count, max_count=None, message=''):
-            if message:
-                sys.stdout.write("\033[F")
-                print("    "+message)
-
 import os
 import time
 import io
 import re
 import shutil
+import filecmp
 import subprocess
+import signal
+import threading
+import fcntl
 import xml.etree.ElementTree as ET
 from typing import NamedTuple
 import math
 import glob
+import hashlib
+import json
+import tempfile
+import struct
+import zlib
 from pathlib import Path
 from datetime import datetime
 from datetime import timedelta
 import mmap
 
-try:
-    from LinuxBootImageFileGenerator.LinuxBootImageGenerator import Partition,BootImageCreator
-except ModuleNotFoundError as ex:
-    print('--> Cloning "LinuxBootImageFileGenerator" from GitHub')
-    print('       please wait...')
+# Modules loaded by the stages that require them (import without side effects)
+git = None               # GitPython 
+Partition = None         # LinuxBootImageFileGenerator.LinuxBootImageGenerator.Partition
+BootImageCreator = None  # LinuxBootImageFileGenerator.LinuxBootImageGenerator.BootImageCreator
+
+#
+# @brief Load GitPython 
+# @return                      success
+#
+def loadGit():
+    global git
+    if git is None:
+        try:
+            import git as git_module
+        except ImportError as ex:
+            print('Msg: '+str(ex))
+            print('This Python Application requirers "git"')
+            print('Use following pip command to install it:')
+            print('$ pip3 install GitPython')
+            return False
+        git = git_module
+    return True
+
+#
+# @brief Give a progress bar for a github clone
+# @return                      Progress object (git.RemoteProgress)
+#
+def giveCloneProgress():
+    class CloneProgress(git.RemoteProgress):
+        def update(self, op_code, cur_count, max_count=None, message=''):
+            if message:
+                sys.stdout.write("\033[F")
+                print("    "+message)
+    return CloneProgress()
+
+#
+# @brief Load "LinuxBootImageFileGenerator" (Partition, BootImageCreator). It is cloned from 
+#        GitHub in case it is not available and updated according to its update policy
+# @return                      success
+#
+def loadLinuxBootImageGenerator():
+    global Partition, BootImageCreator
+    if Partition is not None:
+        return True
+    if not os.path.isdir(os.getcwd()+'/LinuxBootImageFileGenerator'):
+        print('--> Cloning "LinuxBootImageFileGenerator" from GitHub')
+        print('       please wait...')
+        if not loadGit():
+            return False
+        try:
+            git.Repo.clone_from(GIT_LINUXBOOTIMAGEGEN_URL, os.getcwd()+'/LinuxBootImageFileGenerator', \
+                branch='master', progress=giveCloneProgress())
+        except Exception as ex:
+            print('ERROR: The cloning failed! Error Msg.:'+str(ex))
+            print('       Check your network connection and try it again')
+            return False
+    else:
+        # Only with a pinned commit or an update interval (otherwise no network access)
+        updateLinuxBootImageGenerator()
 
     try:
-        git.Repo.clone_from(GIT_LINUXBOOTIMAGEGEN_URL, os.getcwd()+'/LinuxBootImageFileGenerator', branch='master', progress=CloneProgress())
+        from LinuxBootImageFileGenerator.LinuxBootImageGenerator import Partition as partition_class
+        from LinuxBootImageFileGenerator.LinuxBootImageGenerator import BootImageCreator as creator_class
     except Exception as ex:
-        print('ERROR: The cloning failed! Error Msg.:'+str(ex))
-        sys.exit()
-
-    if not os.path.isabs(os.getcwd()+'/LinuxBootImageFileGenerator'):
-        print('ERROR: Failed to clone "LinuxBootImageFileGenerator"')
-        print('       Check your network connection and try it again')
-        sys.exit()
-    
-    from LinuxBootImageFileGenerator.LinuxBootImageGenerator import Partition,BootImageCreator
+        print('ERROR: Failed to load "LinuxBootImageFileGenerator" MSG:'+str(ex))
+        return False
+    Partition = partition_class
+    BootImageCreator = creator_class
+    return True
 
 
 #
@@ -399,6 +559,1282 @@ def printSelectionTable(headline=[], headline_table=[], raw1=[], raw2=[],
     
     return 1        
 
+#
+# @brief Give the directory of the build cache that is shared by all Quartus projects of the user
+#        The location can be changed with the environment variable "SOCFPGA_CACHE_DIR"
+# @param sub_folder            Name of the cache sub folder 
+# @return                      Directory of the cache (sub) folder 
+#
+def giveCacheDir(sub_folder=''):
+    cache_dir = os.environ.get(CACHE_DIR_ENV_NAME,'')
+    if cache_dir == '':
+        cache_dir = os.path.join(os.path.expanduser('~'),'.cache',GITNAME)
+    if not sub_folder == '':
+        cache_dir = cache_dir+'/'+sub_folder
+    os.makedirs(cache_dir,exist_ok=True)
+    return cache_dir
+
+#
+# @brief Give the modification time of a file or folder 
+# @param file_dir              Directory of the file or folder
+# @return                      Modification time in ns (-1: not available)
+#
+def giveMtime(file_dir):
+    try:
+        return os.stat(file_dir).st_mtime_ns
+    except Exception:
+        return -1
+
+#
+# @brief Load a JSON cache or record file
+# @param file_dir              Directory of the JSON file
+# @return                      Content of the file ({} if the file is not available or not valid)
+#
+def loadJsonFile(file_dir):
+    try:
+        with open(file_dir) as f:
+            content = json.load(f)
+        if isinstance(content,dict):
+            return content
+    except Exception:
+        pass
+    return {}
+
+#
+# @brief Create a new temporary file next to a file to replace it atomically with "os.replace"
+#        (The name is unique for every process and thread)
+# @param file_dir              Directory of the file to replace
+# @return                      Directory of the temporary file
+#
+def giveTempFileDir(file_dir):
+    fd, temp_file_dir = tempfile.mkstemp(prefix=os.path.basename(file_dir)+'.tmp', \
+                            dir=os.path.dirname(os.path.abspath(file_dir)))
+    os.close(fd)
+    os.chmod(temp_file_dir,0o644)
+    return temp_file_dir
+
+#
+# @brief Write a JSON cache or record file atomically
+#        (Other processes see the old or the new file, but never a half written file) 
+# @param file_dir              Directory of the JSON file
+# @param content               Content (dictionary)
+# @return                      success
+#
+def storeJsonFile(file_dir, content):
+    temp_file_dir = ''
+    try:
+        temp_file_dir = giveTempFileDir(file_dir)
+        with open(temp_file_dir,'w') as f:
+            json.dump(content,f,indent=1)
+        os.replace(temp_file_dir,file_dir)
+    except Exception as ex:
+        print('WARNING: Failed to write the file "'+file_dir+'" MSG: '+str(ex))
+        if not temp_file_dir == '' and os.path.isfile(temp_file_dir):
+            os.remove(temp_file_dir)
+        return False
+    return True
+
+#
+# @brief Execute a command as its own process (without a shell), stream its output 
+#        to the console and capture it 
+# @param argv                  Command and its arguments (list)
+# @param cwd                   Working directory
+# @param env                   Environment (None: environment of this process)
+# @param timeout               Timeout in seconds (None: no timeout)
+# @param print_output          Stream the output of the command to the console
+# @return                      [Exit code (-1: not started or timeout), captured output (stdout and stderr)]
+#
+def runCommand(argv, cwd=None, env=None, timeout=CMD_TIMEOUT_S, print_output=True):
+    output = []
+    try:
+        # The command and all of its child processes (e.g. the jobs of "make -j") are a process group
+        process = subprocess.Popen(argv, cwd=cwd, env=env, stdin=subprocess.DEVNULL, \
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, start_new_session=True)
+    except Exception as ex:
+        print('ERROR: Failed to start "'+str(argv[0])+'" MSG:'+str(ex))
+        return [-1, '']
+
+    # Kill the entire process group: Child processes keep the output pipe open 
+    def killProcessGroup():
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+    # Kill the process group in case it exceeds the timeout
+    timed_out = []
+    watchdog = None
+    if timeout is not None:
+        watchdog = threading.Timer(timeout, lambda: (timed_out.append(True), killProcessGroup()))
+        watchdog.start()
+    try:
+        for line in iter(process.stdout.readline, b''):
+            line = line.decode('utf-8','replace')
+            output.append(line)
+            if print_output:
+                sys.stdout.write('    '+line)
+        process.wait()
+    except BaseException:
+        # The new session does not get the signals of the terminal (e.g. Ctrl+C)
+        killProcessGroup()
+        raise
+    finally:
+        if watchdog is not None:
+            watchdog.cancel()
+        process.stdout.close()
+
+    if len(timed_out) > 0:
+        print('ERROR: "'+str(argv[0])+'" was aborted after the timeout of '+str(timeout)+' seconds')
+        return [-1, ''.join(output)]
+    return [process.returncode, ''.join(output)]
+
+#
+# @brief File-like object that gives the bytes of a partial download (".part"-file) followed 
+#        by the bytes of the remaining download. Every byte is added to the SHA-256 checksum 
+#        and the new bytes are appended to the ".part"-file to allow to resume the download.
+#
+class DownloadStream(io.RawIOBase):
+    def __init__(self, part_file_dir, response, total_size=0):
+        self.part_file = open(part_file_dir,'rb')
+        self.append_file = None
+        if response is not None:
+            self.append_file = open(part_file_dir,'ab')
+        self.response = response
+        self.total_size = total_size
+        self.received = os.path.getsize(part_file_dir)
+        self.progress = -1
+        self.hasher = hashlib.sha256()
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = b''
+        if self.part_file is not None:
+            data = self.part_file.read(len(buffer))
+            if len(data) == 0:
+                self.part_file.close()
+                self.part_file = None
+        if len(data) == 0 and self.response is not None:
+            data = self.response.read(len(buffer))
+            if len(data) > 0:
+                self.append_file.write(data)
+                self.received += len(data)
+                self.printProgress()
+        self.hasher.update(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def printProgress(self):
+        if self.total_size > 0:
+            progress = int(self.received*10/self.total_size)
+            if not progress == self.progress:
+                self.progress = progress
+                print('    '+str(progress*10)+'% ('+str(self.received//(1024*1024))+' MB)')
+
+    def close(self):
+        if self.part_file is not None:
+            self.part_file.close()
+        if self.append_file is not None:
+            self.append_file.close()
+        super().close()
+
+#
+# @brief Download a ".tar.xz" archive file and extract it while the download is running.
+#        A partial download is resumed, the SHA-256 checksum is verified and the extracted
+#        folder is moved to the output folder only after a successful verification
+# @param url                   URL of the archive file 
+# @param output_dir            Directory of the folder to extract the archive to
+# @param folder_name           Name of the top folder inside the archive
+# @param sha256                Expected SHA-256 checksum (required)
+# @return                      success
+#
+def downloadExtractArchive(url, output_dir, folder_name, sha256):
+    import tarfile
+    import urllib.request
+    import urllib.error
+
+    if not re.fullmatch(r'[0-9a-f]{64}',sha256):
+        print('ERROR: No valid SHA-256 checksum for the download "'+url+'" is known!')
+        print('       The archive is only installed with the checksum of its publisher')
+        print('       Set the checksum with the value "linaro_sha256_list" inside the Python script!')
+        return False
+
+    part_file_dir = output_dir+'/'+folder_name+'.tar.xz.part'
+    # Use a complete archive of a previous version of this script 
+    if os.path.isfile(output_dir+'/'+folder_name+'.tar.xz') and not os.path.isfile(part_file_dir):
+        os.rename(output_dir+'/'+folder_name+'.tar.xz',part_file_dir)
+    if not os.path.isfile(part_file_dir):
+        open(part_file_dir,'wb').close()
+
+    # Resume the download behind the bytes of the ".part"-file
+    resume_pos = os.path.getsize(part_file_dir)
+    request = urllib.request.Request(url)
+    if resume_pos > 0:
+        print('    Resume the download at '+str(resume_pos//(1024*1024))+' MB')
+        request.add_header('Range','bytes='+str(resume_pos)+'-')
+    response = None
+    total_size = 0
+    try:
+        response = urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT_S)
+        if resume_pos > 0 and not response.status == 206:
+            # The server sends the entire file 
+            open(part_file_dir,'wb').close()
+            resume_pos = 0
+        total_size = resume_pos+int(response.headers.get('Content-Length',0))
+    except urllib.error.HTTPError as ex:
+        # 416: The ".part"-file contains already the entire file 
+        if not (ex.code == 416 and resume_pos > 0):
+            print('ERROR: Failed to download "'+url+'" MSG:'+str(ex))
+            return False
+    except Exception as ex:
+        print('ERROR: Failed to download "'+url+'" MSG:'+str(ex))
+        return False
+
+    extract_dir = tempfile.mkdtemp(prefix='.'+folder_name+'.', dir=output_dir)
+    stream = DownloadStream(part_file_dir, response, total_size)
+    try:
+        with tarfile.open(fileobj=stream, mode='r|xz') as tar:
+            if hasattr(tarfile,'data_filter'):
+                tar.extractall(extract_dir, filter='data')
+            else:
+                tar.extractall(extract_dir)
+        # Read the padding behind the end of the archive for the checksum 
+        while len(stream.read(1024*1024)) > 0:
+            pass
+    except Exception as ex:
+        print('ERROR: Failed to download and extract "'+url+'" MSG:'+str(ex))
+        print('       The download will be resumed with the next start')
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        return False
+    finally:
+        stream.close()
+        if response is not None:
+            response.close()
+
+    checksum = stream.hasher.hexdigest()
+    if not checksum == sha256:
+        print('ERROR: The SHA-256 checksum of the download "'+url+'" is wrong!')
+        print('       Expected: '+sha256)
+        print('       Received: '+checksum)
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        os.remove(part_file_dir)
+        return False
+    if not os.path.isdir(extract_dir+'/'+folder_name):
+        print('ERROR: The archive "'+url+'" contains not the folder "'+folder_name+'"!')
+        shutil.rmtree(extract_dir, ignore_errors=True)
+        return False
+    # Only a complete and verified folder is moved to its location
+    try:
+        os.rename(extract_dir+'/'+folder_name,output_dir+'/'+folder_name)
+    except Exception as ex:
+        print('ERROR: Failed to move the extracted folder "'+folder_name+'" MSG:'+str(ex))
+        return False
+    finally:
+        shutil.rmtree(extract_dir, ignore_errors=True)
+    os.remove(part_file_dir)
+    return True
+
+#
+# @brief Measure the time to import this module with a new Python interpreter 
+# @param runs                  Number of measurements
+# @return                      Median of the import time in ms; -1 in case of an error
+#
+def measureImportTime(runs=5):
+    module_name = os.path.splitext(os.path.basename(__file__))[0]
+    code = 'import time; start=time.perf_counter(); import '+module_name+ \
+            '; print((time.perf_counter()-start)*1000)'
+    import_times = []
+    for i in range(runs):
+        exit_code, output = runCommand([sys.executable,'-c',code], \
+            os.path.dirname(os.path.abspath(__file__)), None, 60, False)
+        if not exit_code == 0:
+            print('ERROR: Failed to import the module "'+module_name+'"')
+            print(output)
+            return -1
+        import_times.append(float(output.strip().splitlines()[-1]))
+    import_times.sort()
+    return import_times[len(import_times)//2]
+
+#
+# @brief Artifact of the Quartus project 
+#
+class ProjectArtifact(NamedTuple):
+    name  : str = ''  # Directory relative to the Quartus project folder ('': not found)
+    size  : int = 0   # Size in bytes
+    mtime : int = 0   # Modification time in ns
+
+#
+# @brief Index of the artifacts of a Quartus project 
+#
+class ProjectIndex(NamedTuple):
+    qpf          : ProjectArtifact = ProjectArtifact() # Quartus Prime project (".qpf")
+    sopcinfo     : ProjectArtifact = ProjectArtifact() # Platform Designer info (".sopcinfo")
+    sof          : ProjectArtifact = ProjectArtifact() # SRAM Object File (".sof")
+    qsys         : ProjectArtifact = ProjectArtifact() # Platform Designer (".qsys")
+    handoff_list : list = []                           # Folders inside the handoff folder ("*_handoff")
+    hps_xml      : ProjectArtifact = ProjectArtifact() # "hps.xml"-file inside the handoff folder
+    dir_mtimes   : dict = {}                           # Modification time of every scanned folder (ns)
+
+#
+# @brief Scan the Quartus project folder once for all artifacts 
+#        (The SOF file can also be inside the folder "output_files" or "output")
+# @param project_dir           Directory of the Quartus project folder 
+# @return                      Project index (ProjectIndex)
+#
+def scanQuartusProject(project_dir):
+    dir_mtimes = {}
+
+    # Read all entries of a folder with a single scan 
+    def scanFolder(folder):
+        dir_mtimes[folder] = giveMtime(project_dir+'/'+folder)
+        try:
+            with os.scandir(project_dir+'/'+folder) as it:
+                return sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return []
+
+    # Give the first file (or folder) of the entries matching the condition
+    def findArtifact(folder, entries, condition, find_dir=False):
+        for entry in entries:
+            if entry.is_dir() == find_dir and condition(entry.name):
+                stat = entry.stat()
+                return ProjectArtifact(folder+entry.name, stat.st_size, stat.st_mtime_ns)
+        return ProjectArtifact()
+
+    entries = scanFolder('')
+    qpf      = findArtifact('', entries, lambda name: name.endswith('.qpf'))
+    sopcinfo = findArtifact('', entries, lambda name: name.endswith('.sopcinfo'))
+    qsys     = findArtifact('', entries, lambda name: name.endswith('.qsys'))
+    sof      = findArtifact('', entries, lambda name: name.endswith('.sof'))
+    handoff  = findArtifact('', entries, lambda name: name.endswith('_handoff'), True)
+
+    if sof.name == '':
+        # Looking inside the "output_files" and "output" folders
+        sof_folder = ''
+        for folder in ['output_files/','output/']:
+            dir_mtimes[folder] = giveMtime(project_dir+'/'+folder)
+            if dir_mtimes[folder] >= 0:
+                sof_folder = folder
+        if not sof_folder == '':
+            sof = findArtifact(sof_folder, scanFolder(sof_folder), lambda name: name.endswith('.sof'))
+
+    handoff_list = []
+    hps_xml = ProjectArtifact()
+    if not handoff.name == '':
+        handoff_list = [handoff.name+'/'+entry.name for entry in scanFolder(handoff.name+'/') if entry.is_dir()]
+        if len(handoff_list) == 1:
+            hps_xml = findArtifact(handoff_list[0]+'/', scanFolder(handoff_list[0]+'/'), \
+                lambda name: name == 'hps.xml')
+
+    return ProjectIndex(qpf, sopcinfo, sof, qsys, handoff_list, hps_xml, dir_mtimes)
+
+#
+# @brief Give the index of the Quartus project. The index of the last run is used when
+#        none of the scanned folders was changed. 
+# @param project_dir           Directory of the Quartus project folder 
+# @return                      Project index (ProjectIndex)
+#
+def giveQuartusProjectIndex(project_dir):
+    index_file_dir = giveCacheDir(PROJECT_INDEX_CACHE_FOLDER)+'/'+ \
+                    hashlib.sha256(os.path.abspath(project_dir).encode('utf-8')).hexdigest()[:32]+'.json'
+    content = loadJsonFile(index_file_dir)
+    try:
+        if len(content.get('dir_mtimes',{})) > 0 and all(giveMtime(project_dir+'/'+folder) == mtime \
+                for folder, mtime in content['dir_mtimes'].items()):
+            # Update the size and modification time of the found artifacts 
+            artifacts = {}
+            for key in ['qpf','sopcinfo','sof','qsys','hps_xml']:
+                artifact = ProjectArtifact(*content[key])
+                if not artifact.name == '':
+                    stat = os.stat(project_dir+'/'+artifact.name)
+                    artifact = ProjectArtifact(artifact.name, stat.st_size, stat.st_mtime_ns)
+                artifacts[key] = artifact
+            return ProjectIndex(handoff_list=content['handoff_list'], dir_mtimes=content['dir_mtimes'], \
+                **artifacts)
+    except Exception:
+        pass
+
+    index = scanQuartusProject(project_dir)
+    storeJsonFile(index_file_dir, index._asdict())
+    return index
+
+#
+# @brief Give the device descriptor of a "hps.xml" handoff file: The values of the settings 
+#        HPS_XML_CONFIG_KEYS. The file is read incrementally until all settings are found.
+#        The descriptor is cached inside the folder of the project index (the folders of the 
+#        Quartus project are not changed). It is used without reading the file as long as the size  
+#        and modification time of the file are unchanged; otherwise the SHA-256 of the file decides. 
+# @param hps_xml_dir           Directory of the "hps.xml"-file
+# @return                      Descriptor (dictionary: setting name -> value); None in case of an error
+#
+def giveHpsDeviceDescriptor(hps_xml_dir):
+    descriptor_file_dir = giveCacheDir(PROJECT_INDEX_CACHE_FOLDER)+'/'+HPS_DEVICE_FILE_PREFIX+ \
+                    hashlib.sha256(os.path.abspath(hps_xml_dir).encode('utf-8')).hexdigest()[:32]+'.json'
+    try:
+        stat = os.stat(hps_xml_dir)
+    except OSError as ex:
+        print(' ERROR: Failed to read "hps.xml" file! Msg.: '+str(ex))
+        return None
+    content = loadJsonFile(descriptor_file_dir)
+    if content.get('keys') == HPS_XML_CONFIG_KEYS and 'config' in content:
+        if content.get('size') == stat.st_size and content.get('mtime') == stat.st_mtime_ns:
+            return content['config']
+    checksum = calcFingerprint([hps_xml_dir])
+    if content.get('sha256') == checksum and content.get('keys') == HPS_XML_CONFIG_KEYS:
+        # Only the modification time was changed 
+        content.update({'size': stat.st_size, 'mtime': stat.st_mtime_ns})
+        storeJsonFile(descriptor_file_dir, content)
+        return content['config']
+
+    config = {}
+    try:
+        for event, element in ET.iterparse(hps_xml_dir, events=('end',)):
+            if element.tag == 'config':
+                name = str(element.get('name'))
+                if name in HPS_XML_CONFIG_KEYS and not name in config:
+                    config[name] = str(element.get('value'))
+                    if len(config) == len(HPS_XML_CONFIG_KEYS):
+                        break
+            element.clear()
+    except Exception as ex:
+        print(' ERROR: Failed to parse "hps.xml" file!')
+        print(' Msg.: '+str(ex))
+        return None
+
+    storeJsonFile(descriptor_file_dir, {'sha256': checksum, 'size': stat.st_size, 'mtime': stat.st_mtime_ns, \
+        'keys': HPS_XML_CONFIG_KEYS, 'config': config})
+    return config
+
+#
+# @brief Copy the files of a folder to another folder. Only files with a changed content
+#        are copied to keep the modification time of unchanged files (for make).
+# @param source_dir            Directory of the source folder
+# @param dest_dir              Directory of the destination folder
+# @return                      List of the names of the copied files
+#
+def copyChangedFiles(source_dir, dest_dir):
+    changed_list = []
+    os.makedirs(dest_dir,exist_ok=True)
+    for name in sorted(os.listdir(source_dir)):
+        if not os.path.isfile(source_dir+'/'+name):
+            continue
+        if os.path.isfile(dest_dir+'/'+name) and \
+            filecmp.cmp(source_dir+'/'+name,dest_dir+'/'+name,shallow=False):
+            continue
+        shutil.copyfile(source_dir+'/'+name,dest_dir+'/'+name)
+        changed_list.append(name)
+    return changed_list
+
+#
+# @brief Calculate a SHA-256 fingerprint of files, folders and text items
+# @param path_list             List of file or folder directories 
+#                              (folders are scanned recursively in sorted order)
+# @param item_list             List of text items, such as versions or names 
+# @return                      Fingerprint as hex string
+#
+def calcFingerprint(path_list=[], item_list=[]):
+    sha = hashlib.sha256()
+    for item in item_list:
+        sha.update(bytes('I:'+str(item)+'\n','utf-8'))
+
+    for path in path_list:
+        if os.path.isdir(path):
+            file_list = []
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    file_list.append(os.path.join(root,name))
+        else:
+            file_list = [path]
+
+        for file in file_list:
+            if os.path.isdir(path):
+                name = os.path.relpath(file,path)
+            else:
+                name = os.path.basename(file)
+            if not os.path.isfile(file):
+                sha.update(bytes('M:'+name+'\n','utf-8'))
+                continue
+            sha.update(bytes('F:'+name+':'+str(os.path.getsize(file))+'\n','utf-8'))
+            with open(file,'rb') as f:
+                for chunk in iter(lambda: f.read(1024*1024), b''):
+                    sha.update(chunk)
+    return sha.hexdigest()
+
+#
+# @brief Read the commit ID of the checked out revision of a git repository
+#        without starting git 
+# @param repo_dir              Directory of the git repository (work tree)
+# @return                      Commit ID (SHA-1) or '' if it is not available
+#
+def readGitHeadCommit(repo_dir):
+    git_dir = repo_dir+'/.git'
+    try:
+        # Worktrees and submodules: The ".git" file points to the git folder
+        if os.path.isfile(git_dir):
+            with open(git_dir) as f:
+                line = f.read().strip()
+            if not line.startswith('gitdir:'):
+                return ''
+            git_dir = os.path.join(repo_dir,line[len('gitdir:'):].strip())
+
+        with open(git_dir+'/HEAD') as f:
+            head = f.read().strip()
+        if not head.startswith('ref:'):
+            # Detached HEAD
+            return head
+        ref = head[len('ref:'):].strip()
+
+        # Worktrees store the refs inside the common git folder
+        common_dir = git_dir
+        if os.path.isfile(git_dir+'/commondir'):
+            with open(git_dir+'/commondir') as f:
+                common_dir = os.path.join(git_dir,f.read().strip())
+
+        for ref_dir in [git_dir, common_dir]:
+            if os.path.isfile(ref_dir+'/'+ref):
+                with open(ref_dir+'/'+ref) as f:
+                    return f.read().strip()
+        if os.path.isfile(common_dir+'/packed-refs'):
+            with open(common_dir+'/packed-refs') as f:
+                for line in f:
+                    line = line.strip()
+                    if line.endswith(' '+ref):
+                        return line.split(' ')[0]
+    except Exception:
+        pass
+    return ''
+
+
+#
+# @brief Create or update a bare mirror of a git repository inside the cache folder.
+#        The mirror is locked during the update, because several projects can use it.
+#        Refs are never pruned and unreachable objects never expire, because clones 
+#        with "--shared" reference the objects of the mirror. 
+# @param url                   URL of the git repository
+# @param mirror_name           Folder name of the mirror  
+# @return                      Directory of the mirror; '' in case of an error
+#
+def updateGitMirror(url, mirror_name):
+    mirror_dir = giveCacheDir(GIT_MIRROR_CACHE_FOLDER)+'/'+mirror_name
+    if not loadGit():
+        return ''
+    try:
+        with open(mirror_dir+'.lock','w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            if not os.path.isdir(mirror_dir):
+                print('--> Create a mirror of "'+url+'" ('+mirror_dir+')')
+                print('       please wait...')
+                shutil.rmtree(mirror_dir+'.tmp', ignore_errors=True)
+                mirror = git.Repo.clone_from(url, mirror_dir+'.tmp', mirror=True, progress=giveCloneProgress())
+                mirror.git.config('gc.pruneExpire','never')
+                os.rename(mirror_dir+'.tmp',mirror_dir)
+            else:
+                print('--> Update the mirror of "'+url+'"')
+                git.Repo(mirror_dir).git.fetch('origin')
+    except Exception as ex:
+        print('ERROR: Failed to update the mirror of "'+url+'" MSG:'+str(ex))
+        return ''
+    return mirror_dir
+
+#
+# @brief Update "LinuxBootImageFileGenerator" according to its update policy: Check out the 
+#        pinned commit (GIT_LINUXBOOTIMAGEGEN_COMMIT) or pull it if the last update is older  
+#        than LINUXBOOTIMAGEGEN_UPDATE_TTL_S. Without a policy the network is not used.  
+# @param force                 Pull the latest version (command "update")
+# @return                      success
+#
+def updateLinuxBootImageGenerator(force=False):
+    repo_dir = os.getcwd()+'/LinuxBootImageFileGenerator'
+    if not loadGit():
+        return False
+    if not GIT_LINUXBOOTIMAGEGEN_COMMIT == '':
+        if readGitHeadCommit(repo_dir).startswith(GIT_LINUXBOOTIMAGEGEN_COMMIT):
+            return True
+        print('-> Check out the pinned "LinuxBootImageFileGenerator" commit "'+GIT_LINUXBOOTIMAGEGEN_COMMIT+'"')
+        try:
+            repo = git.Repo(repo_dir)
+            try:
+                repo.git.checkout(GIT_LINUXBOOTIMAGEGEN_COMMIT)
+            except Exception:
+                repo.git.fetch('origin')
+                repo.git.checkout(GIT_LINUXBOOTIMAGEGEN_COMMIT)
+        except Exception as ex:
+            print('ERROR: Failed to check out the pinned commit of "LinuxBootImageFileGenerator" MSG:'+str(ex))
+            return False
+        return True
+
+    if not force:
+        if LINUXBOOTIMAGEGEN_UPDATE_TTL_S <= 0:
+            return True
+        # Git writes "FETCH_HEAD" with every pull
+        last_update = giveMtime(repo_dir+'/.git/FETCH_HEAD')
+        if last_update >= 0 and time.time_ns()-last_update < LINUXBOOTIMAGEGEN_UPDATE_TTL_S*1000000000:
+            return True
+
+    print('-> Pull the latest "LinuxBootImageFileGenerator" Version from GitHub!')
+    try:
+        g = git.cmd.Git(repo_dir)
+        g.pull()
+    except Exception as ex:
+        print('WARNING: Failed to pull "LinuxBootImageFileGenerator" MSG:'+str(ex))
+        return False
+    return True
+
+#
+# @brief Check that a compiler is an ARM Linux cross compiler that can build u-boot
+# @param gcc_dir               Directory of the compiler ("<prefix>gcc")
+# @return                      [Target machine, GCC version] or None if the compiler is not suitable
+#
+def checkCrossCompiler(gcc_dir):
+    exit_code, machine = runCommand([gcc_dir,'-dumpmachine'], None, None, 30, False)
+    if not exit_code == 0:
+        return None
+    machine = machine.strip()
+    if not machine.startswith('arm') or not 'linux-gnueabi' in machine:
+        return None
+    exit_code, version = runCommand([gcc_dir,'-dumpversion'], None, None, 30, False)
+    version = version.strip()
+    try:
+        if not exit_code == 0 or int(version.split('.')[0]) < HOST_TOOLCHAIN_MIN_GCC_VERSION:
+            return None
+    except ValueError:
+        return None
+    return [machine, version]
+
+#
+# @brief Find an installed ARM cross compiler (e.g. a distro package or a Yocto SDK) that can be 
+#        used instead of the linaro toolchain. The result is cached per host and 
+#        only searched again if PATH or one of the searched folders was changed.  
+# @return                      Toolchain (dictionary: source, cross_compile, bin_dir, machine, version, id)
+#                              or {} if no suitable compiler is installed 
+#
+def resolveHostToolchain():
+    # Folders that change if a compiler is installed or removed  
+    search_dir_list = [item for item in os.environ.get('PATH','').split(os.pathsep) if not item == '']
+    for glob_pattern in host_toolchain_glob_list:
+        search_dir_list.append(glob_pattern.split('*')[0].rstrip('/'))
+    # (The order of PATH decides which compiler is found)
+    search_state = [[search_dir, giveMtime(search_dir)] for search_dir in search_dir_list]
+
+    cache_file_dir = giveCacheDir(TOOLCHAIN_CACHE_FOLDER)+'/'+TOOLCHAIN_HOST_FILE_PREFIX+ \
+                        os.uname().nodename+'.json'
+    cache = loadJsonFile(cache_file_dir)
+    toolchain = cache.get('toolchain',{})
+    if cache.get('search_state',None) == search_state and isinstance(toolchain,dict) and \
+            (toolchain == {} or giveMtime(toolchain.get('bin_dir','')+'/'+ \
+                toolchain.get('cross_compile','')+'gcc') == cache.get('gcc_mtime',-1)):
+        return toolchain
+
+    # Candidates: compilers inside PATH and inside the Yocto SDK folders 
+    candidate_list = []
+    for prefix in host_toolchain_prefix_list:
+        gcc_dir = shutil.which(prefix+'gcc')
+        if gcc_dir is not None:
+            candidate_list.append([prefix, os.path.dirname(os.path.realpath(gcc_dir))])
+    for glob_pattern in host_toolchain_glob_list:
+        for gcc_dir in sorted(glob.glob(glob_pattern+'/arm-*-gcc')):
+            candidate_list.append([os.path.basename(gcc_dir)[:-len('gcc')], os.path.dirname(gcc_dir)])
+
+    toolchain = {}
+    for prefix, bin_dir in candidate_list:
+        result = checkCrossCompiler(bin_dir+'/'+prefix+'gcc')
+        if result is not None:
+            toolchain = {'source': 'host', 'cross_compile': prefix, 'bin_dir': bin_dir, \
+                'machine': result[0], 'version': result[1], \
+                'id': result[0]+'-gcc-'+result[1]+':'+bin_dir+'/'+prefix+'gcc'}
+            break
+
+    storeJsonFile(cache_file_dir, {'search_state': search_state, 'toolchain': toolchain, \
+        'gcc_mtime': giveMtime(toolchain.get('bin_dir','')+'/'+toolchain.get('cross_compile','')+'gcc')})
+    return toolchain
+
+#
+# @brief Calculate the CRC of a BootROM image (CRC-32 with the polynomial 0x04C11DB7, 
+#        not reflected). zlib calculates the reflected CRC: The bits of every input 
+#        byte and of the result are reversed. 
+# @param data                  Data (bytes)
+# @return                      CRC
+#
+BITREVERSE_TABLE = bytes(int('{:08b}'.format(i)[::-1],2) for i in range(256))
+def calcBootRomCrc(data):
+    crc = zlib.crc32(bytes(data).translate(BITREVERSE_TABLE))
+    return int('{:032b}'.format(crc)[::-1],2)
+
+#
+# @brief Create one copy of a BootROM image: The header is inserted into the SPL and 
+#        the CRC is appended (same output as "mkpimage")
+# @param spl_data              SPL binary (bytes)
+# @param header_version        Header version (0: Cyclone V and Arria V; 1: Arria 10)
+# @return                      Image (bytes; size of one copy) or None if the SPL is too large
+#
+def makeBootRomImage(spl_data, header_version):
+    image_size = bootrom_image_size_list[header_version]
+    program = bytearray(spl_data)
+    # The program length is a multiple of 32-bit words 
+    program += bytes(-len(program) % 4)
+    program_length = len(program)+4
+    if len(program) < BOOTROM_HEADER_OFFSET+bootrom_header_size_list[header_version] or \
+            program_length > image_size:
+        return None
+
+    if header_version == 0:
+        header = struct.pack('<IBBHH', BOOTROM_VALIDATION_WORD, 0, 0, program_length//4, 0)
+    else:
+        header = struct.pack('<IBBHIIH', BOOTROM_VALIDATION_WORD, 1, 0, bootrom_header_size_list[1], \
+                    program_length, BOOTROM_V1_ENTRY_OFFSET, 0)
+    # Header checksum: Sum of the header bytes 
+    header += struct.pack('<H', sum(header) & 0xFFFF)
+    program[BOOTROM_HEADER_OFFSET:BOOTROM_HEADER_OFFSET+len(header)] = header
+
+    program += struct.pack('<I', calcBootRomCrc(program))
+    program += bytes(image_size-len(program))
+    return bytes(program)
+
+#
+# @brief Write a BootROM quad image of a SPL binary 
+#        ("mkpimage -hv <version> -o <output> <spl> <spl> <spl> <spl>")
+# @param spl_file_dir          Directory of the SPL binary (e.g. "u-boot-spl-dtb.bin")
+# @param output_file_dir       Directory of the output file 
+# @param header_version        Header version (0: Cyclone V and Arria V; 1: Arria 10)
+# @return                      success
+#
+def writeBootRomImage(spl_file_dir, output_file_dir, header_version):
+    try:
+        with open(spl_file_dir,'rb') as f:
+            spl_data = f.read()
+        image = makeBootRomImage(spl_data, header_version)
+        if image is None:
+            print('ERROR: The SPL "'+spl_file_dir+'" ('+str(len(spl_data))+' Byte) does not fit')
+            print('       into a BootROM image with header v'+str(header_version))
+            return False
+        with open(output_file_dir,'wb') as f:
+            f.write(image*BOOTROM_IMAGE_COPIES)
+    except Exception as ex:
+        print('ERROR: Failed to write the BootROM image "'+output_file_dir+'" MSG:'+str(ex))
+        return False
+    return True
+
+#
+# @brief Decode and check the copies of a BootROM image (e.g. a SFP file)
+# @param file_dir              Directory of the image file 
+# @return                      List of the copies (dictionary: version, program_length, entry_offset, 
+#                              valid, error); [] if the file is not readable
+#
+def decodeBootRomImage(file_dir):
+    try:
+        with open(file_dir,'rb') as f:
+            data = f.read()
+    except Exception as ex:
+        print('ERROR: Failed to read the BootROM image "'+file_dir+'" MSG:'+str(ex))
+        return []
+
+    header_version = 0
+    if len(data) > BOOTROM_HEADER_OFFSET+4 and data[BOOTROM_HEADER_OFFSET+4] == 1:
+        header_version = 1
+    image_size = bootrom_image_size_list[header_version]
+    header_size = bootrom_header_size_list[header_version]
+
+    copy_list = []
+    for copy_no in range(BOOTROM_IMAGE_COPIES):
+        image = data[copy_no*image_size:(copy_no+1)*image_size]
+        copy = {'version': header_version, 'program_length': 0, 'entry_offset': 0, 'valid': False, 'error': ''}
+        copy_list.append(copy)
+        if len(image) < image_size:
+            copy['error'] = 'The copy is not complete'
+            continue
+        header = image[BOOTROM_HEADER_OFFSET:BOOTROM_HEADER_OFFSET+header_size]
+        if header_version == 0:
+            validation_word, version, flags, program_words, spare, checksum = struct.unpack('<IBBHHH', header)
+            copy['program_length'] = program_words*4
+        else:
+            validation_word, version, flags, hlength, copy['program_length'], copy['entry_offset'], \
+                spare, checksum = struct.unpack('<IBBHIIHH', header)
+        if not validation_word == BOOTROM_VALIDATION_WORD:
+            copy['error'] = 'Wrong validation word 0x{:08X}'.format(validation_word)
+        elif not sum(header[:-2]) & 0xFFFF == checksum:
+            copy['error'] = 'Wrong header checksum 0x{:04X}'.format(checksum)
+        elif copy['program_length'] < BOOTROM_HEADER_OFFSET+header_size+4 or \
+                copy['program_length'] > len(image):
+            copy['error'] = 'Wrong program length '+str(copy['program_length'])
+        elif not calcBootRomCrc(image[:copy['program_length']-4]) == \
+                struct.unpack_from('<I', image, copy['program_length']-4)[0]:
+            copy['error'] = 'Wrong CRC'
+        else:
+            copy['valid'] = True
+    return copy_list
+
+#
+# @brief Property values of a flattened devicetree (string or 32-bit cell)
+# @param value                 Value (str or int)
+# @return                      Property value (bytes)
+#
+def fdtString(value):
+    return bytes(value,'utf-8')+b'\0'
+
+def fdtCell(value):
+    return struct.pack('>I', value)
+
+#
+# @brief Create a flattened devicetree blob (FDT version 17, same layout as "dtc")
+# @param root_node             Root node (list: [name, properties [[name, value (bytes)]], child nodes])
+# @param align                 Alignment of the total size of the blob 
+# @return                      Blob (bytes)
+#
+def buildFdt(root_node, align=FIT_DATA_ALIGN):
+    struct_block = bytearray()
+    strings_block = bytearray()
+    string_offsets = {}
+
+    def addNode(node):
+        name, prop_list, child_list = node
+        struct_block.extend(struct.pack('>I', FDT_BEGIN_NODE)+fdtString(name))
+        struct_block.extend(bytes(-len(struct_block) % 4))
+        for prop_name, value in prop_list:
+            if not prop_name in string_offsets:
+                string_offsets[prop_name] = len(strings_block)
+                strings_block.extend(fdtString(prop_name))
+            struct_block.extend(struct.pack('>III', FDT_PROP, len(value), string_offsets[prop_name])+value)
+            struct_block.extend(bytes(-len(struct_block) % 4))
+        for child in child_list:
+            addNode(child)
+        struct_block.extend(struct.pack('>I', FDT_END_NODE))
+
+    addNode(root_node)
+    struct_block.extend(struct.pack('>I', FDT_END))
+
+    # Header (40 Byte) | Memory reservation map (only the end entry) | Structure block | Strings block 
+    off_mem_rsvmap = 40
+    off_dt_struct = off_mem_rsvmap+16
+    off_dt_strings = off_dt_struct+len(struct_block)
+    total_size = off_dt_strings+len(strings_block)
+    total_size += -total_size % align
+    header = struct.pack('>10I', FDT_MAGIC, total_size, off_dt_struct, off_dt_strings, off_mem_rsvmap, \
+                17, 16, 0, len(strings_block), len(struct_block))
+    blob = header+bytes(16)+struct_block+strings_block
+    return blob+bytes(total_size-len(blob))
+
+#
+# @brief Write the FIT image with the FPGA configuration files of the Arria 10 SX 
+#        (HPS early I/O release mode). The FPGA configuration files are placed 
+#        outside of the FIT structure (same layout as "mkimage -E -f fit_spl_fpga.its")
+# @param output_file_dir       Directory of the FIT image file (".itb")
+# @param periph_rbf_dir        Directory of the FPGA peripheral configuration file (".periph.rbf")
+# @param core_rbf_dir          Directory of the FPGA core configuration file (".core.rbf")
+# @return                      success
+#
+def writeFpgaFitImage(output_file_dir, periph_rbf_dir, core_rbf_dir):
+    image_list = [['fpga-periph-1', 'FPGA peripheral bitstream', periph_rbf_dir], \
+                  ['fpga-core-1', 'FPGA core bitstream', core_rbf_dir]]
+    try:
+        # The data offsets are relative to the end of the FIT structure 
+        image_node_list = []
+        data_offset = 0
+        for name, description, file_dir in image_list:
+            data_size = os.path.getsize(file_dir)
+            image_node_list.append([name, [['description', fdtString(description)], \
+                ['data-size', fdtCell(data_size)], ['data-offset', fdtCell(data_offset)], \
+                ['type', fdtString('fpga')], ['arch', fdtString('arm')], ['compression', fdtString('none')]], []])
+            data_offset += data_size+(-data_size % FIT_DATA_ALIGN)
+
+        # Reproducible builds: The time stamp can be set with "SOURCE_DATE_EPOCH" (as by mkimage)
+        timestamp = int(os.environ.get('SOURCE_DATE_EPOCH', time.time()))
+        fit_structure = buildFdt(['', [['timestamp', fdtCell(timestamp)], \
+                ['description', fdtString('FIT image with FPGA bistream')], ['#address-cells', fdtCell(1)]], \
+            [['images', [], image_node_list], \
+             ['configurations', [['default', fdtString('config-1')]], \
+                [['config-1', [['description', fdtString('Boot with FPGA early IO release config')], \
+                    ['fpga', fdtString('fpga-periph-1')]], []]]]]])
+
+        with open(output_file_dir,'wb') as f:
+            f.write(fit_structure)
+            for name, description, file_dir in image_list:
+                data_size = os.path.getsize(file_dir)
+                if data_size > 0:
+                    with open(file_dir,'rb') as data_file, \
+                            mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        f.write(data)
+                f.write(bytes(-data_size % FIT_DATA_ALIGN))
+    except Exception as ex:
+        print('ERROR: Failed to write the FIT image "'+output_file_dir+'" MSG:'+str(ex))
+        return False
+    return True
+
+#
+# @brief Create a legacy u-boot image of an u-boot script 
+#        (same output as "mkimage -A <arch> -O linux -T script -C none -a 0 -e 0 -n <name> -d <script>")
+# @param script_data           u-boot script (bytes)
+# @param arch                  Architecture (key of uimage_arch_dict)
+# @param timestamp             Creation time of the image (None: "SOURCE_DATE_EPOCH" or now, as by mkimage)
+# @return                      Image (bytes)
+#
+def makeUbootScriptImage(script_data, arch='arm', timestamp=None):
+    if timestamp is None:
+        timestamp = int(os.environ.get('SOURCE_DATE_EPOCH', time.time()))
+    # Data: List of the file sizes (terminated with 0) followed by the script 
+    data = struct.pack('>II', len(script_data), 0)+script_data
+    header = bytearray(struct.pack('>7I4B32s', UIMAGE_MAGIC, 0, timestamp, len(data), 0, 0, \
+                zlib.crc32(data), UIMAGE_OS_LINUX, uimage_arch_dict[arch], UIMAGE_TYPE_SCRIPT, \
+                UIMAGE_COMP_NONE, bytes(UBOOT_SCRIPT_IMAGE_NAME,'utf-8')[:31]))
+    # The header CRC is calculated with a zero header CRC field
+    header[4:8] = struct.pack('>I', zlib.crc32(header))
+    return bytes(header)+data
+
+#
+# @brief Compile an u-boot script to a legacy u-boot image. The image is only written if its 
+#        content differs from an existing output file; The header of the output records  
+#        the CRC of the script.  
+# @param script_file_dir       Directory of the u-boot script (e.g. "boot.script")
+# @param output_file_dir       Directory of the output file (e.g. "boot.scr")
+# @param arch                  Architecture (key of uimage_arch_dict)
+# @return                      success
+#
+def compileUbootScript(script_file_dir, output_file_dir, arch='arm'):
+    try:
+        with open(script_file_dir,'rb') as f:
+            script_data = f.read()
+        image = makeUbootScriptImage(script_data, arch)
+
+        # Compare with the existing output (without the creation time)
+        if os.path.isfile(output_file_dir) and os.path.getsize(output_file_dir) == len(image):
+            with open(output_file_dir,'rb') as f:
+                output = f.read()
+            if output[:4] == image[:4] and output[12:] == image[12:] and \
+                    struct.unpack_from('>I', output, 4)[0] == \
+                        zlib.crc32(output[:4]+bytes(4)+output[8:UIMAGE_HEADER_SIZE]):
+                print('    The u-boot script "'+os.path.basename(output_file_dir)+'" is up to date')
+                return True
+
+        temp_file_dir = giveTempFileDir(output_file_dir)
+        with open(temp_file_dir,'wb') as f:
+            f.write(image)
+        os.replace(temp_file_dir,output_file_dir)
+        print('    The u-boot script "'+os.path.basename(script_file_dir)+'" was compiled to "'+ \
+            os.path.basename(output_file_dir)+'"')
+    except Exception as ex:
+        print('ERROR: Failed to compile the u-boot script "'+script_file_dir+'" MSG:'+str(ex))
+        return False
+    return True
+
+#
+# @brief Give the version of the devicetree compiler "dtc" (read once per process)
+# @return                      Version ('': dtc is not installed)
+#
+dtc_version = None
+def giveDtcVersion():
+    global dtc_version
+    if dtc_version is None:
+        dtc_version = ''
+        if shutil.which('dtc') is not None:
+            exit_code, output = runCommand(['dtc','--version'], None, None, 30, False)
+            if exit_code == 0:
+                dtc_version = output.strip()
+    return dtc_version
+
+#
+# @brief Find all files included by a devicetree source file (/include/ and #include), recursively
+# @param dts_file_dir          Directory of the ".dts"-file
+# @return                      List of the ".dts"-file and its included files (not available files too)
+#
+DTS_INCLUDE_PATTERN = re.compile(rb'^\s*(?:/include/|#include)\s+["<]([^">]+)[">]', re.MULTILINE)
+def findDtsIncludes(dts_file_dir):
+    file_list = [dts_file_dir]
+    for file_dir in file_list:
+        if not os.path.isfile(file_dir):
+            continue
+        with open(file_dir,'rb') as f:
+            content = f.read()
+        for include in DTS_INCLUDE_PATTERN.findall(content):
+            # Includes are relative to the including file or to the folder of the ".dts"-file
+            include_dir = os.path.join(os.path.dirname(file_dir),include.decode('utf-8','replace'))
+            if not os.path.isfile(include_dir):
+                include_dir = os.path.join(os.path.dirname(dts_file_dir),include.decode('utf-8','replace'))
+            include_dir = os.path.normpath(include_dir)
+            if not include_dir in file_list:
+                file_list.append(include_dir)
+    return file_list
+
+#
+# @brief Compile a Linux devicetree (".dts" to ".dtb"). The ".dtb"-file of a previous 
+#        compilation of the same source, includes and dtc version is taken from the build cache. 
+# @param dts_file_dir          Directory of the ".dts"-file
+# @param output_file_dir       Directory of the output ".dtb"-file
+# @param stats                 Statistics of the build cache (dictionary: hits, misses)
+# @return                      success
+#
+def compileDeviceTree(dts_file_dir, output_file_dir, stats):
+    fingerprint = calcFingerprint(findDtsIncludes(dts_file_dir), [giveDtcVersion()])
+    cache_file_dir = giveCacheDir(DTB_CACHE_FOLDER)+'/'+fingerprint+'.dtb'
+    try:
+        if os.path.isfile(cache_file_dir):
+            shutil.copy2(cache_file_dir,output_file_dir)
+            stats['hits'] = stats.get('hits',0)+1
+            print('    The devicetree "'+os.path.basename(output_file_dir)+'" was taken from the build cache')
+            return True
+
+        stats['misses'] = stats.get('misses',0)+1
+        print('    Compile the devicetree "'+os.path.basename(dts_file_dir)+'"')
+        exit_code, output = runCommand(['dtc','-I','dts','-O','dtb','-o',output_file_dir,dts_file_dir], \
+                                os.path.dirname(dts_file_dir))
+        if not exit_code == 0 or not os.path.isfile(output_file_dir):
+            print('ERROR: Failed to compile the devicetree "'+dts_file_dir+'"')
+            return False
+
+        # Other builds see the old or the new file, but never a half written file
+        temp_file_dir = giveTempFileDir(cache_file_dir)
+        shutil.copy2(output_file_dir,temp_file_dir)
+        os.replace(temp_file_dir,cache_file_dir)
+    except Exception as ex:
+        print('ERROR: Failed to compile the devicetree "'+dts_file_dir+'" MSG:'+str(ex))
+        return False
+    return True
+
+#
+# @brief Parallelism policy of the u-boot build ("make -j <jobs> -l <max_load>")
+#
+class BuildParallelism(NamedTuple):
+    jobs           : int   = 0    # Number of make jobs (0: Number of available CPUs)
+    max_load       : float = 0    # Load-average limit of make (0: Number of available CPUs; <0: No limit) 
+    mem_per_job_mb : int   = 512  # Required memory per make job in MB (0: No memory guard)
+
+#
+# @brief Compiler cache policy of the u-boot build (ccache)
+#
+class CcachePolicy(NamedTuple):
+    enabled  : bool = True  # Use ccache if it is installed
+    cache_dir: str  = ''    # Directory of the cache ('': "ccache" folder inside the cache folder)
+    max_size : str  = '5G'  # Size limit of the cache (ccache -M)
+
+#
+# @brief Variant of a FPGA configuration file (GenerateFPGAconfVariants)
+#
+class FPGAconfVariant(NamedTuple):
+    boot_linux     : bool = False # False: Written during boot (VFAT); True: Can be written by Linux
+    linux_filename : str  = ''    # ".rbf" output file name for the configuration with Linux
+    linux_copydir  : str  = ''    # Location where the Linux FPGA configuration file should be copied
+    FPPx32_mode    : bool = False # Generate a FPPx32 (compressed) FPGA configuration file
+
+#
+# @brief Read the hits and misses of ccache ("--print-stats" of ccache 3.7+ or "-s" of older versions)
+# @param env                   Environment with the ccache settings (CCACHE_DIR)
+# @return                      Statistics (dictionary: 'direct_cache_hit', 'preprocessed_cache_hit', 
+#                              'cache_miss' -> count); {} in case the statistics are not available
+#
+def readCcacheStats(env):
+    stats = {}
+    exit_code, output = runCommand(['ccache','--print-stats'], None, env, 60, False)
+    if exit_code == 0:
+        # ccache 3.7 uses other names than ccache 4 
+        name_dict = {'cache_hit_direct': 'direct_cache_hit', 'cache_hit_preprocessed': 'preprocessed_cache_hit'}
+        for line in output.splitlines():
+            item = line.split('\t')
+            if len(item) == 2 and item[1].strip().isdigit():
+                stats[name_dict.get(item[0].strip(),item[0].strip())] = int(item[1])
+    else:
+        # ccache 3: "cache hit (direct)     <count>"
+        exit_code, output = runCommand(['ccache','-s'], None, env, 60, False)
+        if not exit_code == 0:
+            return {}
+        name_dict = {'cache hit (direct)': 'direct_cache_hit', \
+                     'cache hit (preprocessed)': 'preprocessed_cache_hit', 'cache miss': 'cache_miss'}
+        for line in output.splitlines():
+            match = re.match(r'^\s*(cache hit \(direct\)|cache hit \(preprocessed\)|cache miss)\s+(\d+)\s*$',line)
+            if match:
+                stats[name_dict[match.group(1)]] = int(match.group(2))
+
+    if not all(key in stats for key in ['direct_cache_hit','preprocessed_cache_hit','cache_miss']):
+        return {}
+    return stats
+
+#
+# @brief Read the first line of a file (e.g. of the Linux "/sys" or "/proc" filesystem)
+# @param file_dir              Directory of the file
+# @return                      First line or '' if the file is not readable
+#
+def readFirstLine(file_dir):
+    try:
+        with open(file_dir) as f:
+            return f.readline().strip()
+    except Exception:
+        return ''
+
+#
+# @brief Decide the number of make jobs and the load-average limit for this host 
+#        with the number of available CPUs, the CPU quota of the cgroup 
+#        and the available memory 
+# @param policy                Parallelism policy (BuildParallelism)
+# @return                      Dictionary with the chosen values and the host data
+#
+def resolveBuildParallelism(policy=BuildParallelism()):
+    # 1. Available CPUs of this process 
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except Exception:
+        cpus = os.cpu_count() or 1
+
+    # 2. CPU quota of the cgroup (v2: "cpu.max", v1: "cpu.cfs_quota_us")
+    cpu_quota = 0
+    try:
+        quota_str = readFirstLine('/sys/fs/cgroup/cpu.max').split(' ')
+        if len(quota_str)==2 and not quota_str[0]=='max':
+            cpu_quota = math.ceil(int(quota_str[0])/int(quota_str[1]))
+        else:
+            quota = int(readFirstLine('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') or -1)
+            period = int(readFirstLine('/sys/fs/cgroup/cpu/cpu.cfs_period_us') or 0)
+            if quota > 0 and period > 0:
+                cpu_quota = math.ceil(quota/period)
+    except Exception:
+        pass
+    if cpu_quota > 0:
+        cpus = max(1,min(cpus,cpu_quota))
+
+    # 3. Available memory of the host and memory limit of the cgroup
+    mem_available_mb = 0
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    mem_available_mb = int(line.split()[1])//1024
+                    break
+        mem_limit = readFirstLine('/sys/fs/cgroup/memory.max')
+        if mem_limit == '':
+            mem_limit = readFirstLine('/sys/fs/cgroup/memory/memory.limit_in_bytes')
+        if mem_limit.isdigit() and int(mem_limit)//(1024*1024) < mem_available_mb:
+            mem_available_mb = int(mem_limit)//(1024*1024)
+    except Exception:
+        pass
+
+    jobs = policy.jobs if policy.jobs > 0 else cpus
+    limited_by = 'user' if policy.jobs > 0 else 'cpu'
+    if policy.mem_per_job_mb > 0 and mem_available_mb > 0:
+        mem_jobs = max(1,mem_available_mb//policy.mem_per_job_mb)
+        if mem_jobs < jobs:
+            jobs = mem_jobs
+            limited_by = 'memory'
+
+    max_load = policy.max_load if not policy.max_load == 0 else float(cpus)
+    if max_load < 0:
+        max_load = 0
+
+    return {'jobs': jobs, 'max_load': max_load, 'limited_by': limited_by, 'cpus': cpus, \
+            'cpu_quota': cpu_quota, 'mem_available_mb': mem_available_mb, \
+            'mem_per_job_mb': policy.mem_per_job_mb}
+
+#
+# @brief Stage of the generation flow with its declared inputs and outputs 
+#
+class BuildStage(NamedTuple):
+    name    : str       # Name of the stage
+    func    : object    # Function of the stage (no arguments; returns success)
+    inputs  : list = [] # Names of the outputs of other stages required by this stage
+    outputs : list = [] # Names of the outputs generated by this stage
+
+# 
+#
+# @brief Scheduler to execute the stages of the generation flow in the order of their 
+#        dependencies. Stages that are ready run in parallel on a bounded thread pool.
+#   
+class StageScheduler:
+    Stages       : list  # List of the stages (BuildStage) in the order they were added
+    Max_workers  : int   # Maximum number of stages running in parallel
+    Stage_report : dict  # Result and duration of every executed stage 
+
+    def __init__(self, max_workers=1):
+        self.Stages = []
+        self.Max_workers = max(1,max_workers)
+        self.Stage_report = {}
+
+    #
+    # @brief Add a stage to the flow 
+    # @param name                  Name of the stage
+    # @param func                  Function of the stage (no arguments; returns success)
+    # @param inputs                Names of the outputs of other stages required by the stage 
+    # @param outputs               Names of the outputs generated by the stage
+    #
+    def AddStage(self, name, func, inputs=[], outputs=[]):
+        self.Stages.append(BuildStage(name, func, list(inputs), list(outputs)))
+
+    #
+    # @brief Give the stages that each stage depends on
+    # @return                      Dictionary: stage name -> list of stage names; None in case of an error
+    #
+    def giveDependencies(self):
+        producer = {}
+        for stage in self.Stages:
+            for output in stage.outputs:
+                if output in producer:
+                    print('ERROR: The output "'+output+'" is generated by the stages "'+ \
+                        producer[output]+'" and "'+stage.name+'"!')
+                    return None
+                producer[output] = stage.name
+        dependencies = {}
+        for stage in self.Stages:
+            dependencies[stage.name] = []
+            for item in stage.inputs:
+                if not item in producer:
+                    print('ERROR: No stage generates the input "'+item+'" of the stage "'+stage.name+'"!')
+                    return None
+                if not producer[item] in dependencies[stage.name]:
+                    dependencies[stage.name].append(producer[item])
+        return dependencies
+
+    #
+    # @brief Execute a single stage and measure its duration
+    # @param stage                 Stage to execute (BuildStage)
+    # @return                      success
+    #
+    def runStage(self, stage):
+        start = time.monotonic()
+        try:
+            ret = stage.func()
+        except Exception as ex:
+            print('ERROR: The stage "'+stage.name+'" failed! MSG: '+str(ex))
+            ret = False
+        self.Stage_report[stage.name] = {'success': ret==True, \
+            'duration_s': round(time.monotonic()-start,3)}
+        return ret==True
+
+    #
+    # @brief Execute all stages. A stage starts when all stages it depends on are done. 
+    #        Ready stages are started in the order they were added. After a failed stage 
+    #        no further stages are started.
+    # @return                      success
+    #
+    def Run(self):
+        from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+        dependencies = self.giveDependencies()
+        if dependencies is None:
+            return False
+
+        done = []
+        running = {}
+        pending = list(self.Stages)
+        failed = False
+        with ThreadPoolExecutor(max_workers=self.Max_workers) as pool:
+            while (pending and not failed) or running:
+                if not failed:
+                    for stage in list(pending):
+                        if len(running) >= self.Max_workers:
+                            break
+                        if all(dep in done for dep in dependencies[stage.name]):
+                            pending.remove(stage)
+                            running[pool.submit(self.runStage,stage)] = stage
+
+                if not running:
+                    print('ERROR: The stages '+str([stage.name for stage in pending])+ \
+                        ' have cyclic dependencies!')
+                    return False
+
+                finished, _ = wait(list(running.keys()),return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    if future.result():
+                        done.append(stage.name)
+                    else:
+                        failed = True
+        return not failed
+
 
 # 
 #
@@ -408,6 +1844,8 @@ def printSelectionTable(headline=[], headline_table=[], raw1=[], raw2=[],
 class SocfpgaPlatformGenerator:
 
     EDS_Folder_dir              : str # Directory of the Intel EDS folder
+    EDS_env                     : dict# Environment of the Intel EDS Embedded Command Shell
+    EDS_env_lock                : threading.Lock # Lock of the EDS environment capture (parallel stages)
     Quartus_proj_top_dir        : str # Directory of the Quartus Project folder 
     
     Qpf_file_name               : str # Name of the Quartus Project ".qpf"-file
@@ -419,12 +1857,18 @@ class SocfpgaPlatformGenerator:
     Quartus_bootloder_dir       : str # Directory of the Quartus Project "/software/bootloader"-folder
     Sof_folder                  : str # Name of the Quartus Project folder containing the ".sof"-file 
     U_boot_socfpga_dir          : str # Directory of u-boot SoC-FPGA folder 
+    Uboot_build_dir             : str # Directory of the u-boot output folder (make O=) of the build
+    Uboot_source_ready          : bool# Was "u-boot-socfpga" already cloned or pulled by this object
+    Uboot_commit                : str # Pinned commit of "u-boot-socfpga" ('': latest commit of the branch)
     Uboot_default_file_dir      : str # Directory of the pre-build default u-boot file 
+    Use_host_toolchain          : bool# Use an installed ARM cross compiler instead of the linaro toolchain
+    Toolchain                   : dict# Cross compiler of the u-boot build ({}: not resolved yet)
+    Use_fpga_conf_cache         : bool# Use the build cache for the FPGA configuration files
     unlicensed_ip_found         : bool# Quartus project contains an unlicensed IP (e.g. NIOS II Core) 
 
     Device_id                   : int # SocFPGA ID (0: Cyclone V; 1: Arria V;2: Arria 10)
     
-    PartitionList               : Partition # Partition List for boot image generation 
+    PartitionList               : 'Partition' # Partition List for boot image generation 
 
     Raw_folder_dir              : str # Directory of the RAW Partition folder (u-boot)
     Vfat_folder_dir             : str # Directory of the VFAT Partition folder
@@ -437,9 +1881,17 @@ class SocfpgaPlatformGenerator:
     ImageFileName               : str  # Name of the output ".img" image file
     Bootloader_available        : bool # Is a bootloader executable available 
     
-    BootImageCreator            : BootImageCreator # The boot Image generator object
+    BootImageCreator            : 'BootImageCreator' # The boot Image generator object
+    BuildReport                 : dict # Report of the build steps (e.g. chosen build parallelism)
 
     def __init__(self):
+        self.BuildReport = {}
+        self.EDS_env_lock = threading.Lock()
+        self.Uboot_source_ready = False
+        self.Uboot_commit = GIT_U_BOOT_SOCFPGA_COMMIT
+        self.Use_host_toolchain = True
+        self.Toolchain = {}
+        self.Use_fpga_conf_cache = True
         ######################################### Find the Intel EDS Installation Path ####################################
         
         print('--> Find the System Platform')
@@ -449,57 +1901,82 @@ class SocfpgaPlatformGenerator:
         # 1.Step: Find the EDS installation path
         print('--> Try to find the default Intel EDS installation path')
 
-        quartus_standard_ver = False
-        # Loop to detect the case that the free Version of EDS (EDS Standard [Folder:intelFPGA]) and 
-        #    the free Version of Quartus Prime (Quartus Lite [Folder:intelFPGA_lite]) are installed together 
-        while(True):
-            if (os.path.exists(EDS_Folder_def_suf_dir+QURTUS_DEF_FOLDER)) and (not quartus_standard_ver):
-                self.EDS_Folder=EDS_Folder_def_suf_dir+QURTUS_DEF_FOLDER
-                quartus_standard_ver = True
-            elif(os.path.exists(EDS_Folder_def_suf_dir+QURTUS_DEF_FOLDER_LITE)):
-                self.EDS_Folder=EDS_Folder_def_suf_dir+QURTUS_DEF_FOLDER_LITE
-                quartus_standard_ver = False
-            else:
-                print('ERROR: No Intel EDS Installation Folder was found!')
-                sys.exit()
-
-            # 2.Step: Find the latest Intel EDS Version No.
-            avlVer = []
-            for name in os.listdir(self.EDS_Folder):
-                if  os.path.abspath(name):
-                    try:
-                        avlVer.append(float(name))
-                    except Exception:
-                        pass
-
-            if (len(avlVer)==0):
-                print('ERROR: No valid Intel EDS Version was found')
-                sys.exit()
-
-            avlVer.sort(reverse = True) 
-
-            highestVer = avlVer[0]
-            self.EDS_Folder = self.EDS_Folder +'/'+ str(highestVer)   
-
-            if (not(os.path.realpath(self.EDS_Folder))):
-                print('ERROR: No valid Intel EDS Installation Folder was found!')
-                sys.exit()
+        # Use the installation folder of the last run in case no EDS version was installed or removed
+        eds_cache_file_dir = giveCacheDir()+'/'+EDS_CACHE_FILE_NAME
+        eds_cache = loadJsonFile(eds_cache_file_dir)
+        eds_root_mtimes = {}
+        for folder in [QURTUS_DEF_FOLDER, QURTUS_DEF_FOLDER_LITE]:
+            eds_root_mtimes[folder] = giveMtime(EDS_Folder_def_suf_dir+folder)
+
+        self.EDS_Folder = ''
+        self.EDS_env = {}
+        if eds_cache.get('root_mtimes') == eds_root_mtimes and \
+            eds_cache.get('install_mtime') == giveMtime(eds_cache.get('eds_folder','')) and \
+            eds_cache.get('shell_mtime') == giveMtime(eds_cache.get('eds_folder','')+EDS_EMBSHELL_DIR):
+            self.EDS_Folder = eds_cache['eds_folder']
+            print('    Use the Intel EDS installation of the last run (Version '+str(eds_cache.get('version'))+')')
+
+        if self.EDS_Folder == '':
+            quartus_standard_ver = False
+            # Loop to detect the case that the free Version of EDS (EDS Standard [Folder:intelFPGA]) and 
+            #    the free Version of Quartus Prime (Quartus Lite [Folder:intelFPGA_lite]) are installed together 
+            while(True):
+                if (os.path.exists(EDS_Folder_def_suf_dir+QURTUS_DEF_FOLDER)) and (not quartus_standard_ver):
+                    self.EDS_Folder=EDS_Folder_def_suf_dir+QURTUS_DEF_FOLDER
+                    quartus_standard_ver = True
+                elif(os.path.exists(EDS_Folder_def_suf_dir+QURTUS_DEF_FOLDER_LITE)):
+                    self.EDS_Folder=EDS_Folder_def_suf_dir+QURTUS_DEF_FOLDER_LITE
+                    quartus_standard_ver = False
+                else:
+                    print('ERROR: No Intel EDS Installation Folder was found!')
+                    sys.exit(1)
+
+                # 2.Step: Find the latest Intel EDS Version No.
+                avlVer = []
+                for name in os.listdir(self.EDS_Folder):
+                    if  os.path.abspath(name):
+                        try:
+                            avlVer.append(float(name))
+                        except Exception:
+                            pass
+
+                if (len(avlVer)==0):
+                    print('ERROR: No valid Intel EDS Version was found')
+                    sys.exit(1)
+
+                avlVer.sort(reverse = True) 
+
+                highestVer = avlVer[0]
+                self.EDS_Folder = self.EDS_Folder +'/'+ str(highestVer)   
+
+                if (not(os.path.realpath(self.EDS_Folder))):
+                    print('ERROR: No valid Intel EDS Installation Folder was found!')
+                    sys.exit(1)
+
+                if(highestVer < 19): 
+                    print('ERROR: This script is designed for Intel EDS Version 19+ (19.1, 20.1, ...) ')
+                    print('       You using Version '+str(highestVer)+' please update Intel EDS!')
+                    sys.exit(1)
+                elif(highestVer > 20.1):
+                    print('WARNING: This script was designed for Intel EDS Version 19.1 and 20.1')
+                    print('         Your version is newer. Errors may occur!')
+
+                # Check if the NIOS II Command Shell is available 
+                if((not(os.path.isfile(self.EDS_Folder+EDS_EMBSHELL_DIR)) )):
+                    if( not quartus_standard_ver):
+                        print('ERROR: Intel EDS Embedded Command Shell was not found!')
+                        sys.exit(1)
+                else:
+                    break
 
-            if(highestVer < 19): 
-                print('ERROR: This script is designed for Intel EDS Version 19+ (19.1, 20.1, ...) ')
-                print('       You using Version '+str(highestVer)+' please update Intel EDS!')
-                sys.exit()
-            elif(highestVer > 20.1):
-                print('WARNING: This script was designed for Intel EDS Version 19.1 and 20.1')
-                print('         Your version is newer. Errors may occur!')
-
-            # Check if the NIOS II Command Shell is available 
-            if((not(os.path.isfile(self.EDS_Folder+EDS_EMBSHELL_DIR)) )):
-                if( not quartus_standard_ver):
-                    print('ERROR: Intel EDS Embedded Command Shell was not found!')
-                    sys.exit()
-            else:
-                break
+            # Remember the installation folder for the next run 
+            if not (eds_cache.get('eds_folder') == self.EDS_Folder and \
+                eds_cache.get('shell_mtime') == giveMtime(self.EDS_Folder+EDS_EMBSHELL_DIR)):
+                eds_cache = {}
+            eds_cache.update({'eds_folder': self.EDS_Folder, 'version': highestVer, \
+                'root_mtimes': eds_root_mtimes, 'install_mtime': giveMtime(self.EDS_Folder), \
+                'shell_mtime': giveMtime(self.EDS_Folder+EDS_EMBSHELL_DIR)})
+            storeJsonFile(eds_cache_file_dir,eds_cache)
 
         print('        Following EDS Installation Folder was found:')
         print('        '+self.EDS_Folder)
@@ -532,7 +2009,7 @@ class SocfpgaPlatformGenerator:
             print('       Please clone this script from Github and execute the script')
             print('       directly inside the cloned folder!')
             print('URL: '+GIT_SCRIPT_URL)
-            sys.exit()
+            sys.exit(1)
 
         if not os.path.isdir(excpath+'/ubootScripts'):
             print('ERROR: The u-boot default script folder "ubootScripts" is not available')
@@ -540,44 +2017,18 @@ class SocfpgaPlatformGenerator:
         ############################### Check that the script runs inside the Quartus project ###############################
         print('--> Check that the script runs inside the Quartus Prime project folder')
 
-        # Find the Quartus project (.qpf) file 
-        self.Qpf_file_name = ''
-        for file in os.listdir(self.Quartus_proj_top_dir):
-            if ".qpf" in file:
-                self.Qpf_file_name =file
-                break
-        self.sopcinfo_file_name = ''
-        for file in os.listdir(self.Quartus_proj_top_dir):
-            if ".sopcinfo" in file:
-                self.sopcinfo_file_name =file
-                break
+        # Find the project files with a single scan of the project folders
+        project_index = giveQuartusProjectIndex(self.Quartus_proj_top_dir)
+        self.Qpf_file_name = project_index.qpf.name
+        self.sopcinfo_file_name = project_index.sopcinfo.name
+        self.Qsys_file_name = project_index.qsys.name
 
         # Find the Quartus  (.sof) (SRAM Object) file 
-        self.Sof_file_name = ''
+        #  (Looking in the top folder and inside the "output_files" and "output" folders)
+        self.Sof_file_name = os.path.basename(project_index.sof.name)
         self.Sof_folder = ''
-        # Looking in the top folder for the sof file
-        for file in os.listdir(self.Quartus_proj_top_dir):
-                if ".sof" in file:
-                    self.Sof_file_name =file
-                    break
-        if self.Sof_file_name == '':
-            # Looking inside the "output_files" and "output" folders
-            if os.path.isdir(self.Quartus_proj_top_dir+'/output_files'):
-                self.Sof_folder = '/output_files'
-            if os.path.isdir(self.Quartus_proj_top_dir+'/output'):
-                self.Sof_folder = '/output'
-            for file in os.listdir(self.Quartus_proj_top_dir+self.Sof_folder):
-                if ".sof" in file:
-                    self.Sof_file_name =file
-                    break
-            
-        # Find the Platform Designer (.qsys) file  
-        self.Qsys_file_name = ''
-        for file in os.listdir(self.Quartus_proj_top_dir):
-                if ".qsys" in file and not ".qsys_edit" in file:
-                    self.Qsys_file_name =file
-                    print(self.Qsys_file_name)
-                    break
+        if not os.path.dirname(project_index.sof.name) == '':
+            self.Sof_folder = '/'+os.path.dirname(project_index.sof.name)
 
         print('    Founded files: ')
         print('      QPF:     "'+self.Qpf_file_name+'"')
@@ -615,58 +2066,35 @@ class SocfpgaPlatformGenerator:
             print('       |         L-- socfpgaPlatformGenerator.py')
             print('       Note: File names can be chosen freely\n')
             print('NOTE: It is necessary to build the Prime Quartus Project for the bootloader generation!')
-            sys.exit()
+            sys.exit(1)
 
         # Find the handoff folder
         print('--> Find the Quartus handoff folder')
+        if len(project_index.handoff_list) > 1:
+            print('ERROR: More than one folder inside the Quartus handoff folder "'+ \
+                os.path.dirname(project_index.handoff_list[0])+'" found! Please delete one!')
+            print('NOTE: It is necessary to build the Prime Quartus Project for the bootloader generation!')
+            sys.exit(1)
         self.Handoff_folder_name = ''
-        handoff_folder_start_name =''
-        for file in os.listdir(self.Quartus_proj_top_dir):
-                if "_handoff" in file:
-                    handoff_folder_start_name =file
-                    break
-        folder_found = False
-        for folder in os.listdir(self.Quartus_proj_top_dir+'/'+handoff_folder_start_name):
-            if os.path.isdir(self.Quartus_proj_top_dir+'/'+handoff_folder_start_name+'/'+folder):
-                self.Handoff_folder_name = folder
-                if folder_found:
-                    print('ERROR: More than one folder inside the Quartus handoff folder "'+self.Handoff_folder_name+'" found! Please delete one!')
-                    print('NOTE: It is necessary to build the Prime Quartus Project for the bootloader generation!')
-                    sys.exit()
-                folder_found = True
-        self.Handoff_folder_name = handoff_folder_start_name+'/'+self.Handoff_folder_name
+        if len(project_index.handoff_list) == 1:
+            self.Handoff_folder_name = project_index.handoff_list[0]
         print('     Handoff folder:" '+self.Handoff_folder_name+'"')
 
         # Find the "hps.xml"-file inside the handoff folder
         print('--> Find the "hps.xml" file ')
-        handoff_xml_found =False
-
-        for file in os.listdir(self.Quartus_proj_top_dir+'/'+self.Handoff_folder_name):
-            if "hps.xml" == file:
-                handoff_xml_found =True
-                break 
-        if not handoff_xml_found:
+        if project_index.hps_xml.name == '':
             print('ERROR: The "hps.xml" file inside the handoff folder was not found!')
             print('NOTE: It is necessary to build the Prime Quartus Project for the bootloader generation!')
-            sys.exit()
+            sys.exit(1)
 
         # Load the "hps.xml" file to read the device name
         print('--> Read the "hps.xml"-file to decode the device name')
 
-        try:
-            tree = ET.parse(self.Quartus_proj_top_dir+'/'+self.Handoff_folder_name+'/'+'hps.xml') 
-            root = tree.getroot()
-        except Exception as ex:
-            print(' ERROR: Failed to parse "hps.xml" file!')
-            print(' Msg.: '+str(ex))
-            sys.exit()
+        hps_device = giveHpsDeviceDescriptor(self.Quartus_proj_top_dir+'/'+self.Handoff_folder_name+'/'+'hps.xml')
+        if hps_device is None:
+            sys.exit(1)
 
-        device_name_temp =''
-        for it in root.iter('config'):
-            name = str(it.get('name'))
-            if name == 'DEVICE_FAMILY':
-                device_name_temp = str(it.get('value'))
-                break
+        device_name_temp = hps_device.get('DEVICE_FAMILY','')
         if device_name_temp == '':
             print('ERROR: Failed to decode the device name inside "hps.xml"')
 
@@ -684,18 +2112,17 @@ class SocfpgaPlatformGenerator:
         else:
             print('Error: Your Device ('+device_name_temp+') is not supported right now!')
             print('       I am working on it...')
-            sys.exit()
+            sys.exit(1)
         print('     Device Name:"'+device_name_temp+'"') 
 
 
         # For Arria 10 SX: The early I/O release must be enabled inside Quartus Prime!
         early_io_mode =-1
         if self.Device_id == 2:
-            for it in root.iter('config'):
-                name = str(it.get('name'))
-                if name == 'chosen.early-release-fpga-config':
-                    early_io_mode = int(it.get('value'))
-                    break
+            try:
+                early_io_mode = int(hps_device.get('chosen.early-release-fpga-config','-1'))
+            except ValueError:
+                early_io_mode =-1
             
             if not early_io_mode==1:
                 print('ERROR: This build system supports only the Arria 10 SX SoC-FPGA')
@@ -704,7 +2131,7 @@ class SocfpgaPlatformGenerator:
                 print('       and rebuild the project again')
                 print('Setting: "Enables the HPS early release of HPS IO" inside the general settings')
                 print('Note:    Do not forget to enable it for the EMIF')
-                sys.exit()
+                sys.exit(1)
             else:
                 print('--> HPS early release of HPS IO is enabled')
 
@@ -742,11 +2169,6 @@ class SocfpgaPlatformGenerator:
                 print('NOTE: No depending default u-boot.img Image pre-build file is available for this device!')
 
         
-    ##################################### Update "LinuxBootImageFileGenerator" ####################################################
-        print('-> Pull the latest "LinuxBootImageFileGenerator" Version from GitHub!')
-        g = git.cmd.Git(os.getcwd()+'/LinuxBootImageFileGenerator')
-        g.pull()
-
     ############################### Create "software/bootloader" folder inside Quartus project  ###################################
         if not os.path.isdir(self.Quartus_proj_top_dir+'/'+'software'):
             print('--> Create the folder software')
@@ -766,6 +2188,7 @@ class SocfpgaPlatformGenerator:
         else:
             self.Bootloader_available = True
         self.U_boot_socfpga_dir = self.Quartus_bootloder_dir+'/'+'u-boot-socfpga'
+        self.Uboot_build_dir = self.Quartus_bootloder_dir+'/'+UBOOT_BUILD_FOLDER+'/'+UBOOT_CURRENT_BUILD_NAME
     ###############################################   Create SD-CARD folder  ##############################################
         # Create the partition blueprint xml file 
         if os.path.exists('SocFPGABlueprint.xml'):
@@ -776,6 +2199,111 @@ class SocfpgaPlatformGenerator:
             with open('SocFPGABlueprint.xml',"w") as f: 
                 f.write(INTELSOCFPGA_BLUEPRINT_XML_FILE)
         
+    #
+    #
+    #
+    # @brief Give the environment of the Intel EDS Embedded Command Shell (PATH, QUARTUS_ROOTDIR,
+    #        SOCEDS_DEST_ROOT,...) to start the EDS tools directly. The shell is only started once to 
+    #        capture the environment; the result is cached for the EDS installation 
+    # @return                      Environment (dictionary); {} in case of an error
+    #
+    def GiveEdsEnvironment(self):
+        # Parallel stages share the captured environment
+        with self.EDS_env_lock:
+            if self.EDS_env == {}:
+                eds_cache_file_dir = giveCacheDir()+'/'+EDS_CACHE_FILE_NAME
+                eds_cache = loadJsonFile(eds_cache_file_dir)
+                shell_mtime = giveMtime(self.EDS_Folder+EDS_EMBSHELL_DIR)
+
+                if not (eds_cache.get('eds_folder') == self.EDS_Folder and \
+                    eds_cache.get('shell_mtime') == shell_mtime and 'eds_env' in eds_cache):
+                    print('--> Capture the environment of the Intel EDS Embedded Command Shell')
+                    before_mark = b'__SOCFPGA_EDS_ENV_BEFORE__'
+                    begin_mark  = b'__SOCFPGA_EDS_ENV_BEGIN__'
+                    end_mark    = b'__SOCFPGA_EDS_ENV_END__'
+                    # The shell starts with a minimal environment (also inside an EDS shell) and 
+                    # writes it before it is replaced by the EDS shell script 
+                    base_env = {key: value for key, value in os.environ.items() \
+                                if key in ['HOME','USER','LOGNAME','LANG','TERM']}
+                    base_env['PATH'] = '/usr/local/bin:/usr/bin:/bin'
+                    try:
+                        shell = subprocess.run(['bash','-c','env -0; echo; echo '+before_mark.decode()+ \
+                            '; exec "$0"',self.EDS_Folder+EDS_EMBSHELL_DIR], env=base_env, \
+                            input=b'echo '+begin_mark+b'\nenv -0\necho\necho '+end_mark+b'\nexit\n', \
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=120)
+                        output = shell.stdout
+                        output_before = output[:output.index(before_mark)]
+                        output = output[output.index(begin_mark+b'\n')+len(begin_mark)+1:output.rindex(end_mark)]
+                    except Exception as ex:
+                        print('ERROR: Failed to start the Intel EDS Command Shell! MSG:'+ str(ex))
+                        return {}
+
+                    def readEnv(env_output):
+                        env = {}
+                        for item in env_output.split(b'\0'):
+                            if b'=' in item:
+                                key, value = item.split(b'=',1)
+                                env[key.decode('utf-8','replace').strip()] = value.decode('utf-8','replace')
+                        return env
+                    env_before = readEnv(output_before)
+                    env_after = readEnv(output)
+                    if not 'PATH' in env_after:
+                        print('ERROR: Failed to read the environment of the Intel EDS Command Shell!')
+                        return {}
+
+                    # Only store the values the EDS shell script adds or changes; the values of the 
+                    # shell process itself are not stored 
+                    eds_env = {}
+                    for key, value in env_after.items():
+                        if not key in ['PATH','PWD','OLDPWD','SHLVL','_'] and not env_before.get(key) == value:
+                            eds_env[key] = value
+                    path_before = env_before.get('PATH','').split(':')
+                    eds_path = [path for path in env_after['PATH'].split(':') \
+                                if not path == '' and not path in path_before]
+                    eds_cache.pop('shell_env',None)
+                    eds_cache.update({'eds_folder': self.EDS_Folder, 'shell_mtime': shell_mtime, \
+                        'eds_env': eds_env, 'eds_path': eds_path})
+                    storeJsonFile(eds_cache_file_dir,eds_cache)
+
+                # The values of the EDS shell script on top of the environment of this session
+                env = dict(os.environ)
+                env.update(eds_cache['eds_env'])
+                env['PATH'] = ':'.join(eds_cache['eds_path']+[path for path in os.environ.get('PATH','').split(':') \
+                                if not path == '' and not path in eds_cache['eds_path']])
+                self.EDS_env = env
+            return dict(self.EDS_env)
+
+    #
+    #
+    #
+    # @brief Execute a command with the environment of the Intel EDS Embedded Command Shell 
+    # @param argv                  Command and its arguments (list)
+    # @param cwd                   Working directory 
+    # @param env_add               Additional environment values (dictionary)
+    # @param path_add              Directories to add in front of the PATH 
+    # @param timeout               Timeout in seconds
+    # @return                      success (exit code 0)
+    #
+    def RunEdsCommand(self, argv, cwd, env_add={}, path_add=[], timeout=CMD_TIMEOUT_S):
+        env = self.GiveEdsEnvironment()
+        if env == {}:
+            return False
+        env.update(env_add)
+        env['PATH'] = ':'.join(path_add+[env['PATH']])
+
+        # Find the tool with the PATH of the EDS environment
+        tool_dir = shutil.which(argv[0],path=env['PATH'])
+        if tool_dir is None:
+            print('ERROR: The command "'+argv[0]+'" was not found!')
+            return False
+
+        print('    $ '+' '.join(argv))
+        exit_code, output = runCommand([tool_dir]+argv[1:],cwd,env,timeout)
+        if not exit_code == 0:
+            print('ERROR: The command "'+' '.join(argv)+'" failed (exit code '+str(exit_code)+')')
+            return False
+        return True
+
     #
     #
     #
@@ -783,6 +2311,8 @@ class SocfpgaPlatformGenerator:
     # @return                      success
     #
     def GeneratePartitionTable(self):
+        if not loadLinuxBootImageGenerator():
+            return False
         ############################################ Read the XML Blueprint file  ###########################################
         ####################################### & Process the settings of a partition   ####################################
         print('---> Read the XML blueprint file ')
@@ -904,36 +2434,415 @@ class SocfpgaPlatformGenerator:
             return False
         return True
 
+    #
+    #
+    #
+    # @brief Give the bootloader files of the chosen device with their locations 
+    #        inside the u-boot build folder and inside the partition folders 
+    # @return                      List of [build file dir, partition file dir]
+    #
+    def giveBootloaderArtifacts(self):
+        if not generate_sfp_image_file[self.Device_id]:
+            # Only for the Arria 10 SX: SFP BootROM file (RAW) and u-boot image (VFAT)
+            return [[self.Uboot_build_dir+'/spl/'+SFP_OUTPUT_FILE_NAME,
+                        self.Raw_folder_dir+'/'+SFP_OUTPUT_FILE_NAME],
+                    [self.Uboot_build_dir+'/'+U_BOOT_IMAGE_FILE_NAME,
+                        self.Vfat_folder_dir+'/'+U_BOOT_IMAGE_FILE_NAME]]
+        # For other devices: u-boot executable with the SPL (RAW)
+        return [[self.Uboot_build_dir+'/'+BOOTLOADER_FILE_NAME,
+                    self.Raw_folder_dir+'/'+BOOTLOADER_FILE_NAME]]
+
+    #
+    #
+    #
+    # @brief Calculate the fingerprint of all inputs of the bootloader build
+    #        (Handoff folder, defconfig, u-boot revision, cross compiler and Intel EDS version)
+    # @note                        Call "PrepareUbootSource()" first: Only the commit of the  
+    #                              checked out u-boot revision identifies the source 
+    # @return                      Fingerprint as hex string ('': "u-boot-socfpga" is not checked out)
+    #
+    def CalcBootloaderFingerprint(self):
+        u_boot_revision = readGitHeadCommit(self.U_boot_socfpga_dir)
+        if u_boot_revision == '':
+            return ''
+
+        # The installation folder of EDS contains its version (e.g. ".../intelFPGA/20.1")
+        return calcFingerprint([self.Quartus_proj_top_dir+'/'+self.Handoff_folder_name], \
+                    [self.Socfpga_devices_list[self.Device_id], u_boot_defconfig_list[self.Device_id], \
+                     u_boot_revision, self.ResolveToolchain()['id'], self.EDS_Folder])
+
+    #
+    #
+    #
+    # @brief Copy the bootloader files of a previous build with the same fingerprint
+    #        from the build cache to the partition folders 
+    # @param fingerprint           Fingerprint of the bootloader build inputs 
+    # @return                      success
+    #
+    def RestoreBootloaderFromCache(self, fingerprint):
+        cache_entry_dir = giveCacheDir(BOOTLOADER_CACHE_FOLDER)+'/'+fingerprint
+        artifacts = self.giveBootloaderArtifacts()
+        for build_file_dir, part_file_dir in artifacts:
+            if not os.path.isfile(cache_entry_dir+'/'+os.path.basename(build_file_dir)):
+                return False
+        try:
+            for build_file_dir, part_file_dir in artifacts:
+                shutil.copy2(cache_entry_dir+'/'+os.path.basename(build_file_dir),part_file_dir)
+        except Exception as ex:
+            print('ERROR: Failed to copy the cached bootloader files MSG: '+str(ex))
+            return False
+        return True
+
+    #
+    #
+    #
+    # @brief Store the bootloader files of the current build inside the build cache
+    # @param fingerprint           Fingerprint of the bootloader build inputs 
+    # @return                      success
+    #
+    def StoreBootloaderInCache(self, fingerprint):
+        cache_dir = giveCacheDir(BOOTLOADER_CACHE_FOLDER)
+        cache_entry_dir = cache_dir+'/'+fingerprint
+        if os.path.isdir(cache_entry_dir):
+            return True
+
+        # Fill a temporary folder first to prevent that other builds see a half written entry 
+        temp_dir = ''
+        try:
+            os.makedirs(cache_dir,exist_ok=True)
+            temp_dir = tempfile.mkdtemp(prefix=fingerprint+'.tmp',dir=cache_dir)
+            for build_file_dir, part_file_dir in self.giveBootloaderArtifacts():
+                shutil.copy2(build_file_dir,temp_dir+'/'+os.path.basename(build_file_dir))
+            os.rename(temp_dir,cache_entry_dir)
+        except Exception as ex:
+            if not temp_dir == '':
+                shutil.rmtree(temp_dir,ignore_errors=True)
+            if os.path.isdir(cache_entry_dir):
+                # Another build stored the same files at the same time
+                return True
+            print('WARNING: Failed to store the bootloader inside the build cache MSG: '+str(ex))
+            return False
+        return True
+
+    #
+    #
+    #
+    # @brief Give the u-boot output folder (make O=) for a configuration of the device
+    # @param config_hash           Hash of the configuration ('': hash of the defconfig file of the device)
+    # @return                      Directory of the output folder 
+    #
+    def giveUbootBuildDir(self, config_hash=''):
+        if config_hash == '':
+            config_hash = calcFingerprint([self.U_boot_socfpga_dir+'/configs/'+ \
+                            u_boot_defconfig_list[self.Device_id]])
+        return self.Quartus_bootloder_dir+'/'+UBOOT_BUILD_FOLDER+'/'+self.Socfpga_devices_list[self.Device_id]+ \
+                '_'+u_boot_defconfig_list[self.Device_id].replace('_defconfig','')+'_'+config_hash[:12]
+
+    #
+    #
+    #
+    # @brief Check that the u-boot configuration (".config") of the build folder is the output of the 
+    #        defconfig of the device, i.e. a new "make <defconfig>" would not change it  
+    # @return                      The configuration is up to date
+    #
+    def isUbootConfigCurrent(self):
+        stamp_file_dir = self.Uboot_build_dir+'/'+UBOOT_CONFIG_STAMP_FILE_NAME
+        config_file_dir = self.Uboot_build_dir+'/.config'
+        if not os.path.isfile(stamp_file_dir) or not os.path.isfile(config_file_dir):
+            return False
+        try:
+            with open(stamp_file_dir) as f:
+                stamp = json.load(f)
+        except Exception:
+            return False
+        return stamp.get('defconfig') == u_boot_defconfig_list[self.Device_id] and \
+            stamp.get('defconfig_hash') == calcFingerprint([self.U_boot_socfpga_dir+'/configs/'+ \
+                u_boot_defconfig_list[self.Device_id]]) and \
+            stamp.get('config_hash') == calcFingerprint([config_file_dir])
+
+    #
+    #
+    #
+    # @brief Record that the current u-boot configuration (".config") was generated 
+    #        with the defconfig of the device 
+    # @param valid                 False: The configuration was changed by hand (remove the record)
+    #
+    def writeUbootConfigStamp(self, valid=True):
+        stamp_file_dir = self.Uboot_build_dir+'/'+UBOOT_CONFIG_STAMP_FILE_NAME
+        try:
+            if not valid or not os.path.isfile(self.Uboot_build_dir+'/.config'):
+                if os.path.isfile(stamp_file_dir):
+                    os.remove(stamp_file_dir)
+                return
+            stamp = {'defconfig': u_boot_defconfig_list[self.Device_id], \
+                'defconfig_hash': calcFingerprint([self.U_boot_socfpga_dir+'/configs/'+ \
+                    u_boot_defconfig_list[self.Device_id]]), \
+                'config_hash': calcFingerprint([self.Uboot_build_dir+'/.config'])}
+            with open(stamp_file_dir,'w') as f:
+                json.dump(stamp,f)
+        except Exception as ex:
+            print('WARNING: Failed to write the u-boot configuration record MSG: '+str(ex))
+
+    #
+    #
+    #
+    # @brief Choose the cross compiler of the u-boot build: An installed ARM cross compiler 
+    #        or the Linaro toolchain of the chosen Intel SoC-FPGA (as fallback)
+    # @return                      Toolchain (dictionary: source, cross_compile, bin_dir, version, id)
+    #
+    def ResolveToolchain(self):
+        if not self.Toolchain == {}:
+            return self.Toolchain
+        if self.Use_host_toolchain:
+            self.Toolchain = resolveHostToolchain()
+        if self.Toolchain == {}:
+            self.Toolchain = {'source': 'linaro', 'cross_compile': 'arm-linux-gnueabihf-', \
+                'bin_dir': os.getcwd()+'/toolchain/'+gcc_toolchain_path_list[self.Device_id], \
+                'version': linaro_version_list[self.Device_id], 'id': linaro_version_list[self.Device_id]}
+        return self.Toolchain
+
+    #
+    #
+    #
+    # @brief Install the Linaro toolchain for the chosen Intel SoC-FPGA inside the toolchain store 
+    #        of the user (cache folder) in case it is not installed and link it to the 
+    #        "toolchain" folder of the project. Nothing is installed if an 
+    #        installed ARM cross compiler is used. 
+    # @return                      success
+    #
+    def InstallToolchain(self):
+        toolchain = self.ResolveToolchain()
+        if toolchain['source'] == 'host':
+            print('--> Use the installed cross compiler "'+toolchain['bin_dir']+'/'+ \
+                toolchain['cross_compile']+'gcc" (GCC '+toolchain['version']+')')
+            return True
+
+        toolchain_dir = os.getcwd()+'/toolchain'
+        version = linaro_version_list[self.Device_id]
+        print('--> Check if the linaro toolchain is installed')
+
+        # Use a toolchain installed by a previous version of this script 
+        if os.path.isdir(toolchain_dir+'/'+version) and not os.path.islink(toolchain_dir+'/'+version):
+            print('    The linaro toolchain in Version "'+version+'" is installed')
+            return True
+
+        store_dir = giveCacheDir(TOOLCHAIN_CACHE_FOLDER)
+        try:
+            with open(store_dir+'/.'+version+'.lock','w') as lock_file:
+                # Only one process at a time can install the same toolchain version 
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                if not os.path.isdir(store_dir+'/'+version):
+                    print('--> Download and unpackage the linaro toolchain "'+version+'"')
+                    if not downloadExtractArchive(linaro_url_list[self.Device_id],store_dir, \
+                            version,linaro_sha256_list[self.Device_id]):
+                        print('       Download URL: "'+linaro_url_list[self.Device_id]+'"')
+                        return False
+                    print('    == Done')
+                else:
+                    print('    The linaro toolchain in Version "'+version+'" is installed ('+store_dir+')')
+        except Exception as ex:
+            print('ERROR: Failed to install the linaro toolchain! MSG:'+str(ex))
+            return False
+
+        # Link the toolchain of the store to the project 
+        try:
+            if not os.path.isdir(toolchain_dir):
+                os.mkdir(toolchain_dir)
+            if os.path.islink(toolchain_dir+'/'+version) and \
+                not os.readlink(toolchain_dir+'/'+version) == store_dir+'/'+version:
+                os.remove(toolchain_dir+'/'+version)
+            if not os.path.islink(toolchain_dir+'/'+version):
+                os.symlink(store_dir+'/'+version,toolchain_dir+'/'+version)
+        except Exception as ex:
+            print('ERROR: Failed to link the linaro toolchain to the project! MSG:'+str(ex))
+            return False
+
+        if not os.path.isdir(toolchain_dir+'/'+version):
+            print('ERROR: The download or the unpackage of the linaro toolchain failed!')
+            print('       Download URL: "'+linaro_url_list[self.Device_id]+'"')
+            return False
+        return True
+
+    #
+    #
+    #
+    # @brief Fetch the new commits of "u-boot-socfpga". A clone of the mirror gets 
+    #        the new commits through the mirror. 
+    # @param repo                  The "u-boot-socfpga" repository (git.Repo)
+    # @param pull                  Merge the new commits of the branch 
+    #
+    def updateUbootRepo(self, repo, pull=True):
+        if repo.remotes.origin.url == giveCacheDir(GIT_MIRROR_CACHE_FOLDER)+'/'+UBOOT_MIRROR_NAME:
+            if updateGitMirror(GIT_U_BOOT_SOCFPGA_URL,UBOOT_MIRROR_NAME) == '':
+                raise Exception('The mirror update failed')
+        if pull:
+            repo.git.pull()
+        else:
+            repo.git.fetch('origin')
+
+    #
+    #
+    #
+    # @brief Check out the pinned commit of "u-boot-socfpga" and fetch it if it is not available
+    # @param repo                  The "u-boot-socfpga" repository (git.Repo)
+    #
+    def checkoutUbootCommit(self, repo):
+        try:
+            repo.git.checkout(self.Uboot_commit)
+        except Exception:
+            print('       Fetch the pinned commit')
+            self.updateUbootRepo(repo, False)
+            try:
+                repo.git.checkout(self.Uboot_commit)
+            except Exception:
+                # The commit is not part of the branch 
+                repo.git.fetch('origin',self.Uboot_commit)
+                repo.git.checkout(self.Uboot_commit)
+
+    #
+    #
+    #
+    # @brief Clone "u-boot-socfpga" to the "software/bootloader" folder of the Quartus project
+    #        or update it in case it is already available. A pinned commit that is already 
+    #        checked out is used without starting git. 
+    # @return                      success
+    #
+    def PrepareUbootSource(self):
+        # The source was already prepared before (e.g. by a parallel stage)
+        if self.Uboot_source_ready:
+            return True
+
+        # Offline fast path: The pinned commit is checked out 
+        if not self.Uboot_commit == '' and \
+            readGitHeadCommit(self.U_boot_socfpga_dir).startswith(self.Uboot_commit):
+            print('--> "u-boot-socfpga" is checked out at the pinned commit "'+self.Uboot_commit+'"')
+            self.Uboot_source_ready = True
+            return True
+
+        if not loadGit():
+            return False
+
+        if(os.path.isdir(self.U_boot_socfpga_dir)):
+            print('--> "u-boot-socfpga" is already available')
+            try:
+                repo = git.Repo(self.U_boot_socfpga_dir)
+                if self.Uboot_commit == '':
+                    print('       Pull it from Github')
+                    self.updateUbootRepo(repo)
+                else:
+                    print('       Check out the pinned commit "'+self.Uboot_commit+'"')
+                    self.checkoutUbootCommit(repo)
+            except Exception as ex:
+                if not self.Uboot_commit == '':
+                    print('ERROR: Failed to check out the commit "'+self.Uboot_commit+'" of "u-boot-socfpga"!')
+                    print('       MSG: '+str(ex))
+                    print('       Check your network connection and the value "GIT_U_BOOT_SOCFPGA_COMMIT"')
+                    return False
+                # Continue offline with the available revision 
+                print('WARNING: Failed to pull "u-boot-socfpag" from "'+GIT_U_BOOT_SOCFPGA_URL)
+                print('Branch= '+GIT_U_BOOT_SOCFPGA_BRANCH)
+                print('         The available revision "'+readGitHeadCommit(self.U_boot_socfpga_dir)+'" is used')
+                print('Try following to fix this issue:')
+                print(' x 1: Remove the folder "software/bootloader" inside the Quartus Project folder')
+                print('      To force to re-clone the repo')
+                print(' x 2: Check that the here used Branch of this repo')
+                print('      You can change the Branch with the value "GIT_U_BOOT_SOCFPGA_URL" inside the Python script!')
+
+        else:
+            mirror_dir = updateGitMirror(GIT_U_BOOT_SOCFPGA_URL,UBOOT_MIRROR_NAME)
+            if mirror_dir == '':
+                print('       Check your network connection and try it again')
+                return False
+            print('--> Cloning "u-boot-socfpga" Version ('+GIT_U_BOOT_SOCFPGA_URL+')\n')
+            print('       please wait...')
+
+            try:
+                # Only the branch is cloned; the objects are shared with the mirror 
+                repo = git.Repo.clone_from(mirror_dir, self.U_boot_socfpga_dir, branch=GIT_U_BOOT_SOCFPGA_BRANCH, \
+                    single_branch=True, shared=True, progress=giveCloneProgress())
+                if not self.Uboot_commit == '':
+                    print('       Check out the pinned commit "'+self.Uboot_commit+'"')
+                    self.checkoutUbootCommit(repo)
+            except Exception as ex:
+                print('ERROR: The cloning failed! Error Msg.:'+str(ex))
+                print('       Check your network connection and try it again')
+                print('NOTE:  The branch will be often deleted by Intel')
+                print('       check that the Branch "'+GIT_U_BOOT_SOCFPGA_BRANCH+'" exist on GitHub!')
+                
+                return False
+
+            if not os.path.isabs(self.U_boot_socfpga_dir):
+                print('ERROR: Failed to clone u-boot-socfpga!')
+                print('       Check your network connection and try it again')
+                print('NOTE:  The branch will be often deleted by Intel')
+                print('       check that the Branch "'+GIT_U_BOOT_SOCFPGA_BRANCH+'" exist on GitHub!')
+                return False
+
+            print('       cloning done')
+
+        self.Uboot_source_ready = True
+        return True
+
     #
     #
     #
     # @brief Build the bootloader for the chosen Intel SoC-FPGA
     #        and copy the output files to the depending partition folders
     # @param generation_mode       0: The User can chose how the bootloader should be build
-    #                              1: Allways build or re-build the entire bootloader 
-    #                              2: Build the entire bootloader in case it was not done
-    #                              3: Use the default pre-build bootloader for the device 
+    #                              1: Use a matching build of the build cache or 
+    #                                 build the entire bootloader in case there is none 
+    #                              2: Use the default pre-build bootloader for the device 
+    # @param use_cache             Restore the bootloader from the build cache in case the Handoff folder,  
+    #                              the defconfig, the u-boot revision, the toolchain and EDS are unchanged
+    #                              and store new builds inside the cache. Mode 1 clones or pulls 
+    #                              "u-boot-socfpga" before the lookup (it is required for the build); 
+    #                              the selection of mode 0 offers the build of the checked out revision 
+    # @param incremental_build     Do not clean the u-boot build ("make distclean") and only run the defconfig
+    #                              in case the u-boot configuration would change. Without it, an output folder  
+    #                              is only cleaned in case its configuration is not the output of the defconfig 
+    # @param parallelism           Parallelism policy of the u-boot build (BuildParallelism)
+    # @param ccache                Compiler cache policy of the u-boot build (CcachePolicy)
+    # @param clean_build           Always clean the output folder ("make distclean") before the build 
     # @return                      success
     #
-    def BuildBootloader(self, generation_mode= 0):
+    def BuildBootloader(self, generation_mode= 0, use_cache=True, incremental_build=False, \
+                        parallelism=BuildParallelism(), ccache=CcachePolicy(), clean_build=False):
     #################################### Setup u-boot with the Quartus Prime Settings  ################################################
 
         bootloader_build_required =True
         use_default_bootloader = False
+        start_menuconfig = False 
         excpath = os.getcwd()
 
+        # Look for a previous build with the same inputs inside the build cache
+        use_cached_bootloader = False
+        cache_fingerprint = ''
+        cache_available = False
+        if use_cache and generation_mode==0 and os.path.isdir(self.U_boot_socfpga_dir):
+            # The selection offers the build of the checked out revision (without network access)
+            cache_fingerprint = self.CalcBootloaderFingerprint()
+            cache_available = not cache_fingerprint == '' and \
+                os.path.isdir(giveCacheDir(BOOTLOADER_CACHE_FOLDER)+'/'+cache_fingerprint)
+
         if (self.Bootloader_available and os.path.isfile(self.Raw_folder_dir+'/'+BOOTLOADER_FILE_NAME)\
             and  generate_sfp_image_file[self.Device_id]):
             bootloader_build_required = False
 
                    # Check that the SFP output file is avalibile
-        if (not os.path.isfile(self.U_boot_socfpga_dir+'/spl/'+SFP_OUTPUT_FILE_NAME)) and \
+        if (not os.path.isfile(self.Uboot_build_dir+'/spl/'+SFP_OUTPUT_FILE_NAME)) and \
              generate_sfp_image_file[self.Device_id]:
             bootloader_build_required = False
 
         if generation_mode==1:
-            # Allways build or re-build the entire bootloader 
+            # Use a matching build of the build cache or build the entire bootloader 
             bootloader_build_required=True
+            if use_cache:
+                # The lookup needs the commit of the branch: Clone or pull "u-boot-socfpga" first
+                if not self.PrepareUbootSource():
+                    return False
+                cache_fingerprint = self.CalcBootloaderFingerprint()
+                use_cached_bootloader = not cache_fingerprint == '' and \
+                    os.path.isdir(giveCacheDir(BOOTLOADER_CACHE_FOLDER)+'/'+cache_fingerprint)
         elif generation_mode==2:
             # Use the default pre-build bootloader for the device 
             bootloader_build_required =False
@@ -949,6 +2858,10 @@ class SocfpgaPlatformGenerator:
             headline_content.append('Build/Rebuild the bootloader')
             if not bootloader_build_required:
                 headline_content.append('Continue without rebuilding the bootloader')
+            cache_selection = 'Use the bootloader of a previous build with the same inputs '+ \
+                                '(build cache; checked out u-boot revision)'
+            if cache_available:
+                headline_content.append(cache_selection)
 
             BootSelchoose = printSelectionTable(headline,headline_table,headline_content,[],True,20)
             bootloader_build_required = True
@@ -957,6 +2870,8 @@ class SocfpgaPlatformGenerator:
                 (not self.UbootIMG_default_preBuild_dir =='' or not self.UbootSFP_default_preBuild_dir ==''):
                 use_default_bootloader = True
                 bootloader_build_required=False
+            elif headline_content[BootSelchoose-1] == cache_selection:
+                use_cached_bootloader = True
                
             
         # Find the RAW Partition and 
@@ -974,9 +2889,19 @@ class SocfpgaPlatformGenerator:
             print('ERROR: The chosen partition table no VFAT/FAT32 partition.')
             print('       That is necessary for the bootloader')
             return False
+    ############################################  Use the bootloader of the build cache   ################################################
+        if use_cached_bootloader:
+            print('--> Use the bootloader of the build cache ('+cache_fingerprint[:12]+')')
+            if self.RestoreBootloaderFromCache(cache_fingerprint):
+                self.BuildReport['bootloader_source'] = 'cache'
+                print('     = Done')
+                return True
+            print('NOTE: The build cache entry is not complete! The bootloader will be built')
     ############################################  Use the default pre-build bootloader   ################################################
         if use_default_bootloader: 
             print('--> Use the default pre-build bootloader')
+            self.BuildReport['bootloader_source'] = 'default'
+
             if not os.path.isdir(excpath+'/ubootDefaultSFP'):
                 print('ERROR: The u-boot default pre-build folder "ubootDefaultSFP" is not available')
                 return False
@@ -1007,115 +2932,77 @@ class SocfpgaPlatformGenerator:
             
     ################################################  Install the Linaro toolchain  #####################################################
         if bootloader_build_required:
-            toolchain_dir = excpath+'/toolchain'
-            print('--> Check if the linaro toolchain is installed')
-            if not os.path.isdir(toolchain_dir+'/'+linaro_version_list[self.Device_id]):
-                if not os.path.isdir(toolchain_dir):
-                    os.mkdir(toolchain_dir)
-                
-                if not os.path.isfile(toolchain_dir+'/'+linaro_version_list[self.Device_id]+'.tar.xz'):
-                    print('--> Download the linaro toolchain "'+linaro_version_list[self.Device_id]+'"')
-                    try:
-                        wget.download(linaro_url_list[self.Device_id], out=toolchain_dir)
-                    except Exception as ex:
-                        print('\nERROR: Failed to download with wget! MSG:'+str(ex))
-                        print('       Download URL: "'+linaro_url_list[self.Device_id]+'"')
-                        return False
-                if os.path.isfile(toolchain_dir+'/'+linaro_version_list[self.Device_id]+'.tar.xz'):
-                    print('\n--> Unpackage the linaro toolchain archive file')
-                    try:
-                        os.system('tar xf '+toolchain_dir+'/'+ \
-                                linaro_version_list[self.Device_id]+'.tar.xz -C '+toolchain_dir)
-                    except subprocess.CalledProcessError:
-                        print('ERROR: Failed to unpackage the linaro toolchain!')
-                        return False
-                    print('    == Done')
-                    print('--> Remove the linaro archive file')
-                    try:
-                        shutil.rmtree(toolchain_dir+'/'+ \
-                                linaro_version_list[self.Device_id]+'.tar.xz')
-                    except Exception:
-                        print('ERROR: Failed to remove the linaro archive file')
-                    print('    == Done')
-
-                if not os.path.isdir(toolchain_dir+'/'+linaro_version_list[self.Device_id]):
-                    print('ERROR: The download or the unpackage of the linaro toolchain failed!')
-                    print('       Download URL: "'+linaro_url_list[self.Device_id]+'"')
-                    return False
-            else:
-                print('    The linaro toolchain in Version "'+linaro_version_list[self.Device_id]+ \
-                        '" is installed')
-
-            # Define the EXPORT value to the toolchain path
-            export_path_cmd ='export PATH='+'`pwd`/toolchain/'+gcc_toolchain_path_list[self.Device_id]+'\n'
+            if not self.InstallToolchain():
+                return False
+            self.BuildReport['bootloader_toolchain'] = self.Toolchain
+
+            # Environment of the cross compiler 
+            toolchain_path_add = [self.Toolchain['bin_dir']]
+            toolchain_env_add = {'CROSS_COMPILE': self.Toolchain['cross_compile'], 'ARCH': 'arm'}
+
+            # Choose the number of make jobs for this host 
+            parallelism_info = resolveBuildParallelism(parallelism)
+            self.BuildReport['bootloader_parallelism'] = parallelism_info
+            make_cmd = ['make','-j',str(parallelism_info['jobs'])]
+            if parallelism_info['max_load'] > 0:
+                make_cmd += ['-l',str(parallelism_info['max_load'])]
+            print('    Build parallelism: '+str(parallelism_info['jobs'])+' jobs (limited by: '+ \
+                    parallelism_info['limited_by']+')')
+
+            # Compile with the compiler cache: The compilers are replaced with "ccache <compiler>"
+            make_vars = []
+            ccache_env = {}
+            ccache_stats = {}
+            if ccache.enabled:
+                if shutil.which('ccache') is None:
+                    print('NOTE: "ccache" is not installed; the u-boot build runs without a compiler cache')
+                else:
+                    ccache_env = {'CCACHE_DIR': ccache.cache_dir, \
+                        # Paths inside the source and the output folders ("software/bootloader") are 
+                        # hashed relative to allow hits across projects
+                        'CCACHE_BASEDIR': self.Quartus_bootloder_dir, 'CCACHE_NOHASHDIR': '1'}
+                    if ccache_env['CCACHE_DIR'] == '':
+                        ccache_env['CCACHE_DIR'] = giveCacheDir(CCACHE_CACHE_FOLDER)
+                    toolchain_env_add.update(ccache_env)
+                    env = dict(os.environ)
+                    env.update(ccache_env)
+                    if not ccache.max_size == '':
+                        runCommand(['ccache','-M',ccache.max_size], None, env, 60, False)
+                    ccache_stats = readCcacheStats(env)
+                    make_vars = ['CC=ccache '+toolchain_env_add['CROSS_COMPILE']+'gcc', 'HOSTCC=ccache gcc']
+                    make_cmd += make_vars
+                    print('    Compiler cache: "'+ccache_env['CCACHE_DIR']+'" (max. size: '+ccache.max_size+')')
 
     ################################################  Build the bootloader #####################################################
-            print('--> Start the Intel Embedded Command Shell')
             try:
                 # Only for the Cyclone V
                 if self.Device_id==0:
-                    # Create the BSP package for the device with the Intel EDS shell
-                    with subprocess.Popen(self.EDS_Folder+'/'+EDS_EMBSHELL_DIR, stdin=subprocess.PIPE) as edsCmdShell:
-                        time.sleep(DELAY_MS)
-                        
+                    # The BSP of the last build is used if the handoff folder is unchanged
+                    bsp_fingerprint = calcFingerprint([self.Quartus_proj_top_dir+'/'+self.Handoff_folder_name], \
+                                        [self.Socfpga_devices_list[self.Device_id], self.EDS_Folder])
+                    bsp_stamp_file_dir = self.Quartus_bootloder_dir+'/'+BSP_STAMP_FILE_NAME
+                    if loadJsonFile(bsp_stamp_file_dir).get('fingerprint') == bsp_fingerprint and \
+                        os.path.isdir(self.Quartus_proj_top_dir+'/software/bootloader/generated') and \
+                        os.path.isfile(self.Quartus_proj_top_dir+'/software/bootloader/settings.bsp'):
+                        print('--> The Board Support Package (BSP) of the last build is up to date')
+                    else:
+                        # Create the BSP package for the device with the Intel EDS tools
                         print('--> Generate the Board Support Package (BSP) for the Quartus Prime configuration')
-                        b = bytes(' cd '+self.Quartus_proj_top_dir+"\n", 'utf-8')
-                        edsCmdShell.stdin.write(b) 
-
-                        b = bytes('bsp-create-settings --type spl --bsp-dir software/bootloader '+ \
-                                '--preloader-settings-dir "'+self.Handoff_folder_name+'" ' +\
-                                '--settings software/bootloader/settings.bsp\n','utf-8')
-
-                        edsCmdShell.stdin.write(b)
-                        edsCmdShell.communicate()
-                    
-                    # Check that BSP generation is okay
-                    if not os.path.isdir(self.Quartus_proj_top_dir+'/software/bootloader/generated') or \
-                        not os.path.isfile(self.Quartus_proj_top_dir+'/software/bootloader/settings.bsp'):
-                        print('ERROR: The BSP generation failed!')
-                        return False
+                        if not self.RunEdsCommand(['bsp-create-settings','--type','spl','--bsp-dir','software/bootloader', \
+                                    '--preloader-settings-dir',self.Handoff_folder_name, \
+                                    '--settings','software/bootloader/settings.bsp'],self.Quartus_proj_top_dir):
+                            return False
+                        
+                        # Check that BSP generation is okay
+                        if not os.path.isdir(self.Quartus_proj_top_dir+'/software/bootloader/generated') or \
+                            not os.path.isfile(self.Quartus_proj_top_dir+'/software/bootloader/settings.bsp'):
+                            print('ERROR: The BSP generation failed!')
+                            return False
+                        storeJsonFile(bsp_stamp_file_dir,{'fingerprint': bsp_fingerprint})
                 
     ####################################################### Clone "u-boot-socfpga" ################################################
-                if(os.path.isdir(self.U_boot_socfpga_dir)):
-                    print('--> "u-boot-socfpga" is already available')
-                    print('       Pull it from Github')
-                    try:
-
-                        g = git.cmd.Git(self.U_boot_socfpga_dir)
-                        g.pull()
-                    except Exception as ex:
-                        print('ERROR: Failed to pull "u-boot-socfpag" from "'+GIT_U_BOOT_SOCFPGA_URL)
-                        print('Branch= '+GIT_U_BOOT_SOCFPGA_BRANCH)
-                        print('Try following to fix this issue:')
-                        print(' x 1: Remove the folder "software/bootloader" inside the Quartus Project folder')
-                        print('      To force to re-clone the repo')
-                        print(' x 2: Check that the here used Branch of this repo')
-                        print('      You can change the Branch with the value "GIT_U_BOOT_SOCFPGA_URL" inside the Python script!')
-                        sys.exit()
-
-                    
-                else:
-                    print('--> Cloning "u-boot-socfpga" Version ('+GIT_U_BOOT_SOCFPGA_URL+')\n')
-                    print('       please wait...')
-
-                    try:
-                        git.Repo.clone_from(GIT_U_BOOT_SOCFPGA_URL, self.U_boot_socfpga_dir, branch=GIT_U_BOOT_SOCFPGA_BRANCH, progress=CloneProgress())
-                    except Exception as ex:
-                        print('ERROR: The cloning failed! Error Msg.:'+str(ex))
-                        print('       Check your network connection and try it again')
-                        print('NOTE:  The branch will be often deleted by Intel')
-                        print('       check that the Branch "'+GIT_U_BOOT_SOCFPGA_BRANCH+'" exist on GitHub!')
-                        
-                        return False
-
-                    if not os.path.isabs(self.U_boot_socfpga_dir):
-                        print('ERROR: Failed to clone u-boot-socfpga!')
-                        print('       Check your network connection and try it again')
-                        print('NOTE:  The branch will be often deleted by Intel')
-                        print('       check that the Branch "'+GIT_U_BOOT_SOCFPGA_BRANCH+'" exist on GitHub!')
-                        return False
-
-                    print('       cloning done')
+                if not self.PrepareUbootSource():
+                    return False
 
     ################################################## Find the EDS Filter script ##############ä####################################
                 # Only if it is required for the device
@@ -1129,78 +3016,97 @@ class SocfpgaPlatformGenerator:
                         return False
  
         ####################################################### Run EDS filter script ################################################
-                    print('--> Run the Intel EDS Filter script')
                     output_file_dir = self.Quartus_bootloder_dir+\
                             '/u-boot-socfpga/arch/arm/dts/socfpga_arria10_socdk_sdmmc_handoff.h'
                     preloader_deviceTree_dir= self.Quartus_bootloder_dir+\
                             '/u-boot-socfpga/arch/arm/dts/'+preloader_deviceTree_name[self.Device_id]
                     
+                    # Inputs of the filter script: handoff folder, filter script and BSP
+                    filter_input_list = [self.Quartus_proj_top_dir+'/'+self.Handoff_folder_name, \
+                                        self.U_boot_socfpga_dir+eds_filter_script_dir]
                     if self.Device_id<2:
-                        ####### For the Intel Cyclone V or Arria V SoC FPGA
-                        # Find the BPS for the selected device inside u-boot
                         u_boot_bsp_qts_dir=u_boot_bsp_qts_dir_list[self.Device_id]
-                        if not os.path.isdir(self.U_boot_socfpga_dir+'/'+u_boot_bsp_qts_dir):
-                            print('Error: The u-boot BSP QTS direcorory is for the device not available!')
-                            print('       '+u_boot_bsp_qts_dir)
+                        filter_input_list += [self.Quartus_bootloder_dir+'/settings.bsp', \
+                                            self.Quartus_bootloder_dir+'/generated']
+                        filter_output_dir = self.U_boot_socfpga_dir+'/'+u_boot_bsp_qts_dir
+                    else:
+                        filter_output_dir = output_file_dir
+                    filter_fingerprint = calcFingerprint(filter_input_list,[self.Socfpga_devices_list[self.Device_id]])
+                    filter_stamp_file_dir = self.U_boot_socfpga_dir+'/'+QTS_FILTER_STAMP_FILE_NAME
+                    filter_stamp = loadJsonFile(filter_stamp_file_dir)
+
+                    # The headers of the last run are used unchanged (with their modification time)
+                    if filter_stamp.get('fingerprint') == filter_fingerprint and \
+                        filter_stamp.get('output') == calcFingerprint([filter_output_dir]) and \
+                        os.path.exists(filter_output_dir):
+                        print('--> The output of the Intel EDS Filter script of the last build is up to date')
+
+                    else:
+                        print('--> Run the Intel EDS Filter script')
+                        # The script writes to a temporary folder; only changed files are copied 
+                        filter_temp_dir = tempfile.mkdtemp(prefix='.qts_filter.',dir=self.Quartus_bootloder_dir)
+                        
+                        if self.Device_id<2:
+                            ####### For the Intel Cyclone V or Arria V SoC FPGA
+                            # Find the BPS for the selected device inside u-boot
+                            if not os.path.isdir(self.U_boot_socfpga_dir+'/'+u_boot_bsp_qts_dir):
+                                print('Error: The u-boot BSP QTS direcorory is for the device not available!')
+                                print('       '+u_boot_bsp_qts_dir)
+                                shutil.rmtree(filter_temp_dir, ignore_errors=True)
+                                return False
+                            #
+                            # 
+                            # soc_type      - Type of SoC, either 'cyclone5' or 'arria5'.
+                            # input_qts_dir - Directory with compiled Quartus project
+                            #                and containing the Quartus project file (QPF).
+                            # input_bsp_dir - Directory with generated bsp containing
+                            #                 the settings.bsp file.
+                            # output_dir    - Directory to store the U-Boot compatible
+                            #                 headers.
+                            qts_fitter_cmd = [self.U_boot_socfpga_dir+eds_filter_script_dir, \
+                                            self.Socfpga_devices_list[self.Device_id],'../../../','../', \
+                                            filter_temp_dir]
+                        else: 
+                            ####### For the Intel Arria 10 SoC FPGA
+                            if not os.path.isfile(self.Quartus_proj_top_dir+'/'+\
+                                self.Handoff_folder_name+'/hps.xml'):
+                                print('ERROR: The file "'+self.Handoff_folder_name+'/hps.xml'+'"'+\
+                                    ' does not exist!')
+                                sys.exit(1)
+                            '''
+                            if os.path.isfile(preloader_deviceTree_dir):
+                                try:
+                                    os.remove(preloader_deviceTree_dir)
+                                except Exception:
+                                    print('ERROR: Failed to remove the old primary deviceTree file!')
+                                    sys.exit(1)
+                            '''
+                            # 
+                            # cd $TOP_FOLDER/a10_soc_devkit_ghrd/software/bootloader/u-boot-socfpga
+                            #    ./arch/arm/mach-socfpga/qts-filter-a10.sh \
+                            #    ../../../hps_isw_handoff/hps.xml \
+                            #    arch/arm/dts/socfpga_arria10_socdk_sdmmc_handoff.h
+                            qts_fitter_cmd = [self.U_boot_socfpga_dir+eds_filter_script_dir, \
+                                            self.Quartus_proj_top_dir+'/'+self.Handoff_folder_name+'/hps.xml', \
+                                            filter_temp_dir+'/'+os.path.basename(output_file_dir)]
+
+                        if not self.RunEdsCommand(qts_fitter_cmd,self.U_boot_socfpga_dir):
+                            shutil.rmtree(filter_temp_dir, ignore_errors=True)
                             return False
-                        #
-                        # 
-                        # soc_type      - Type of SoC, either 'cyclone5' or 'arria5'.
-                        # input_qts_dir - Directory with compiled Quartus project
-                        #                and containing the Quartus project file (QPF).
-                        # input_bsp_dir - Directory with generated bsp containing
-                        #                 the settings.bsp file.
-                        # output_dir    - Directory to store the U-Boot compatible
-                        #                 headers.
-                        qts_fitter_cmd = './'+eds_filter_script_dir+' '+\
-                                        self.Socfpga_devices_list[self.Device_id]+' ../../../ ../ '+ \
-                                        '.'+u_boot_bsp_qts_dir+'  \n'
-                    else: 
-                        ####### For the Intel Arria 10 SoC FPGA
-                        if not os.path.isfile(self.Quartus_proj_top_dir+'/'+\
-                            self.Handoff_folder_name+'/hps.xml'):
-                            print('ERROR: The file "'+self.Handoff_folder_name+'/hps.xml'+'"'+\
-                                ' does not exist!')
-                            sys.exit()
-
-                        # Remove the output files 
-                        if os.path.isfile(output_file_dir):
-                            try:
-                                os.remove(output_file_dir)
-                            except Exception:
-                                print('ERROR: Failed to remove the old output file!')
-                                sys.exit()
-                        '''
-                        if os.path.isfile(preloader_deviceTree_dir):
-                            try:
-                                os.remove(preloader_deviceTree_dir)
-                            except Exception:
-                                print('ERROR: Failed to remove the old primary deviceTree file!')
-                                sys.exit()
-                        '''
-                        # 
-                        # cd $TOP_FOLDER/a10_soc_devkit_ghrd/software/bootloader/u-boot-socfpga
-                        #    ./arch/arm/mach-socfpga/qts-filter-a10.sh \
-                        #    ../../../hps_isw_handoff/hps.xml \
-                        #    arch/arm/dts/socfpga_arria10_socdk_sdmmc_handoff.h
-                        qts_fitter_cmd = './'+eds_filter_script_dir+' '+\
-                                        self.Quartus_proj_top_dir+'/'+self.Handoff_folder_name+'/hps.xml '+\
-                                        output_file_dir+' \n'
-
-                    with subprocess.Popen(self.EDS_Folder+'/'+EDS_EMBSHELL_DIR, stdin=subprocess.PIPE) as edsCmdShell:
-                        time.sleep(DELAY_MS)
-                        b = bytes('cd '+self.Quartus_proj_top_dir+'/software/bootloader/u-boot-socfpga \n','utf-8')
-                        edsCmdShell.stdin.write(b) 
-             
-                        b = bytes(qts_fitter_cmd,'utf-8')
-                        edsCmdShell.stdin.write(b) 
-                        #time.sleep(10*DELAY_MS)
-
-                        edsCmdShell.communicate()
-                        time.sleep(3*DELAY_MS)
+
+                        if self.Device_id<2:
+                            changed_list = copyChangedFiles(filter_temp_dir,filter_output_dir)
+                        else:
+                            changed_list = []
+                            if os.path.isfile(filter_temp_dir+'/'+os.path.basename(output_file_dir)):
+                                changed_list = copyChangedFiles(filter_temp_dir,os.path.dirname(output_file_dir))
+                        shutil.rmtree(filter_temp_dir, ignore_errors=True)
+                        print('    Changed headers: '+str(changed_list))
+                        storeJsonFile(filter_stamp_file_dir,{'fingerprint': filter_fingerprint, \
+                            'output': calcFingerprint([filter_output_dir])})
             
             except Exception as ex:
-                print('ERROR: Failed to start the Intel EDS Command Shell! MSG:'+ str(ex))
+                print('ERROR: Failed to prepare the u-boot build! MSG:'+ str(ex))
                 return False
 
             if self.Device_id==2 and not os.path.isfile(output_file_dir):
@@ -1225,7 +3131,6 @@ class SocfpgaPlatformGenerator:
             # For the Intel Arria 10 SX: decompile the auto generated DeviceTree
             #if self.Device_id==2: 
 
-            start_menuconfig = False 
             run_defconfig =True
 
             if generation_mode==0:
@@ -1244,47 +3149,63 @@ class SocfpgaPlatformGenerator:
                     run_defconfig = False
 
         ###################################################   Build u-boot  ################################################
-            print('--> Start the Intel Embedded Command Shell')
-            try:
-                with subprocess.Popen(self.EDS_Folder+'/'+EDS_EMBSHELL_DIR, stdin=subprocess.PIPE) as edsCmdShell:
-                    time.sleep(DELAY_MS)
-                    print('--> Compile "u-boot-socfpga"')
-
-                    b = bytes(' cd '+self.Quartus_proj_top_dir+'/software/bootloader/u-boot-socfpga \n', 'utf-8')
-                    edsCmdShell.stdin.write(b) 
-
-                    b =bytes(export_path_cmd,'utf-8')
-                    edsCmdShell.stdin.write(b) 
-        
-                    b = bytes('export CROSS_COMPILE=arm-linux-gnueabihf- \n','utf-8')
-                    edsCmdShell.stdin.write(b) 
-
-                    b = bytes('export ARCH=arm \n','utf-8')
-                    edsCmdShell.stdin.write(b) 
+            # The source folder must be clean for builds with an output folder (of previous versions) 
+            if os.path.isfile(self.U_boot_socfpga_dir+'/.config'):
+                print('--> Clean the build inside the "u-boot-socfpga" source folder')
+                if not self.RunEdsCommand(['make','mrproper'],self.U_boot_socfpga_dir,toolchain_env_add, \
+                        toolchain_path_add,UBOOT_BUILD_TIMEOUT_S):
+                    return False
 
-                    if run_defconfig: 
+            make_cmd_list = []
+            if not start_menuconfig:
+                # Every device and defconfig has its own output folder 
+                self.Uboot_build_dir = self.giveUbootBuildDir()
+                print('--> Compile "u-boot-socfpga" (output folder: "'+ \
+                    os.path.relpath(self.Uboot_build_dir,self.Quartus_bootloder_dir)+'")')
+                # A folder of an earlier build with the current defconfig is built again incrementally
+                if not clean_build and self.isUbootConfigCurrent():
+                    print('    The u-boot configuration is up to date (incremental build)')
+                else:
+                    if clean_build or not incremental_build:
                         # Clean make
-                        b = bytes('make distclean \n','utf-8')
-                        edsCmdShell.stdin.write(b) 
-                        
-                        # Make diskclean 
-                        b = bytes('make '+u_boot_defconfig_list[self.Device_id]+'\n','utf-8')   
-                        edsCmdShell.stdin.write(b) 
-                    if not start_menuconfig: 
-                        # Make 
-                        b = bytes('make -j 24 \n','utf-8')
-                        edsCmdShell.stdin.write(b) 
-
-                    edsCmdShell.communicate()
-                    time.sleep(DELAY_MS)
-            
-            except Exception as ex:
-                print('ERROR: Failed to start the Intel EDS Command Shell! MSG:'+ str(ex))
-                return False
+                        make_cmd_list.append(['make','O='+self.Uboot_build_dir,'distclean'])
+                    # Make diskclean 
+                    make_cmd_list.append(['make','O='+self.Uboot_build_dir,u_boot_defconfig_list[self.Device_id]]+make_vars)
+                
+                for cmd in make_cmd_list:
+                    if not self.RunEdsCommand(cmd,self.U_boot_socfpga_dir,toolchain_env_add,toolchain_path_add, \
+                            UBOOT_BUILD_TIMEOUT_S):
+                        return False
+                make_cmd_list = []
+
+                # Remember that the ".config" file is the defconfig output to allow incremental builds
+                self.writeUbootConfigStamp()
 
             ################################################### Start menuconfig ###################################################
             # Start menuconfig for "u-boot-socfpga"
             if start_menuconfig:
+                # The configuration starts with the output folder of the defconfig or of the last build  
+                if run_defconfig:
+                    self.Uboot_build_dir = self.giveUbootBuildDir()
+                    if not self.isUbootConfigCurrent():
+                        if not self.RunEdsCommand(['make','O='+self.Uboot_build_dir, \
+                                u_boot_defconfig_list[self.Device_id]]+make_vars,self.U_boot_socfpga_dir, \
+                                toolchain_env_add,toolchain_path_add,UBOOT_BUILD_TIMEOUT_S):
+                            return False
+                        self.writeUbootConfigStamp()
+                start_build_dir = self.Uboot_build_dir
+
+                # The configuration is changed inside the menuconfig folder (it is kept to build the 
+                # configuration tools only once)
+                menuconfig_build_dir = self.giveUbootBuildDir('menuconfig')
+                os.makedirs(menuconfig_build_dir,exist_ok=True)
+                if os.path.isfile(start_build_dir+'/.config'):
+                    if not (os.path.isfile(menuconfig_build_dir+'/.config') and filecmp.cmp( \
+                            start_build_dir+'/.config',menuconfig_build_dir+'/.config',shallow=False)):
+                        shutil.copy2(start_build_dir+'/.config',menuconfig_build_dir+'/.config')
+                elif os.path.isfile(menuconfig_build_dir+'/.config'):
+                    os.remove(menuconfig_build_dir+'/.config')
+
                 # Create "menuconfig.sh" shell script for starting menuconfig
                 if os.path.isfile('menuconfig.sh'):
                     try:
@@ -1296,7 +3217,7 @@ class SocfpgaPlatformGenerator:
                     f.write('#!/bin/sh\n')
                     f.write('export TOP_FOLDER=`pwd`\n')
                     f.write('cd && cd '+self.Quartus_proj_top_dir+'/software/bootloader/u-boot-socfpga\n')
-                    f.write('make menuconfig\n')
+                    f.write('make O='+menuconfig_build_dir+' menuconfig\n')
                     f.write('cd $TOP_FOLDER\n')
                 if not os.path.isfile('menuconfig.sh'):
                     print('ERROR: Failed to create "menuconfig.sh" script')
@@ -1317,106 +3238,126 @@ class SocfpgaPlatformGenerator:
                     except Exception:
                         print('ERROR: Failed to remove menuconfig.sh')
 
-                # Build u-boot with the menuconfig changes 
-                try:
-                    with subprocess.Popen(self.EDS_Folder+'/'+EDS_EMBSHELL_DIR, stdin=subprocess.PIPE) as edsCmdShell:
-                        time.sleep(DELAY_MS)
-                        print('--> Compile "u-boot-socfpga"')
-
-                        b = bytes(' cd '+self.Quartus_proj_top_dir+'/software/bootloader/u-boot-socfpga \n', 'utf-8')
-                        edsCmdShell.stdin.write(b) 
-
-                        b =bytes(export_path_cmd,'utf-8')
-                        edsCmdShell.stdin.write(b) 
-
-                        b = bytes('export CROSS_COMPILE=arm-linux-gnueabihf- \n','utf-8')
-                        edsCmdShell.stdin.write(b) 
-
-                        b = bytes('export ARCH=arm \n','utf-8')
-                        edsCmdShell.stdin.write(b) 
-
-                        b = bytes('make -j 24 \n','utf-8')
-                        edsCmdShell.stdin.write(b) 
-
-                        edsCmdShell.communicate()
-                        time.sleep(DELAY_MS)
-                
-                except Exception as ex:
-                    print('ERROR: Failed to start the Intel EDS Command Shell! MSG:'+ str(ex))
+                # The output folder is named after the configuration: An earlier build with 
+                # the same configuration is continued. A new configuration starts with a copy of the 
+                # output folder of the start configuration (make only rebuilds the changed parts)
+                self.Uboot_build_dir = self.giveUbootBuildDir(calcFingerprint([menuconfig_build_dir+'/.config']))
+                if not os.path.isdir(self.Uboot_build_dir) and os.path.isdir(start_build_dir) and \
+                        not start_build_dir == menuconfig_build_dir:
+                    print('--> Copy the output folder "'+os.path.basename(start_build_dir)+ \
+                        '" for the new configuration')
+                    temp_build_dir = tempfile.mkdtemp(prefix='.'+os.path.basename(self.Uboot_build_dir)+'.', \
+                                        dir=os.path.dirname(self.Uboot_build_dir))
+                    try:
+                        shutil.copytree(start_build_dir,temp_build_dir,symlinks=True,dirs_exist_ok=True)
+                        os.rename(temp_build_dir,self.Uboot_build_dir)
+                    except Exception as ex:
+                        print('WARNING: Failed to copy the output folder MSG:'+str(ex))
+                        shutil.rmtree(temp_build_dir, ignore_errors=True)
+                copyChangedFiles(menuconfig_build_dir,self.Uboot_build_dir)
+                if clean_build:
+                    make_cmd_list.append(['make','O='+self.Uboot_build_dir,'clean'])
+                self.writeUbootConfigStamp(False)
+                print('--> Compile "u-boot-socfpga" (output folder: "'+ \
+                    os.path.relpath(self.Uboot_build_dir,self.Quartus_bootloder_dir)+'")')
+
+            for cmd in make_cmd_list:
+                if not self.RunEdsCommand(cmd,self.U_boot_socfpga_dir,toolchain_env_add,toolchain_path_add, \
+                        UBOOT_BUILD_TIMEOUT_S):
                     return False
 
-            # Check that u-boot output file is there 
-            if not os.path.isfile(self.U_boot_socfpga_dir+'/'+BOOTLOADER_FILE_NAME) or \
-                not os.path.isfile(self.U_boot_socfpga_dir+'/'+'u-boot.img'):
-                print('ERROR: u-boot build failed!')
-                return False
-
-            # Read the creation date of the output files to check that the files are new
-            modification_time = os.path.getmtime(self.U_boot_socfpga_dir+'/'+BOOTLOADER_FILE_NAME) 
-            current_time =  datetime.now().timestamp()
+            # Build u-boot (with the menuconfig changes): only the targets used by the generator
+            target_report = []
+            target_list = u_boot_make_target_list[self.Device_id]
+            for target_no, (target, output_file) in enumerate(target_list):
+                print('    ['+str(target_no+1)+'/'+str(len(target_list))+'] make '+target)
+                start_time = time.monotonic()
+                if not self.RunEdsCommand(make_cmd+['O='+self.Uboot_build_dir,target],self.U_boot_socfpga_dir, \
+                        toolchain_env_add,toolchain_path_add,UBOOT_BUILD_TIMEOUT_S):
+                    return False
+                duration_s = round(time.monotonic()-start_time,1)
+                target_report.append({'target': target, 'output': output_file, 'time_s': duration_s})
+                print('          "'+output_file+'" done after '+str(duration_s)+'s')
+            self.BuildReport['bootloader_targets'] = target_report
 
-            # Offset= 5 min 
-            if modification_time+ 5*60 < current_time:
-                print('Error: u-boot build failed!')
+            # The link "current" points to the output folder of the last build 
+            current_build_dir = self.Quartus_bootloder_dir+'/'+UBOOT_BUILD_FOLDER+'/'+UBOOT_CURRENT_BUILD_NAME
+            try:
+                if os.path.islink(current_build_dir):
+                    os.remove(current_build_dir)
+                os.symlink(os.path.basename(self.Uboot_build_dir),current_build_dir)
+            except Exception as ex:
+                print('WARNING: Failed to link the output folder of the last build MSG:'+str(ex))
+
+            # Check that u-boot output files are there 
+            # (A failed make call aborts the build with its exit code)
+            for target, output_file in target_list:
+                if not os.path.isfile(self.Uboot_build_dir+'/'+output_file):
+                    print('ERROR: u-boot build failed!')
+                    print('       The make target "'+target+'" did not generate "'+output_file+'"')
+                    return False
 
             print('--> "u-boot-socfpga" build was successfully')
+
+            # Report the hits and misses of the compiler cache during this build 
+            if not ccache_env == {}:
+                env = dict(os.environ)
+                env.update(ccache_env)
+                ccache_stats_now = readCcacheStats(env)
+                if ccache_stats == {} or ccache_stats_now == {}:
+                    self.BuildReport['bootloader_ccache'] = 'unavailable'
+                    print('    Compiler cache: The statistics of this ccache version are unavailable')
+                else:
+                    ccache_report = {}
+                    for key in ['direct_cache_hit','preprocessed_cache_hit','cache_miss']:
+                        ccache_report[key] = ccache_stats_now[key]-ccache_stats[key]
+                    self.BuildReport['bootloader_ccache'] = ccache_report
+                    print('    Compiler cache: '+str(ccache_report['direct_cache_hit']+ \
+                        ccache_report['preprocessed_cache_hit'])+' hits, '+str(ccache_report['cache_miss'])+' misses')
         
     ####################################### Create the bootable SFP (for Arria 10) #######################################
             if not generate_sfp_image_file[self.Device_id]: 
                 # Only for the Intel Arria 10 SX
                 print('---> Generate the bootable SFP (for the BootROM of the Arria 10)')
-                if not os.path.isfile(self.U_boot_socfpga_dir+'/'+U_BOOT_IMAGE_FILE_NAME):
+                if not os.path.isfile(self.Uboot_build_dir+'/'+U_BOOT_IMAGE_FILE_NAME):
                     print('ERROR: The u-boot output file "u-boot.img" does not exsist!')
                     print('        The u-boot build faild!')
                     return False
-                if not os.path.isdir(self.U_boot_socfpga_dir+'/spl'):
+                if not os.path.isdir(self.Uboot_build_dir+'/spl'):
                     print('ERROR: The u-boot output folder "/spl" does not exsist!')
                     print('        A proper bootloader generation is not posibile!')
                     return False
-                if not os.path.isfile(self.U_boot_socfpga_dir+'/spl/'+SFP_INPUT_FILE_NAME):
+                if not os.path.isfile(self.Uboot_build_dir+'/spl/'+SFP_INPUT_FILE_NAME):
                     print('ERROR: The bootloader generation failed!')
                     print('       The output file "'+SFP_INPUT_FILE_NAME+'" was')
                     print('       not generated during compilation of u-boot!')
                     return False
-                try:
-                    with subprocess.Popen(self.EDS_Folder+'/'+EDS_EMBSHELL_DIR, stdin=subprocess.PIPE) as edsCmdShell:
-                        time.sleep(DELAY_MS)
-                        b = bytes('cd '+self.U_boot_socfpga_dir+'/spl\n','utf-8')
-                        edsCmdShell.stdin.write(b) 
-                        #
-                        # mkpimage -hv 1 -o spl/spl_w_dtb-mkpimage.bin \
-                        # spl/u-boot-spl-dtb.bin spl/u-boot-spl-dtb.bin \
-                        # spl/u-boot-spl-dtb.bin spl/u-boot-spl-dtb.bin
-                        #
-                        # --- mkpimage ---
-                        # Description: This tool creates an Altera BootROM-compatible image of Second
-                        # Stage Boot Loader (SSBL). The input and output files are in binary format.
-                        # It can also decode and check the validity of previously generated image.
-                        #
-                        # to create a quad image: 
-                        # mkpimage [options] -hv <num> -o <outfile> <infile> <infile> <infile> <infile>
-                        #
-                        #   -hv ->  Header version to be created (Arria/Cyclone V = 0, Arria 10 = 1)
-                        #   -o  -> Output file, relative and absolute path supported
-
-                        b = bytes(' mkpimage -hv 1 -o '+SFP_OUTPUT_FILE_NAME+' '+SFP_INPUT_FILE_NAME+\
-                            ' '+SFP_INPUT_FILE_NAME+' '+SFP_INPUT_FILE_NAME+' '\
-                                +SFP_INPUT_FILE_NAME+' \n','utf-8')
-
-                        edsCmdShell.stdin.write(b) 
-                        #time.sleep(10*DELAY_MS)
-
-                        edsCmdShell.communicate()
-                        time.sleep(3*DELAY_MS)
-                except Exception as ex:
-                    print('ERROR: Failed to start the Intel EDS Command Shell! MSG:'+ str(ex))
+                #
+                # Same output as: 
+                # mkpimage -hv 1 -o spl/spl_w_dtb-mkpimage.bin \
+                # spl/u-boot-spl-dtb.bin spl/u-boot-spl-dtb.bin \
+                # spl/u-boot-spl-dtb.bin spl/u-boot-spl-dtb.bin
+                #
+                # --- mkpimage ---
+                # Description: This tool creates an Altera BootROM-compatible image of Second
+                # Stage Boot Loader (SSBL). The input and output files are in binary format.
+                # It can also decode and check the validity of previously generated image.
+                #
+                # to create a quad image: 
+                # mkpimage [options] -hv <num> -o <outfile> <infile> <infile> <infile> <infile>
+                #
+                #   -hv ->  Header version to be created (Arria/Cyclone V = 0, Arria 10 = 1)
+                #   -o  -> Output file, relative and absolute path supported
+                if not writeBootRomImage(self.Uboot_build_dir+'/spl/'+SFP_INPUT_FILE_NAME, \
+                            self.Uboot_build_dir+'/spl/'+SFP_OUTPUT_FILE_NAME, \
+                            bootrom_header_version_list[self.Device_id]):
                     return False
 
-                # Check that the SFP output file is avalibile
-                if not os.path.isfile(self.U_boot_socfpga_dir+'/spl/'+SFP_OUTPUT_FILE_NAME):
+                # Check that the SFP output file is valid
+                copy_list = decodeBootRomImage(self.Uboot_build_dir+'/spl/'+SFP_OUTPUT_FILE_NAME)
+                if copy_list == [] or not all(copy['valid'] for copy in copy_list):
                     print('ERROR: The bootloader SFP generation failed!')
-                    print('       The output file "'+SFP_OUTPUT_FILE_NAME+'" was')
-                    print('       not generated with the SoC EDS command "mkpimage"')
+                    print('       The output file "'+SFP_OUTPUT_FILE_NAME+'" is not a valid BootROM image')
                     return False
                 print('    "u-boot-socfpga" spl generation was successful')        
 
@@ -1426,23 +3367,33 @@ class SocfpgaPlatformGenerator:
   #########################################################  Copy the bootloader file #########################################################
         if bootloader_build_required and not use_default_bootloader:
             print('--> Copy the bootloader executable to the partition')
+            self.BuildReport['bootloader_source'] = 'build'
             
             try:
                 # Only for the Arria 10 SX: 
                 if not generate_sfp_image_file[self.Device_id]: 
                     # Copy the SFP BootROM File to the RAW partition
-                    shutil.copy2(self.U_boot_socfpga_dir+'/spl/'+SFP_OUTPUT_FILE_NAME,
+                    shutil.copy2(self.Uboot_build_dir+'/spl/'+SFP_OUTPUT_FILE_NAME,
                         self.Raw_folder_dir+'/'+SFP_OUTPUT_FILE_NAME)
                     # Copy the u-boot bootloader to the VFAT partition
-                    shutil.copy2(self.U_boot_socfpga_dir+'/'+U_BOOT_IMAGE_FILE_NAME,
+                    shutil.copy2(self.Uboot_build_dir+'/'+U_BOOT_IMAGE_FILE_NAME,
                         self.Vfat_folder_dir+'/'+U_BOOT_IMAGE_FILE_NAME)
                 else:
                     # For other devices: Copy the u-boot exe 
-                    shutil.copy2(self.U_boot_socfpga_dir+'/'+BOOTLOADER_FILE_NAME,
+                    shutil.copy2(self.Uboot_build_dir+'/'+BOOTLOADER_FILE_NAME,
                         self.Raw_folder_dir+'/'+BOOTLOADER_FILE_NAME)
             except Exception as ex:
                 print('ERORR: Failed to copy the SFP file! MSG: '+str(ex))
                 return False
+
+            # Store the bootloader inside the build cache 
+            # (Builds with manual menuconfig changes are not reproducible with the fingerprint)
+            # The fingerprint is calculated with the u-boot revision that was built 
+            if use_cache and not start_menuconfig:
+                cache_fingerprint = self.CalcBootloaderFingerprint()
+                if not cache_fingerprint == '':
+                    print('--> Store the bootloader inside the build cache ('+cache_fingerprint[:12]+')')
+                    self.StoreBootloaderInCache(cache_fingerprint)
      
         print('     = Done')
         return True
@@ -1571,7 +3522,7 @@ class SocfpgaPlatformGenerator:
                             print('        requiered file dir.:"'+self.Vfat_folder_dir+\
                                 '/'+ DEVICETREE_OUTPUT_NAME[self.Device_id]+'"')
                             print('        Please copy the file to this location and try again!')
-                            sys.exit()
+                            sys.exit(1)
                 elif __wait3__ ==2:
                     yocto_project_available=False
                     linux_files_available = False
@@ -1643,7 +3594,9 @@ class SocfpgaPlatformGenerator:
           
    
     ############################################ Create the u-boot script "boot.script" ########################################## 
-        if not os.path.isfile(self.Vfat_folder_dir+'/boot.scr'):
+        if not os.path.isfile(self.Vfat_folder_dir+'/boot.scr') and \
+                not (os.path.isfile(self.Vfat_folder_dir+'/boot.script') and not self.Uboot_default_file_dir == '' and \
+                    filecmp.cmp(self.Uboot_default_file_dir,self.Vfat_folder_dir+'/boot.script',shallow=False)):
             print('--> Copy the default "boot.script" partition')
             if self.Uboot_default_file_dir == '':
                 print('ERROR: There is no default u-boot script file available!')
@@ -1656,341 +3609,502 @@ class SocfpgaPlatformGenerator:
                 print('ERROR: Failed to copy the u-boot script file MSG: '+str(ex))
         return True
 
+    #
+    #
+    # @brief Calculate the fingerprint of a FPGA configuration file conversion 
+    #        (".sof"-file, "quartus_cpf" options, device and Intel EDS installation)
+    # @param sof_file_dir          Directory of the ".sof"-file
+    # @param cpf_options           Options of "quartus_cpf" (list without the file names)
+    # @return                      Fingerprint as hex string
+    #
+    def calcFPGAconfFingerprint(self, sof_file_dir, cpf_options):
+        return calcFingerprint([sof_file_dir], [self.Socfpga_devices_list[self.Device_id], \
+                    ' '.join(cpf_options), self.EDS_Folder])
+
+    #
+    #
+    #
+    # @brief Copy the FPGA configuration files of a previous conversion with the same 
+    #        fingerprint from the build cache
+    # @param fingerprint           Fingerprint of the conversion
+    # @param output_dir            Directory of the output folder
+    # @param file_list             Files to copy (list: [Name inside the cache, output file name])
+    # @return                      All files were copied
+    #
+    def restoreFPGAconfFromCache(self, fingerprint, output_dir, file_list):
+        if not self.Use_fpga_conf_cache:
+            return False
+        cache_entry_dir = giveCacheDir(FPGA_CONF_CACHE_FOLDER)+'/'+fingerprint
+        for cache_name, output_name in file_list:
+            if not os.path.isfile(cache_entry_dir+'/'+cache_name):
+                return False
+        try:
+            for cache_name, output_name in file_list:
+                shutil.copy2(cache_entry_dir+'/'+cache_name,output_dir+'/'+output_name)
+        except Exception as ex:
+            print('WARNING: Failed to copy the cached FPGA configuration files MSG: '+str(ex))
+            return False
+        return True
+
+    #
+    #
+    #
+    # @brief Store the FPGA configuration files of a conversion inside the build cache
+    # @param fingerprint           Fingerprint of the conversion
+    # @param output_dir            Directory of the output folder
+    # @param file_list             Files to store (list: [Name inside the cache, output file name])
+    #
+    def storeFPGAconfInCache(self, fingerprint, output_dir, file_list):
+        if not self.Use_fpga_conf_cache:
+            return
+        cache_entry_dir = giveCacheDir(FPGA_CONF_CACHE_FOLDER)+'/'+fingerprint
+        try:
+            os.makedirs(cache_entry_dir,exist_ok=True)
+            for cache_name, output_name in file_list:
+                # Other builds see the old or the new file, but never a half written file
+                temp_file_dir = giveTempFileDir(cache_entry_dir+'/'+cache_name)
+                shutil.copy2(output_dir+'/'+output_name,temp_file_dir)
+                os.replace(temp_file_dir,cache_entry_dir+'/'+cache_name)
+        except Exception as ex:
+            print('WARNING: Failed to store the FPGA configuration inside the build cache MSG: '+str(ex))
+
+    #
+    #
+    # @brief Create several FPGA configuration files of the ".sof"-file in parallel
+    #        (e.g. for the boot, for Linux and for FPPx32). Only the "quartus_cpf" conversions
+    #        run in parallel (each inside its own temporary folder); the partition folders
+    #        are scanned and changed by this thread
+    # @param variant_list          FPGA configuration variants (list of FPGAconfVariant)
+    #                              Only one variant can be written during boot and every
+    #                              Linux variant requires its own output file
+    # @param max_workers           Maximum number of parallel conversions
+    #                              (0: Number of available CPUs of this process and its cgroup)
+    # @return                      success
+    #
+    def GenerateFPGAconfVariants(self, variant_list, max_workers=0):
+        from concurrent.futures import ThreadPoolExecutor
+        # Every variant needs its own output file
+        linux_filename_list = [variant.linux_filename for variant in variant_list if variant.boot_linux]
+        if len([variant for variant in variant_list if not variant.boot_linux]) > 1 or \
+                not len(set(linux_filename_list)) == len(linux_filename_list):
+            print('ERROR: Every FPGA configuration variant requires its own output file')
+            print('       (Only one variant can be written during boot)')
+            return False
+        for variant in variant_list:
+            if variant.boot_linux and not variant.linux_copydir == '' and \
+                    os.path.realpath(variant.linux_copydir) == os.path.realpath(self.Vfat_folder_dir):
+                print('ERROR: The Linux FPGA configuration file "'+variant.linux_filename+'" can not be')
+                print('       copied to the VFAT partition folder (It is scanned for the boot configuration)')
+                return False
+
+        # 1. Find the output files of every variant (the boot variant first)
+        plan_list = []
+        for variant in sorted(variant_list, key=lambda variant: variant.boot_linux):
+            success, plan = self.planFPGAconf(False,'',variant.boot_linux,variant.linux_filename, \
+                                variant.linux_copydir,variant.FPPx32_mode)
+            if not success:
+                return False
+            plan_list.append([variant, plan])
+        boot_name_list = [plan['name'] for variant, plan in plan_list if not variant.boot_linux and 'name' in plan]
+        for variant, plan in plan_list:
+            if variant.boot_linux and variant.linux_filename in boot_name_list:
+                print('ERROR: The Linux FPGA configuration file "'+variant.linux_filename+'" has the name')
+                print('       of the FPGA configuration file that is written during boot')
+                return False
+
+        # 2. Remove the old output files
+        for variant, plan in plan_list:
+            self.removeFPGAconfFiles(plan)
+
+        if max_workers <= 0:
+            max_workers = resolveBuildParallelism()['jobs']
+        convert_list = [[variant, plan] for variant, plan in plan_list if plan.get('task') == 'convert']
+        max_workers = max(1,min(max_workers,len(convert_list)))
+        print('--> Generate '+str(len(variant_list))+' FPGA configuration variants ('+ \
+                str(max_workers)+' in parallel)')
+
+        def convertVariant(variant, plan, output_dir):
+            start_time = time.monotonic()
+            try:
+                success = self.convertFPGAconf(plan,output_dir)
+            except Exception as ex:
+                print('ERROR: The generation of the FPGA configuration variant '+str(variant)+ \
+                    ' failed MSG:'+str(ex))
+                success = False
+            return {'variant': variant._asdict(), 'success': success, 'cached': plan.get('cached',False), \
+                    'time_s': round(time.monotonic()-start_time,1)}
+
+        # 3. Run the conversions in parallel: Every conversion writes to its own temporary folder
+        #    next to the ".sof"-file; the files are moved to the partition folders afterwards
+        variant_report = []
+        temp_dir_list = []
+        try:
+            for variant, plan in convert_list:
+                temp_dir_list.append(tempfile.mkdtemp(prefix='.fpga_conf_',dir=plan['sof_file_dir']))
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                future_list = [pool.submit(convertVariant,variant,plan,temp_dir) \
+                                for [variant, plan], temp_dir in zip(convert_list,temp_dir_list)]
+                variant_report = [future.result() for future in future_list]
+
+            # 4. Move the files serially
+            for report, [variant, plan], temp_dir in zip(variant_report,convert_list,temp_dir_list):
+                if report['success']:
+                    report['success'] = self.finishFPGAconf(plan,temp_dir)
+        except Exception as ex:
+            print('ERROR: The generation of the FPGA configuration variants failed MSG:'+str(ex))
+            return False
+        finally:
+            for temp_dir in temp_dir_list:
+                shutil.rmtree(temp_dir,ignore_errors=True)
+
+        self.BuildReport['fpga_conf_variants'] = variant_report
+        return all(item['success'] for item in variant_report)
+
     #
     #
     # @brief Create a FPGA configuration file for configure the FPGA during boot or with Linux in case this
     #        feature was selected inside the u-boot script
-    # @param copy_file             Only copy and rename a existing rbf file 
-    # @param dir2copy              Directory with the rbf file to copy 
+    # @param copy_file             Only copy and rename a existing rbf file
+    # @param dir2copy              Directory with the rbf file to copy
     # @param boot_linux            Generate configuration for
-    #                              False : Writen during boot (Passive Parallel x8; 
+    #                              False : Writen during boot (Passive Parallel x8;
     #                                      File name: <as in uboot script>.rbf)
     #                              True  : Can be written by Linux (Passive Parallel x16;
     #                                      File name: <as in uboot script>_linux.rbf)
-    # @param linux_filename        ".rfb" output file name for the configuration with Linux 
-    # @param linux_copydir         the location where the output Linux FPGA configuration file should be copied 
+    # @param linux_filename        ".rfb" output file name for the configuration with Linux
+    # @param linux_copydir         the location where the output Linux FPGA configuration file should be copied
     # @param FPPx32_mode           Enables the generation of FPPx32 FPGA Configuration files
     # @return                      success
     #
     def GenerateFPGAconf(self,copy_file=False,dir2copy='',boot_linux =False, linux_filename='', \
         linux_copydir='', FPPx32_mode=False):
 
+        success, plan = self.planFPGAconf(copy_file,dir2copy,boot_linux,linux_filename,linux_copydir,FPPx32_mode)
+        if not success:
+            return False
+        self.removeFPGAconfFiles(plan)
+
+        # 3.a Generate the FPGA configuration file
+        if plan.get('task') == 'convert':
+            if not self.convertFPGAconf(plan,plan['sof_file_dir']):
+                return False
+            return self.finishFPGAconf(plan,plan['sof_file_dir'])
+
+        # 3.b Copy an existing FPGA configuration to the partition
+        elif plan.get('task') == 'copy':
+            print(' --> Copy an existing FPGA configuration file to the partition')
+
+            # Check that the rbf configuration file is available
+            if not os.path.isfile(dir2copy):
+                print('ERROR: The file to copy does not exist!')
+                return False
+
+            # Copy the file to the VFAT folder
+            try:
+                if not boot_linux:
+                    shutil.copy2(dir2copy,self.Vfat_folder_dir+'/'+ \
+                        plan['name'])
+                else:
+                    shutil.copy2(dir2copy,linux_copydir+'/'+ \
+                        linux_filename)
+            except Exception as ex:
+                print('ERROR: Failed to copy the rbf configuration '+ \
+                    'file to the vfat folder MSG:'+str(ex))
+                return False
+            print('    The new FPGA configuration file was inserted!')
+        elif plan.get('task') == '':
+            print('NOTE: It was no new FPGA configuration file generated!')
+        return True
+
+    #
+    #
+    # @brief Find the FPGA configuration file to create with the u-boot script and the partition folders
+    #        and the "quartus_cpf" command for it. Nothing is changed (the old files are only listed)
+    # @param copy_file             Only copy and rename a existing rbf file
+    # @param dir2copy              Directory with the rbf file to copy
+    # @param boot_linux            Generate configuration for Linux (see GenerateFPGAconf)
+    # @param linux_filename        ".rfb" output file name for the configuration with Linux
+    # @param linux_copydir         the location where the output Linux FPGA configuration file should be copied
+    # @param FPPx32_mode           Enables the generation of FPPx32 FPGA Configuration files
+    # @return                      [success, plan (dictionary; {}: nothing to do)]
+    #
+    def planFPGAconf(self,copy_file=False,dir2copy='',boot_linux =False, linux_filename='', \
+        linux_copydir='', FPPx32_mode=False):
+
         print(' --> Check if it is necessary to generate a FPGA configuration file ')
 
         if self.Device_id==2 and boot_linux:
             print('ERROR: FPGA configuration file that can be written by Linux (HPS)')
             print('       is for the Arria 10 SX right now not supported!')
-            return True
+            return [True, {}]
 
         # Check if a FPGA configuration binary generation is necessary
-        # -> Only in case the u-boot script was configured to write the FPGA configuration  
-        if os.path.isfile(self.Vfat_folder_dir+'/boot.script'):
-
-            rbf_config_name_found =''
-            rbf_config_found =False
-            gen_fpga_conf=False
-            early_io_mode =False
-            # 1. Find a rbf file inside the VFAT partition
-            if not boot_linux:
-                if not self.Device_id==2:
-                    print('    Scan VFAT partition for a ".rbf" FPGA config file')
-                    for file in os.listdir(self.Vfat_folder_dir):
-                        if os.path.isfile(self.Vfat_folder_dir+'/'+file) and file.endswith('.rbf'):
-                            if rbf_config_found:
-                                print('Note: There are more than one ".rbf" configuration file')
-                                print('      inside the VFAT partition available!')
-                                print('      A new generation of the FPGA configuration is not possible')
-                                rbf_config_name_found=''
-                                return False
+        # -> Only in case the u-boot script was configured to write the FPGA configuration
+        if not os.path.isfile(self.Vfat_folder_dir+'/boot.script'):
+            return [True, {}]
+
+        rbf_config_name_found =''
+        rbf_config_found =False
+        gen_fpga_conf=False
+        early_io_mode =False
+        # Old files to remove: [file directory, error message]
+        remove_list = []
+        # 1. Find a rbf file inside the VFAT partition
+        if not boot_linux:
+            if not self.Device_id==2:
+                print('    Scan VFAT partition for a ".rbf" FPGA config file')
+                for file in os.listdir(self.Vfat_folder_dir):
+                    if os.path.isfile(self.Vfat_folder_dir+'/'+file) and file.endswith('.rbf'):
+                        if rbf_config_found:
+                            print('Note: There are more than one ".rbf" configuration file')
+                            print('      inside the VFAT partition available!')
+                            print('      A new generation of the FPGA configuration is not possible')
+                            rbf_config_name_found=''
+                            return [False, {}]
+                        else:
+                            rbf_config_name_found=file
+                            rbf_config_found = True
+
+                # 2.A. Rebuild an existing rbf file: Check that this file is used inside the u-boot script
+                if rbf_config_found and not rbf_config_name_found=='':
+                    print('    The file "'+rbf_config_name_found+'" found')
+                    b = bytes(rbf_config_name_found, 'utf-8')
+                    with open(self.Vfat_folder_dir+'/boot.script', 'rb', 0) as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as s:
+                        if s.find(b) != -1:
+                            gen_fpga_conf = True
+
+                # Remove the old rbf file from the VFAT folder
+                if self.unlicensed_ip_found==False or copy_file:
+                    if os.path.isfile(self.Vfat_folder_dir+'/'+rbf_config_name_found):
+                        remove_list.append([self.Vfat_folder_dir+'/'+rbf_config_name_found, \
+                            'ERROR: Failed to remove the old VFAT FPGA config file'])
+        else:
+            if linux_filename=='' or linux_filename.find('.rbf')==-1:
+                print('Error: The selected Linux FPGA configuration file name is not vailed!')
+                return [False, {}]
+            if not os.path.isdir(linux_copydir):
+                print('Error: The selected Linux FPGA configuration file copy location is not a dir')
+                return [False, {}]
+            if os.path.isfile(linux_copydir+'/'+linux_filename):
+                remove_list.append([linux_copydir+'/'+linux_filename, \
+                    'ERROR: Failed to remove the old Linux FPGA config file from the selected dir'])
+
+        # 2.B. Build a new rbf file: Check if the u-boot script should write the FPGA configuration
+        rbf_config_name_body = rbf_config_name_found.replace('.rbf','')
+        if not rbf_config_found and rbf_config_name_found=='':
+            print('    No FPGA configuration file was found')
+            print('    -> Check if the u-boot script should write the FPGA configuration')
+
+            if self.Device_id==2: fpga_conf_suffix = '.itb'
+            else:                 fpga_conf_suffix = '.rbf'
+
+            with open(self.Vfat_folder_dir+'/boot.script', 'rb', 0) as file:
+                for line in file:
+                    line = str(line)
+                    if not line.find(fpga_conf_suffix)==-1 and not line.startswith('#'):
+                        rbf_end= line.find(fpga_conf_suffix)+4
+                        rbf_start=0
+                        for i in range(rbf_end,0,-1):
+                            if line[i] ==' ':
+                                rbf_start = i+1
+                                break
+                        if i > 3:
+                            gen_fpga_conf = True
+                            if boot_linux:
+                                rbf_config_name_found = linux_filename
                             else:
-                                rbf_config_name_found=file
-                                rbf_config_found = True
-
-                    # 2.A. Rebuild an existing rbf file: Check that this file is used inside the u-boot script
-                    if rbf_config_found and not rbf_config_name_found=='':
-                        print('    The file "'+rbf_config_name_found+'" found')
-                        b = bytes(rbf_config_name_found, 'utf-8')
-                        with open(self.Vfat_folder_dir+'/boot.script', 'rb', 0) as file, \
-                        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as s:
-                            if s.find(b) != -1:
-                                gen_fpga_conf = True
-                        
-                    # Remove the old rbf file from the VFAT folder
-                    if self.unlicensed_ip_found==False or copy_file:    
-                        if os.path.isfile(self.Vfat_folder_dir+'/'+rbf_config_name_found):
-                            try:
-                                os.remove(self.Vfat_folder_dir+'/'+rbf_config_name_found)
-                            except Exception:
-                                print('ERROR: Failed to remove the old VFAT FPGA config file')
-            else:
-                if linux_filename=='' or linux_filename.find('.rbf')==-1:
-                    print('Error: The selected Linux FPGA configuration file name is not vailed!')
-                    return False
-                if not os.path.isdir(linux_copydir):
-                    print('Error: The selected Linux FPGA configuration file copy location is not a dir')
-                    return False
-                if os.path.isfile(linux_copydir+'/'+linux_filename):
-                    print('    Remove the exsiting Linux FPGA configuration file')
-                    try:
-                        os.remove(linux_copydir+'/'+linux_filename)
-                    except Exception:
-                        print('ERROR: Failed to remove the old Linux FPGA config file from the selected dir')
-
-            # 2.B. Build a new rbf file: Check if the u-boot script should write the FPGA configuration
-            if not rbf_config_found and rbf_config_name_found=='':
-                print('    No FPGA configuration file was found')
-                print('    -> Check if the u-boot script should write the FPGA configuration')
-
-                if self.Device_id==2: fpga_conf_suffix = '.itb'
-                else:                 fpga_conf_suffix = '.rbf'
-
-                with open(self.Vfat_folder_dir+'/boot.script', 'rb', 0) as file:
-                    for line in file:
-                        line = str(line)
-                        if not line.find(fpga_conf_suffix)==-1 and not line.startswith('#'):
-                            rbf_end= line.find(fpga_conf_suffix)+4
-                            rbf_start=0
-                            for i in range(rbf_end,0,-1):
-                                if line[i] ==' ':
-                                    rbf_start = i+1
-                                    break
-                            if i > 3:
-                                gen_fpga_conf = True
-                                if boot_linux:
-                                    rbf_config_name_found = linux_filename
-                                else:
-                                    rbf_config_name_found = line[rbf_start:rbf_end]
-
-                # Convert HPS early I/O Config file
-                rbf_config_name_body =''
-                
-                st = rbf_config_name_found.find(fpga_conf_suffix)
-                rbf_config_name_body= rbf_config_name_found[:st]
-                rbf_config_name_found=rbf_config_name_body+'.rbf'
-                
+                                rbf_config_name_found = line[rbf_start:rbf_end]
 
-            if self.unlicensed_ip_found==True and not copy_file: 
+            # Convert HPS early I/O Config file
+            rbf_config_name_body =''
 
-                headline = ['Your Quartus Prime project contains unlicend demo IPs',\
-                ' For this project a generation of a FPGA configuration file is not possible.',\
-                ' Please insiert a exsting ".rbf" FPGA configuration file to enable the configuration during boot',\
-                ' Note: After the boot it is posibile to overwrite the FPGA configuration via JTAG']
-                headline_table=['FPGA configuration file location']
-                headline_content=['File name: "'+rbf_config_name_found+'"','Directory: "'+self.Vfat_folder_dir+'/'+rbf_config_name_found+'"']
-                printSelectionTable(headline,headline_table,headline_content, [],False,5)
-                ret=input('Please chnage this file by hand and type something to continue.. (q=quite) ')
-                if ret=='q' or ret=='Q': sys.exit()
+            st = rbf_config_name_found.find(fpga_conf_suffix)
+            rbf_config_name_body= rbf_config_name_found[:st]
+            rbf_config_name_found=rbf_config_name_body+'.rbf'
 
-            # 3.a Generate the FPGA configuration file
-            if gen_fpga_conf and not copy_file:
-                
-                if self.Sof_folder =='':
-                    sof_file_dir = self.Quartus_proj_top_dir
-                else:
-                    sof_file_dir = self.Quartus_proj_top_dir+'/'+self.Sof_folder
 
-                # Remove the old rbf file from the Quartus project top folder
-                if os.path.isfile(sof_file_dir+'/'+rbf_config_name_found):
-                    try:
-                        os.remove(sof_file_dir+'/'+rbf_config_name_found)
-                    except Exception:
-                        print('ERROR: Failed to remove the old project folder FPGA config file')
-            
-                try:
-                    with subprocess.Popen(self.EDS_Folder+'/'+EDS_EMBSHELL_DIR, stdin=subprocess.PIPE) as edsCmdShell:
-                        time.sleep(DELAY_MS)
-                        if not boot_linux: 
-                            print(' --> Generate a new FPGA configuration file for configuration during boot')
-                            print('     with the output name "'+rbf_config_name_found+'"')
-
-                            b = bytes(' cd '+sof_file_dir+' \n', 'utf-8')
-                            edsCmdShell.stdin.write(b) 
-
-                            # Enable HPS Early I/O Realse mode for the Arria 10 SX 
-                            if self.Device_id==2: 
-                                pre_fix =' --hps '
-                                print('NOTE: The FPGA configuration wil be in HPS early I/O realse mode generated')
-                            else:
-                                pre_fix =''
-                            
-                            # Enable FPPx32 FPGA Configuration Mode
-                            if self.Device_id==2 and FPPx32_mode:
-                                print('[ERROR]  For the Intel Arria 10 SX is no FPPx32 FPGA Configuration file mode avalibile')
-                                return False
+        if self.unlicensed_ip_found==True and not copy_file:
 
-                            FPPx32_pre_fix =''
-                            if FPPx32_mode:
-                                print('[NOTE]   GENERATE U-BOOT FPGA CONFIGURATION FOR FPPx32!')
-                                FPPx32_pre_fix = ' -o bitstream_compression=on '
-                            
-                            b = bytes('quartus_cpf -c '+pre_fix+FPPx32_pre_fix+' '+self.Sof_file_name+' '+rbf_config_name_found+' \n','utf-8')
-                            edsCmdShell.stdin.write(b) 
-                        else:
-                            print(' --> Generate a new FPGA configuration file for configuration with the HPS (Linux)')
-                            print('     with the output name "'+rbf_config_name_found+'"')
+            headline = ['Your Quartus Prime project contains unlicend demo IPs',\
+            ' For this project a generation of a FPGA configuration file is not possible.',\
+            ' Please insiert a exsting ".rbf" FPGA configuration file to enable the configuration during boot',\
+            ' Note: After the boot it is posibile to overwrite the FPGA configuration via JTAG']
+            headline_table=['FPGA configuration file location']
+            headline_content=['File name: "'+rbf_config_name_found+'"','Directory: "'+self.Vfat_folder_dir+'/'+rbf_config_name_found+'"']
+            printSelectionTable(headline,headline_table,headline_content, [],False,5)
+            ret=input('Please chnage this file by hand and type something to continue.. (q=quite) ')
+            if ret=='q' or ret=='Q': sys.exit()
 
-                            b = bytes(' cd '+sof_file_dir+' \n', 'utf-8')
-                            edsCmdShell.stdin.write(b) 
+        plan = {'task': '', 'name': rbf_config_name_found, 'body': rbf_config_name_body, \
+                'boot_linux': boot_linux, 'linux_copydir': linux_copydir, 'remove_list': remove_list}
 
-                            mode_pre_fix =' -m FPP '
-                            if FPPx32_mode:
-                                print('[NOTE]   GENERATE U-BOOT FPGA CONFIGURATION FOR FPPx32!')
-                                mode_pre_fix = ' -o bitstream_compression=on '
-            
-                            b = bytes('quartus_cpf '+mode_pre_fix+' -c '+self.Sof_file_name+' '+rbf_config_name_found+' \n','utf-8')
-                            edsCmdShell.stdin.write(b) 
+        # 3.a Generate the FPGA configuration file
+        if gen_fpga_conf and not copy_file:
 
-                        edsCmdShell.communicate()
-                        time.sleep(DELAY_MS)
-                    
-                except Exception as ex:
-                    print('ERROR: Failed to start the Intel EDS Command Shell! MSG:'+ str(ex))
-                    return False
+            if self.Sof_folder =='':
+                sof_file_dir = self.Quartus_proj_top_dir
+            else:
+                sof_file_dir = self.Quartus_proj_top_dir+'/'+self.Sof_folder
 
-                 # Check that the generated rbf configuration file is now available
-                
-                if self.Device_id==2: 
-                    # Configuration file should be generated in early I/O relase mode (Arria 10 SX)
-                    if not os.path.isfile(sof_file_dir+'/'+rbf_config_name_body+'.periph.rbf') or \
-                        not os.path.isfile(sof_file_dir+'/'+rbf_config_name_body+'.core.rbf'):
-                        print('ERROR: Failed to generate the FPGA configuration file')
-                        return False
+            # Remove the old rbf file from the Quartus project top folder
+            if os.path.isfile(sof_file_dir+'/'+rbf_config_name_found):
+                remove_list.append([sof_file_dir+'/'+rbf_config_name_found, \
+                    'ERROR: Failed to remove the old project folder FPGA config file'])
+
+            if not boot_linux:
+                print(' --> Generate a new FPGA configuration file for configuration during boot')
+                print('     with the output name "'+rbf_config_name_found+'"')
+
+                # Enable HPS Early I/O Realse mode for the Arria 10 SX
+                if self.Device_id==2:
+                    pre_fix =['--hps']
+                    print('NOTE: The FPGA configuration wil be in HPS early I/O realse mode generated')
                 else:
-                    # Configuration file should be generated in normal mode
-                    if not os.path.isfile(sof_file_dir+'/'+rbf_config_name_found):
-                        print('ERROR: Failed to generate the FPGA configuration file')
-                        return False
+                    pre_fix =[]
 
-                if not boot_linux:
-                    ## For the uboot FPGA configuration file  
-                    try:
-                        if self.Device_id==2: 
-                            if not os.path.isfile(self.U_boot_socfpga_dir+'/tools/mkimage'):
-                                print('ERROR: The mkimage appliation ('+self.U_boot_socfpga_dir+'/tools/mkimage)')
-                                print('       does not exist')
-                                print('       FPGA Configuration file generation is not possible')
-                                print('       --> Runing the u-boot build process once to clone u-boot to "/software"')
-                                return False
-                            try:
-                                shutil.copy2(self.U_boot_socfpga_dir+'/tools/mkimage',sof_file_dir+'/mkimage')
-                            except Exception:
-                                print('ERROR: Failed to copy the "mkimage" application ')
-                                return False
+                # Enable FPPx32 FPGA Configuration Mode
+                if self.Device_id==2 and FPPx32_mode:
+                    print('[ERROR]  For the Intel Arria 10 SX is no FPPx32 FPGA Configuration file mode avalibile')
+                    return [False, {}]
 
-                            print('--> Generate the .its HPS Early I/O Realse configuration file ')
-
-                            ITS_FILE_CONTENT = ' /dts-v1/;                                                              '+ \
-                                            '/ {                                                                      '+ \
-                                            '       description = "FIT image with FPGA bistream";                     '+ \
-                                            '       #address-cells = <1>;                                             '+ \
-                                            '                                                                         '+ \
-                                            '       images {                                                          '+ \
-                                            '          fpga-periph-1 {                                                '+ \
-                                            '               description = "FPGA peripheral bitstream";                '+ \
-                                            '              data = /incbin/("'+rbf_config_name_body+'.periph.rbf'+'"); '+ \
-                                            '                type = "fpga";                                           '+ \
-                                            '               arch = "arm";                                             '+ \
-                                            '               compression = "none";                                     '+ \
-                                            '           };                                                            '+ \
-                                            '                                                                         '+ \
-                                            '           fpga-core-1 {                                                 '+ \
-                                            '               description = "FPGA core bitstream";                      '+ \
-                                            '               data = /incbin/("'+rbf_config_name_body+'.core.rbf'+'");'+ \
-                                            '               type = "fpga";                                            '+ \
-                                            '               arch = "arm";                                             '+ \
-                                            '               compression = "none";                                     '+ \
-                                            '           };                                                            '+ \
-                                            '       };                                                                '+ \
-                                            '                                                                         '+ \
-                                            '       configurations {                                                  '+ \
-                                            '           default = "config-1";                                         '+ \
-                                            '           config-1 {                                                    '+ \
-                                            '               description = "Boot with FPGA early IO release config";   '+ \
-                                            '               fpga = "fpga-periph-1";                                   '+ \
-                                            '            };                                                           '+ \
-                                            '       };                                                                '+ \
-                                            '   };                                                                    '
-                            
-                            if os.path.isfile(sof_file_dir+'/fit_spl_fpga.its'):
-                                os.remove(sof_file_dir+'/fit_spl_fpga.its')
-
-                            if os.path.isfile(sof_file_dir+'/'+FIT_FPGA_FILE_NAME):
-                                os.remove(sof_file_dir+'/'+FIT_FPGA_FILE_NAME)
-                            
-                            with open(sof_file_dir+'/fit_spl_fpga.its', "a") as f:
-                                f.write(ITS_FILE_CONTENT)
-                            
-                         
-                            print('--> Create the FIT image with the FPGA programming files (used by SFP)')
+                FPPx32_pre_fix =[]
+                if FPPx32_mode:
+                    print('[NOTE]   GENERATE U-BOOT FPGA CONFIGURATION FOR FPPx32!')
+                    FPPx32_pre_fix = ['-o','bitstream_compression=on']
 
-                            #
-                            # mkimage -E -f board/altera/arria10-socdk/fit_spl_fpga.its fit_spl_fpga.itb
-                            #  -E => place data outside of the FIT structure
-                            #  -f => input filename for FIT source
-                            #
-                            os.system('cd '+sof_file_dir+' && mkimage -E -f fit_spl_fpga.its '+FIT_FPGA_FILE_NAME+' \n')
-
-                            os.remove(sof_file_dir+'/mkimage')
-                            os.remove(sof_file_dir+'/fit_spl_fpga.its')
-                            
-                            # Check that the output file is generated
-                            if not os.path.isfile(sof_file_dir+'/'+FIT_FPGA_FILE_NAME):
-                                print('ERROR: The .itb FPGA configuration file was not generated!')
-                                return False
-                            
-                            # Copy the file to the VFAT partition
-                            if os.path.isfile(self.Vfat_folder_dir+'/'+FIT_FPGA_FILE_NAME):
-                                os.remove(self.Vfat_folder_dir+'/'+FIT_FPGA_FILE_NAME)
+                cpf_cmd = ['quartus_cpf','-c']+pre_fix+FPPx32_pre_fix+[self.Sof_file_name,rbf_config_name_found]
+            else:
+                print(' --> Generate a new FPGA configuration file for configuration with the HPS (Linux)')
+                print('     with the output name "'+rbf_config_name_found+'"')
 
-                            shutil.move(sof_file_dir+'/'+FIT_FPGA_FILE_NAME,  \
-                                self.Vfat_folder_dir+'/')
+                mode_pre_fix =['-m','FPP']
+                if FPPx32_mode:
+                    print('[NOTE]   GENERATE U-BOOT FPGA CONFIGURATION FOR FPPx32!')
+                    mode_pre_fix = ['-o','bitstream_compression=on']
 
-                        else:
-                            # Copy the FPGA configuration file to the VFAT folder
-                            
-                            shutil.move(sof_file_dir+'/'+rbf_config_name_found,  \
-                                self.Vfat_folder_dir+'/')
-                    except Exception as ex:
-                        print('ERROR: Failed to move the rbf configuration '+ \
-                            'file to the vfat folder MSG:'+str(ex))
-                        return False
-                    print('    A new FPGA for configuration during boot was generated ')
-                else:
-                    ## For the Linux (HPS) FPGA configuration file  
-                    # Copy the file to the rootfs /home folder folder
-                    try:
-                        shutil.move(sof_file_dir+'/'+rbf_config_name_found,  \
-                            linux_copydir+'/')
-                    except Exception as ex:
-                        print('ERROR: Failed to move the rbf Linx configuration '+ \
-                            'file to the selected folder MSG:'+str(ex))
-                        return False
-                    print('    A new FPGA configuration with Linux was generated ')
+                cpf_cmd = ['quartus_cpf']+mode_pre_fix+['-c',self.Sof_file_name,rbf_config_name_found]
 
-            # 3.b Copy an existing FPGA configuration to the partition
-            elif gen_fpga_conf and copy_file:
-                print(' --> Copy an existing FPGA configuration file to the partition')
-                
-                # Check that the rbf configuration file is available
-                if not os.path.isfile(dir2copy):
-                    print('ERROR: The file to copy does not exist!')
-                    return False
+            # Output files of "quartus_cpf" (Arria 10 SX: early I/O release mode)
+            if self.Device_id==2:
+                cpf_file_list = [['periph.rbf', rbf_config_name_body+'.periph.rbf'], \
+                                 ['core.rbf', rbf_config_name_body+'.core.rbf']]
+            else:
+                cpf_file_list = [['fpga.rbf', rbf_config_name_found]]
+
+            # Files of a previous conversion of the same ".sof"-file with the same options are used again
+            cpf_options = [item for item in cpf_cmd[1:] if not item in [self.Sof_file_name,rbf_config_name_found]]
+            plan.update({'task': 'convert', 'sof_file_dir': sof_file_dir, 'cpf_cmd': cpf_cmd, \
+                'cpf_file_list': cpf_file_list, \
+                'fingerprint': self.calcFPGAconfFingerprint(sof_file_dir+'/'+self.Sof_file_name,cpf_options)})
+
+        elif gen_fpga_conf and copy_file:
+            plan['task'] = 'copy'
+        return [True, plan]
 
-                # Copy the file to the VFAT folder
+    #
+    #
+    # @brief Remove the old FPGA configuration files of a conversion (planFPGAconf)
+    # @param plan                  Conversion
+    #
+    def removeFPGAconfFiles(self, plan):
+        for file_dir, error_msg in plan.get('remove_list',[]):
+            if os.path.isfile(file_dir):
                 try:
-                    if not boot_linux:
-                        shutil.copy2(dir2copy,self.Vfat_folder_dir+'/'+ \
-                            rbf_config_name_found)
+                    os.remove(file_dir)
+                except Exception:
+                    print(error_msg)
+
+    #
+    #
+    # @brief Convert the ".sof"-file with "quartus_cpf" (or take the files of the build cache)
+    #        Conversions with different output folders can run in parallel
+    # @param plan                  Conversion (planFPGAconf)
+    # @param output_dir            Output folder of "quartus_cpf" (e.g. the ".sof"-file folder)
+    # @return                      success
+    #
+    def convertFPGAconf(self, plan, output_dir):
+        plan['cached'] = self.restoreFPGAconfFromCache(plan['fingerprint'],output_dir,plan['cpf_file_list'])
+        if plan['cached']:
+            print('    The FPGA configuration of the unchanged ".sof"-file was taken from the build cache')
+        else:
+            # The ".sof"-file is used from its folder
+            cpf_cmd = plan['cpf_cmd']
+            if not os.path.realpath(output_dir) == os.path.realpath(plan['sof_file_dir']):
+                cpf_cmd = [plan['sof_file_dir']+'/'+item if item == self.Sof_file_name else item \
+                            for item in cpf_cmd]
+            if not self.RunEdsCommand(cpf_cmd,output_dir):
+                return False
+
+        # Check that the generated rbf configuration file is now available
+        for cache_name, output_name in plan['cpf_file_list']:
+            if not os.path.isfile(output_dir+'/'+output_name):
+                print('ERROR: Failed to generate the FPGA configuration file')
+                return False
+        return True
+
+    #
+    #
+    # @brief Store the converted FPGA configuration files inside the build cache and
+    #        move them to the partition folders
+    # @param plan                  Conversion (planFPGAconf)
+    # @param output_dir            Output folder of "quartus_cpf" (see convertFPGAconf)
+    # @return                      success
+    #
+    def finishFPGAconf(self, plan, output_dir):
+        sof_file_dir = plan['sof_file_dir']
+        rbf_config_name_found = plan['name']
+        rbf_config_name_body = plan['body']
+        # The files of a temporary output folder are moved next to the ".sof"-file
+        if not os.path.realpath(output_dir) == os.path.realpath(sof_file_dir):
+            try:
+                for cache_name, output_name in plan['cpf_file_list']:
+                    os.replace(output_dir+'/'+output_name,sof_file_dir+'/'+output_name)
+            except Exception as ex:
+                print('ERROR: Failed to move the FPGA configuration file to the project folder MSG:'+str(ex))
+                return False
+        if not plan['cached']:
+            self.storeFPGAconfInCache(plan['fingerprint'],sof_file_dir,plan['cpf_file_list'])
+
+        if not plan['boot_linux']:
+            ## For the uboot FPGA configuration file
+            try:
+                if self.Device_id==2:
+                    # The FIT image of cached FPGA configuration files is cached as well
+                    if plan['cached'] and self.restoreFPGAconfFromCache(plan['fingerprint'], \
+                            self.Vfat_folder_dir,[[FIT_FPGA_FILE_NAME, FIT_FPGA_FILE_NAME]]):
+                        print('    The FIT image was taken from the build cache')
                     else:
-                        shutil.copy2(dir2copy,linux_copydir+'/'+ \
-                            linux_filename)
-                except Exception as ex:
-                    print('ERROR: Failed to copy the rbf configuration '+ \
-                        'file to the vfat folder MSG:'+str(ex))
-                    return False
-                print('    The new FPGA configuration file was inserted!')
-            else:
-                print('NOTE: It was no new FPGA configuration file generated!')
+                        # Create the FIT image inside the VFAT partition
+                        print('--> Create the FIT image with the FPGA programming files (used by SFP)')
+                        if not writeFpgaFitImage(self.Vfat_folder_dir+'/'+FIT_FPGA_FILE_NAME, \
+                                sof_file_dir+'/'+rbf_config_name_body+'.periph.rbf', \
+                                sof_file_dir+'/'+rbf_config_name_body+'.core.rbf'):
+                            return False
+                        self.storeFPGAconfInCache(plan['fingerprint'],self.Vfat_folder_dir, \
+                            [[FIT_FPGA_FILE_NAME, FIT_FPGA_FILE_NAME]])
+
+                else:
+                    # Copy the FPGA configuration file to the VFAT folder
+
+                    shutil.move(sof_file_dir+'/'+rbf_config_name_found,  \
+                        self.Vfat_folder_dir+'/')
+            except Exception as ex:
+                print('ERROR: Failed to move the rbf configuration '+ \
+                    'file to the vfat folder MSG:'+str(ex))
+                return False
+            print('    A new FPGA for configuration during boot was generated ')
+        else:
+            ## For the Linux (HPS) FPGA configuration file
+            # Copy the file to the rootfs /home folder folder
+            try:
+                shutil.move(sof_file_dir+'/'+rbf_config_name_found,  \
+                    plan['linux_copydir']+'/')
+            except Exception as ex:
+                print('ERROR: Failed to move the rbf Linx configuration '+ \
+                    'file to the selected folder MSG:'+str(ex))
+                return False
+            print('    A new FPGA configuration with Linux was generated ')
         return True
 
     #
@@ -2026,6 +4140,9 @@ class SocfpgaPlatformGenerator:
     def GenerateImageFile(self,ImageFileName='',OutputZipFileName='', compress_output=False, \
                             print_Table= False):
 
+        if not loadLinuxBootImageGenerator():
+            return False
+
         # Add a datecode to the output file names
         now = datetime.now()
         dt_string = now.strftime("%Y%m%d_%H%M")
@@ -2039,7 +4156,69 @@ class SocfpgaPlatformGenerator:
             self.OutputZipFileName= "SocfpgaLinux_"+dt_string+".zip"
         else: 
             self.OutputZipFileName = OutputZipFileName
-        
+
+        # Compile the u-boot scripts and the devicetrees in-process: The uncompiled files are held 
+        # outside of the partition folders during the image generation (only the compiled files 
+        # are part of the image)
+        part_settings_list = [[part, part.comp_ubootscript, part.comp_devicetree] for part in self.PartitionList]
+        held_file_list = []
+        dtb_cache_stats = {'hits': 0, 'misses': 0}
+        try:
+            for part in self.PartitionList:
+                part_name = part.giveWorkingFolderName(False)
+                part_dir = os.getcwd()+'/'+IMAGE_FOLDER_NAME+'/'+part_name
+                compiled_file_list = []
+                if part.comp_ubootscript in uimage_arch_dict and \
+                        os.path.isfile(part_dir+'/'+UBOOT_SCRIPT_FILE_NAME):
+                    print('---> Compile the u-boot script of the partition "'+part_name+'"')
+                    if not compileUbootScript(part_dir+'/'+UBOOT_SCRIPT_FILE_NAME, \
+                            part_dir+'/'+UBOOT_SCRIPT_OUTPUT_NAME,part.comp_ubootscript):
+                        return False
+                    compiled_file_list.append(UBOOT_SCRIPT_FILE_NAME)
+                    part.comp_ubootscript = ''
+
+                # Devicetrees inside the top folder (without dtc the partition compiles them)
+                if part.comp_devicetree and not giveDtcVersion() == '':
+                    print('---> Compile the devicetrees of the partition "'+part_name+'"')
+                    for name in sorted(os.listdir(part_dir)):
+                        if name.endswith('.dts') and os.path.isfile(part_dir+'/'+name):
+                            if not compileDeviceTree(part_dir+'/'+name,part_dir+'/'+name[:-len('.dts')]+'.dtb', \
+                                    dtb_cache_stats):
+                                return False
+                            compiled_file_list.append(name)
+                    part.comp_devicetree = False
+
+                for name in compiled_file_list:
+                    held_file_dir = os.getcwd()+'/'+IMAGE_FOLDER_NAME+'/.'+part_name+'_'+name
+                    os.replace(part_dir+'/'+name,held_file_dir)
+                    held_file_list.append([held_file_dir, part_dir+'/'+name])
+
+            # Report the hit rate of the devicetree build cache 
+            dtb_count = dtb_cache_stats['hits']+dtb_cache_stats['misses']
+            if dtb_count > 0:
+                dtb_cache_stats['hit_rate'] = round(dtb_cache_stats['hits']/dtb_count,3)
+                self.BuildReport['devicetree_cache'] = dtb_cache_stats
+                print('    Devicetree cache: '+str(dtb_cache_stats['hits'])+' hits, '+ \
+                    str(dtb_cache_stats['misses'])+' misses (hit rate: '+ \
+                    str(round(dtb_cache_stats['hit_rate']*100))+'%)')
+
+            return self.createImageFile(compress_output,print_Table)
+        finally:
+            # Restore the uncompiled files and the partition settings
+            for held_file_dir, file_dir in held_file_list:
+                os.replace(held_file_dir,file_dir)
+            for part, comp_ubootscript, comp_devicetree in part_settings_list:
+                part.comp_ubootscript = comp_ubootscript
+                part.comp_devicetree = comp_devicetree
+
+    #
+    #
+    # @brief Generate the image file with the partition folders 
+    # @param compress_output       Compress the output image file to ".zip"
+    # @param print_Table           Print the partatition table 
+    # @return                      success
+    #
+    def createImageFile(self, compress_output=False, print_Table=False):
         print('---> Calculate Partition sizes and the total size')
         try:
             for part in self.PartitionList:
@@ -2105,35 +4284,38 @@ class SocfpgaPlatformGenerator:
             except Exception as ex: 
                 print('ERROR: Failed to remove the old DeviceTree file') 
 
-        gui_mode_str = ''
-        if gui_mode: gui_mode_str=' --gui'
+        gui_mode_str = []
+        if gui_mode: gui_mode_str=['--gui']
 
         # Run the DeviceTree Generator
-        deviceTreeCmd = 'sopc2dts  --verbose --input '+self.Quartus_proj_top_dir+'/'+self.sopcinfo_file_name+\
-                        ' --output '+\
-                        outfile_name+' --type dts' +\
-                        ' --bridge-removal all --clocks --conduits '+\
-                        '--streaming --reset --sort name'+gui_mode_str
-        
-        try:
-            with subprocess.Popen(self.EDS_Folder+'/'+EDS_EMBSHELL_DIR, stdin=subprocess.PIPE) as edsCmdShell:
-                time.sleep(DELAY_MS)
-
-                b = bytes(' cd '+outfile_dir+' \n', 'utf-8')
-                edsCmdShell.stdin.write(b) 
-
-                b =bytes(deviceTreeCmd+' \n','utf-8')
-                edsCmdShell.stdin.write(b) 
-
-                edsCmdShell.communicate()
-                time.sleep(DELAY_MS)
+        deviceTreeCmd = ['sopc2dts','--verbose','--input',self.Quartus_proj_top_dir+'/'+self.sopcinfo_file_name, \
+                        '--output',outfile_name,'--type','dts', \
+                        '--bridge-removal','all','--clocks','--conduits', \
+                        '--streaming','--reset','--sort','name']+gui_mode_str
         
-        except Exception as ex:
-            print('ERROR: Failed to start the Intel EDS Command Shell! MSG:'+ str(ex))
+        if not self.RunEdsCommand(deviceTreeCmd,outfile_dir,timeout=None if gui_mode else CMD_TIMEOUT_S):
             return False
 
         # Check that a output file was generated
         return os.path.isfile(outfile_dir+'/'+outfile_name)
+
+    #
+    # @brief Write the build report (e.g. the chosen build parallelism) as JSON file 
+    # @param    file_name          Directory of the output file 
+    # @return                      success
+    #
+    def WriteBuildReport(self,file_name='build_report.json'):
+        report = dict(self.BuildReport)
+        report['version'] = version
+        report['device'] = self.Socfpga_devices_list[self.Device_id]
+        report['date'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with open(file_name,'w') as f:
+                json.dump(report,f,indent=2)
+        except Exception as ex:
+            print('ERROR: Failed to write the build report MSG:'+str(ex))
+            return False
+        return True
     
 
 ############################################                                ############################################
@@ -2141,6 +4323,46 @@ class SocfpgaPlatformGenerator:
 ############################################                                ############################################
 
 if __name__ == '__main__':
+    import argparse
+    parser = argparse.ArgumentParser(description='Generate a bootable Linux image for Intel SoC-FPGAs')
+    parser.add_argument('command', nargs='?', default='build', choices=['build','update','import-time','check-sfp'], \
+        help='build: generate the image (default); update: pull the latest "LinuxBootImageFileGenerator"; '+ \
+            'import-time: check the import time of the module against its budget; '+ \
+            'check-sfp: decode and check BootROM images (e.g. "'+SFP_OUTPUT_FILE_NAME+'")')
+    parser.add_argument('files', nargs='*', \
+        help='BootROM image files (only for "check-sfp")')
+    parser.add_argument('-j','--jobs', type=int, default=0, \
+        help='number of make jobs for the u-boot build (default: number of available CPUs)')
+    parser.add_argument('-l','--load-average', type=float, default=0, \
+        help='load-average limit of make (default: number of available CPUs; <0: no limit)')
+    parser.add_argument('--mem-per-job', type=int, default=512, \
+        help='required memory per make job in MB (default: 512; 0: no memory guard)')
+    parser.add_argument('--incremental', action='store_true', \
+        help='do not clean the u-boot build and only run the defconfig if required')
+    parser.add_argument('--clean', action='store_true', \
+        help='always clean the u-boot output folder before the build ("make distclean")')
+    parser.add_argument('--no-cache', action='store_true', \
+        help='do not use the build cache of the bootloader and the FPGA configuration files')
+    parser.add_argument('--no-ccache', action='store_true', \
+        help='do not use the compiler cache (ccache) for the u-boot build')
+    parser.add_argument('--ccache-dir', default='', \
+        help='directory of the compiler cache (default: ~/.cache/socfpgaplatformgenerator/ccache)')
+    parser.add_argument('--ccache-size', default='5G', \
+        help='size limit of the compiler cache (default: 5G)')
+    parser.add_argument('--build-report', default='build_report.json', \
+        help='output file of the build report (default: build_report.json)')
+    parser.add_argument('--uboot-commit', default=None, \
+        help='exact commit of "u-boot-socfpga" to build (default: GIT_U_BOOT_SOCFPGA_COMMIT or the latest commit)')
+    parser.add_argument('--linaro', action='store_true', \
+        help='always build u-boot with the linaro toolchain (do not use an installed ARM cross compiler)')
+    parser.add_argument('--batch', action='store_true', \
+        help='run without user inputs and execute independent stages in parallel')
+    parser.add_argument('--zip', action='store_true', \
+        help='compress the output image as ".zip" (only with "--batch")')
+    parser.add_argument('--workers', type=int, default=0, \
+        help='maximum number of stages running in parallel (default: 4 with "--batch", otherwise 1)')
+    args = parser.parse_args()
+
     print('\n##############################################################################')
     print('#                                                                            #')
     print('#    ########   ######     ##    ##  #######   ######  ########  #######     #')        
@@ -2166,88 +4388,169 @@ if __name__ == '__main__':
     if sys.version_info[0] < 3:
         print('ERROR: This script can not work with your Python Version!')
         print("Use Python 3.x for this script!")
-        sys.exit()
+        sys.exit(1)
 
     # Check that the Version runs on Linux
     if not sys.platform =='linux':
         print('ERROR: This script works only on Linux!')
         print("Please run this script on a Linux Computer!")
-        sys.exit()
+        sys.exit(1)
         
     if os.geteuid() == 0:
         print('ERROR: This script can not run with root privileges!')
+        sys.exit(1)
+
+    if args.command == 'import-time':
+        import_time = measureImportTime()
+        print('--> Import time: '+str(round(import_time,1))+' ms (budget: '+str(IMPORT_TIME_BUDGET_MS)+' ms)')
+        if import_time < 0 or import_time > IMPORT_TIME_BUDGET_MS:
+            print('ERROR: The import time exceeds the budget!')
+            sys.exit(1)
+        sys.exit()
+
+    if args.command == 'check-sfp':
+        images_valid = True
+        for file_dir in args.files:
+            copy_list = decodeBootRomImage(file_dir)
+            print('--> "'+file_dir+'"')
+            for copy_no, copy in enumerate(copy_list):
+                print('    Copy '+str(copy_no+1)+': header v'+str(copy['version'])+', program length '+ \
+                    str(copy['program_length'])+' Byte: '+('valid' if copy['valid'] else 'ERROR: '+copy['error']))
+            if copy_list == [] or not all(copy['valid'] for copy in copy_list):
+                images_valid = False
+        sys.exit(0 if images_valid else 1)
+
+    if not loadGit():
+        sys.exit(1)
+
+    if args.command == 'update':
+        if not updateLinuxBootImageGenerator(True):
+            sys.exit(1)
+        print('    == Done')
         sys.exit()
 
     ###################################### Run the SoC-FPGA Platform Generator  ###########################################
 
     # Read the execution environment 
     socfpgaGenerator = SocfpgaPlatformGenerator()
+    if args.uboot_commit is not None:
+        socfpgaGenerator.Uboot_commit = args.uboot_commit
+    socfpgaGenerator.Use_host_toolchain = not args.linaro
+    socfpgaGenerator.Use_fpga_conf_cache = not args.no_cache
+
+    # Without user inputs the default selections are used 
+    generation_mode = 1 if args.batch else 0
+    copy_mode = 1 if args.batch else 0
+    compress_output = args.zip
+    workers = args.workers
+    if workers < 1: 
+        workers = 4 if args.batch else 1
 
-    # Create the partition table 
-    if not socfpgaGenerator.GeneratePartitionTable():
-        sys.exit()
+    #
+    # @brief Stage: Create the required bootloader
+    #
+    def bootloaderStage():
+        bootloader_ok = socfpgaGenerator.BuildBootloader(generation_mode,not args.no_cache, \
+            args.incremental,BuildParallelism(args.jobs,args.load_average,args.mem_per_job), \
+            CcachePolicy(not args.no_ccache,args.ccache_dir,args.ccache_size),args.clean)
+        socfpgaGenerator.WriteBuildReport(args.build_report)
+        return bootloader_ok
 
-    # Create the required bootloader
-    if not socfpgaGenerator.BuildBootloader():
-        sys.exit()
+    #
+    # @brief Stage: Show the partition folders and select the compression of the output image
+    #
+    def reviewStage():
+        global compress_output
+        headline = [' Copy files to the "my_folders" the content',\
+            'These files will then be copied to the depending rootfs location','==========', \
+            'Copy files to the partition folders to allow the pre-installment',\
+            'to the depending image partition','Folders for every partition:']
+        headline_table=['(ID) Folder Name','Filesystem | Size ']
+        content1=[]
+        content2=[]
+        for part in socfpgaGenerator.PartitionList:
+            content1.append('('+str(part.id)+') '+IMAGE_FOLDER_NAME+'/'+part.giveWorkingFolderName(False))
+            content2.append(part.type+' | '+str(part.size_str))
+
+        printSelectionTable(headline,headline_table,content1,content2,False,10)
+
+        headline = [' Compress the output image file as ".zip"',\
+                'A zip files reduces the image file size by removing the offsets.',\
+                'Commen boot disk generation tools can directly work with these files.']
+        headline_table=['Task']
+        content1=['Compress the output image as ".zip"','Use only a regular ".img" file']
+
+        comprsSel= printSelectionTable(headline,headline_table,content1,[],True,32)
+        compress_output = False
+        if comprsSel==1:compress_output = True
+        
+        print('##############################################################################')
+        return True
+
+    #
+    # @brief Stage: Generate with the files inside the partition folder an Image file
+    #
+    def imageStage():
+        if not args.batch:
+            print('\n#############################################################################')
+            print('#                                                                            #')
+            print('#                    The rootfs is unpackaged                                #')
+            print('#                                                                            #')
+            print('#        At this point it is enabled to change the rootfs manually           #')
+            print('#                                                                            #')
+            print('#        Q: Quit the script                                                  #')
+            print('#        Any other input: Continue with generation of the image              #')
+            print('#                                                                            #')
+            print('##############################################################################')
+            _wait_ = input('#              Please type ...                                               #\n')
+            if _wait_ == 'q' or _wait_ == 'Q':
+                sys.exit()
+
+        # Use a date code as an output file
+        return socfpgaGenerator.GenerateImageFile('','',compress_output,not args.batch)
 
+    # Describe the generation flow as stages with their inputs and outputs 
+    scheduler = StageScheduler(workers)
+    # Create the partition table 
+    scheduler.AddStage('partition table',socfpgaGenerator.GeneratePartitionTable,[],['partition folders'])
+    # In batch mode clone or pull "u-boot-socfpga" independent of the other stages; it is required  
+    #  for the build and for the lookup inside the build cache. The toolchain is installed in parallel 
+    #  unless the build cache has the bootloader of the checked out revision 
+    bootloader_inputs = ['partition folders']
+    if args.batch:
+        scheduler.AddStage('u-boot-socfpga source',socfpgaGenerator.PrepareUbootSource,[],['u-boot source'])
+        bootloader_inputs += ['u-boot source']
+        cache_fingerprint = socfpgaGenerator.CalcBootloaderFingerprint()
+        if args.no_cache or cache_fingerprint == '' or \
+            not os.path.isdir(giveCacheDir(BOOTLOADER_CACHE_FOLDER)+'/'+cache_fingerprint):
+            scheduler.AddStage('toolchain',socfpgaGenerator.InstallToolchain,[],['toolchain'])
+            bootloader_inputs += ['toolchain']
+    scheduler.AddStage('bootloader',bootloaderStage,bootloader_inputs,['bootloader'])
     # Copy the Linux Distribution files (rootfs,zImage,device Tree) to the partition
-    if not socfpgaGenerator.CopyLinuxFiles2Partition():
-        sys.exit()
-    
-    # Generate the depending FPGA configuration file 
-    #    specified inside the u-boot script
+    scheduler.AddStage('linux files',lambda: socfpgaGenerator.CopyLinuxFiles2Partition(copy_mode), \
+        ['partition folders'],['linux files'])
+    # Generate the depending FPGA configuration file specified inside the u-boot script
     if socfpgaGenerator.unlicensed_ip_found==False:
-        if not socfpgaGenerator.GenerateFPGAconf():
-            sys.exit()
-
-    headline = [' Copy files to the "my_folders" the content',\
-        'These files will then be copied to the depending rootfs location','==========', \
-        'Copy files to the partition folders to allow the pre-installment',\
-        'to the depending image partition','Folders for every partition:']
-    headline_table=['(ID) Folder Name','Filesystem | Size ']
-    content1=[]
-    content2=[]
-    for part in socfpgaGenerator.PartitionList:
-        content1.append('('+str(part.id)+') '+IMAGE_FOLDER_NAME+'/'+part.giveWorkingFolderName(False))
-        content2.append(part.type+' | '+str(part.size_str))
-
-    printSelectionTable(headline,headline_table,content1,content2,False,10)
-
-    headline = [' Compress the output image file as ".zip"',\
-            'A zip files reduces the image file size by removing the offsets.',\
-            'Commen boot disk generation tools can directly work with these files.']
-    headline_table=['Task']
-    content1=['Compress the output image as ".zip"','Use only a regular ".img" file']
-
-    comprsSel= printSelectionTable(headline,headline_table,content1,[],True,32)
-    compress_output = False
-    if comprsSel==1:compress_output = True
-    
-    print('##############################################################################')
-
+        scheduler.AddStage('fpga configuration',socfpgaGenerator.GenerateFPGAconf,['linux files'], \
+            ['fpga configuration'])
+    else:
+        scheduler.AddStage('fpga configuration',lambda: True,[],['fpga configuration'])
     # Unzip all available archive files such as the rootfs 
-    if not socfpgaGenerator.ScanUnpackagePartitions():
-        sys.exit()
-
-    print('\n#############################################################################')
-    print('#                                                                            #')
-    print('#                    The rootfs is unpackaged                                #')
-    print('#                                                                            #')
-    print('#        At this point it is enabled to change the rootfs manually           #')
-    print('#                                                                            #')
-    print('#        Q: Quit the script                                                  #')
-    print('#        Any other input: Continue with generation of the image              #')
-    print('#                                                                            #')
-    print('##############################################################################')
-    _wait_ = input('#              Please type ...                                               #\n')
-    if _wait_ == 'q' or _wait_ == 'Q':
-        sys.exit()
-
-    # Generate with the files inside the partition folder an Image file
-    # Use a date code as an output file
-    if not socfpgaGenerator.GenerateImageFile('','',compress_output,True):
-        sys.exit()
+    if args.batch:
+        scheduler.AddStage('unpack partitions',socfpgaGenerator.ScanUnpackagePartitions, \
+            ['linux files'],['unpacked partitions'])
+    else:
+        scheduler.AddStage('review',reviewStage,['bootloader','linux files','fpga configuration'],['review'])
+        scheduler.AddStage('unpack partitions',socfpgaGenerator.ScanUnpackagePartitions, \
+            ['review'],['unpacked partitions'])
+    scheduler.AddStage('image file',imageStage,['bootloader','fpga configuration','unpacked partitions'], \
+        ['image file'])
+
+    stages_ok = scheduler.Run()
+    socfpgaGenerator.BuildReport['stages'] = scheduler.Stage_report
+    if not stages_ok:
+        socfpgaGenerator.WriteBuildReport(args.build_report)
+        sys.exit(1)
     
 ############################################################ Goodby screen  ###################################################
     headline = [' GENERATION WAS SUCCESSFUL','------------------------------------------------',\
@@ -2270,4 +4573,5 @@ if __name__ == '__main__':
     content1.append('             Directory: "'+ext+'"')
 
     printSelectionTable(headline,headline_table,content1,[],False,32)
+    socfpgaGenerator.WriteBuildReport(args.build_report)
 # EOF
\ No newline at end of file
@@ -0,0 +1,68 @@
+#
+# @brief Compare the in-process compiled u-boot script with the output of "mkimage"
+#        (python3 -m unittest discover tests)
+#
+import os
+import sys
+import shutil
+import struct
+import subprocess
+import tempfile
+import unittest
+import zlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import socfpgaPlatformGenerator as generator
+
+SCRIPT = b'echo --- Boot script ---\nfatload mmc 0:1 $loadaddr socfpga.rbf\nfpga load 0 $loadaddr $filesize\n' \
+         b'bridge enable\nload mmc 0:1 $kernel_addr_r zImage\nbootz $kernel_addr_r - $fdt_addr\n'
+TIMESTAMP = 1700000000
+
+
+class UbootScriptImageTest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        with open(self.temp_dir+'/'+generator.UBOOT_SCRIPT_FILE_NAME, 'wb') as f:
+            f.write(SCRIPT)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @unittest.skipIf(shutil.which('mkimage') is None, '"mkimage" (u-boot tools) is not installed')
+    def test_same_output_as_mkimage(self):
+        env = dict(os.environ)
+        env['SOURCE_DATE_EPOCH'] = str(TIMESTAMP)
+        subprocess.run(['mkimage', '-A', 'arm', '-O', 'linux', '-T', 'script', '-C', 'none', '-a', '0', '-e', '0', \
+            '-n', generator.UBOOT_SCRIPT_IMAGE_NAME, '-d', generator.UBOOT_SCRIPT_FILE_NAME, 'reference.scr'], \
+            cwd=self.temp_dir, env=env, stdout=subprocess.DEVNULL, check=True)
+        with open(self.temp_dir+'/reference.scr', 'rb') as f:
+            reference = f.read()
+        self.assertEqual(generator.makeUbootScriptImage(SCRIPT, 'arm', TIMESTAMP), reference)
+
+    def test_header(self):
+        image = generator.makeUbootScriptImage(SCRIPT, 'arm', TIMESTAMP)
+        magic, header_crc, timestamp, size, load, entry, data_crc, os_id, arch, image_type, comp, name = \
+            struct.unpack_from('>7I4B32s', image)
+        self.assertEqual(magic, 0x27051956)
+        self.assertEqual(header_crc, zlib.crc32(image[:4]+bytes(4)+image[8:64]))
+        self.assertEqual([timestamp, size, load, entry], [TIMESTAMP, len(SCRIPT)+8, 0, 0])
+        self.assertEqual(data_crc, zlib.crc32(image[64:]))
+        # -O linux -A arm -T script -C none -n u-boot
+        self.assertEqual([os_id, arch, image_type, comp], [5, 2, 6, 0])
+        self.assertEqual(name, b'u-boot'+bytes(26))
+        # Multi-file layout of "-T script": size list terminated with 0, then the unpadded script
+        self.assertEqual(image[64:72], struct.pack('>II', len(SCRIPT), 0))
+        self.assertEqual(image[72:], SCRIPT)
+
+    def test_compile_keeps_an_unchanged_output(self):
+        script_file_dir = self.temp_dir+'/'+generator.UBOOT_SCRIPT_FILE_NAME
+        output_file_dir = self.temp_dir+'/'+generator.UBOOT_SCRIPT_OUTPUT_NAME
+        self.assertTrue(generator.compileUbootScript(script_file_dir, output_file_dir))
+        mtime = os.stat(output_file_dir).st_mtime_ns
+        self.assertTrue(generator.compileUbootScript(script_file_dir, output_file_dir))
+        self.assertEqual(os.stat(output_file_dir).st_mtime_ns, mtime)
+
+
+if __name__ == '__main__':
+    unittest.main()